@@ -7,30 +7,67 @@ is not a full integration implementation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
 
 from flowerhub_portal_api_client import AsyncFlowerhubClient
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
+from .capabilities import async_probe_client
+from .const import (
+    CONF_DAILY_UPTIME,
+    CONF_PUSH_UPDATES,
+    CONF_RATE_LIMIT,
+    DOMAIN,
+    FIRST_REFRESH_TIMEOUT,
+    PLATFORMS,
+)
 from .coordinator import FlowerhubDataUpdateCoordinator
+from .fleet import async_get_fleet_aggregator
+from .rate_limiter import async_apply_entry_rates, async_get_rate_limiter
+from .services import async_setup_services
+from .startup import StartupManager, async_get_startup_manager
+from .uptime_store import async_get_uptime_store
 
 LOGGER = logging.getLogger(__name__)
 
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up integration-wide services."""
+    async_setup_services(hass)
+    return True
+
+
 async def _options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    session = async_get_clientsession(hass)
-    client = AsyncFlowerhubClient(session=session)
+def _loaded_entries(hass: HomeAssistant) -> list[ConfigEntry]:
+    """Return the entries that are currently set up."""
+    return [
+        entry
+        for entry_id in hass.data.get(DOMAIN, {})
+        if (entry := hass.config_entries.async_get_entry(entry_id)) is not None
+    ]
+
+
+async def _async_login(
+    hass: HomeAssistant, client: AsyncFlowerhubClient, entry: ConfigEntry
+) -> None:
+    """Log in with the entry's credentials, raising ConfigEntryAuthFailed."""
     try:
+        await async_get_rate_limiter(hass).acquire()
         login_resp = await client.async_login(
             entry.data["username"], entry.data["password"]
         )
@@ -50,6 +87,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if status_int and status_int >= 400:
             raise ConfigEntryAuthFailed(f"Flowerhub login failed (status {status_int})")
 
+
+async def _async_prime(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: AsyncFlowerhubClient,
+    coordinator: FlowerhubDataUpdateCoordinator,
+    manager: StartupManager,
+    timeout: float | None = None,
+) -> None:
+    """Log in and run the first refresh once a priming slot is free.
+
+    ``timeout`` limits the login and first refresh, not the wait for a slot.
+    """
+    async with manager.slot(), asyncio.timeout(timeout):
+        try:
+            await _async_login(hass, client, entry)
+        except ConfigEntryAuthFailed:
+            manager.mark_failed(entry.entry_id, "auth")
+            raise
+        await coordinator.async_refresh()
+
+    if coordinator.last_update_success and not coordinator.data.stale:
+        manager.mark_fresh(entry.entry_id)
+    else:
+        manager.mark_failed(entry.entry_id, "refresh")
+
+
+async def _async_prime_staged(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    client: AsyncFlowerhubClient,
+    coordinator: FlowerhubDataUpdateCoordinator,
+    manager: StartupManager,
+) -> None:
+    """Prime an entry that was set up from cached data."""
+    try:
+        await _async_prime(hass, entry, client, coordinator, manager)
+    except ConfigEntryAuthFailed as err:
+        LOGGER.warning("%s; starting re-authentication", err)
+        entry.async_start_reauth(hass)
+        return
+    # A failed first refresh keeps the cached state; polling retries with backoff
+    if coordinator.push_updates:
+        coordinator.async_start_push_updates()
+
+
+async def _async_abort_setup(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: FlowerhubDataUpdateCoordinator
+) -> None:
+    """Release the coordinator of a failed setup; a retry builds a new one."""
+    async_get_fleet_aggregator(hass).remove(entry.entry_id)
+    await coordinator.async_shutdown()
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    if CONF_RATE_LIMIT in entry.options:
+        async_apply_entry_rates(hass, [*_loaded_entries(hass), entry])
+
+    session = async_get_clientsession(hass)
+    client = AsyncFlowerhubClient(session=session)
+
+    capabilities = await async_probe_client(hass, client)
+    uptime_store = await async_get_uptime_store(hass)
+    manager = await async_get_startup_manager(hass)
+
     # Use the dedicated coordinator wrapper to keep logic centralized
     scan_interval = entry.options.get("scan_interval", 60)
     coordinator = FlowerhubDataUpdateCoordinator(
@@ -59,16 +161,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry_id=entry.entry_id,
         username=entry.data.get("username"),
         password=entry.data.get("password"),
+        push_updates=entry.options.get(CONF_PUSH_UPDATES, False),
+        capabilities=capabilities,
+        uptime_store=uptime_store,
+        startup=manager,
+        daily_uptime=entry.options.get(CONF_DAILY_UPTIME, False),
     )
 
-    await coordinator.async_refresh()
+    # Entries with a cached state register their entities right away and talk
+    # to the portal in the background, once Home Assistant has started. Without
+    # one, setup waits for the first refresh and lets Home Assistant retry it.
+    cached = manager.cached_snapshot(entry.entry_id, coordinator.uptime_data)
+    manager.begin(entry.entry_id, staged=cached is not None)
+
+    if cached is not None:
+        coordinator.async_set_cached_data(cached)
+    else:
+        try:
+            await _async_prime(
+                hass, entry, client, coordinator, manager, FIRST_REFRESH_TIMEOUT
+            )
+        except TimeoutError as err:
+            manager.mark_failed(entry.entry_id, "timeout")
+            await _async_abort_setup(hass, entry, coordinator)
+            raise ConfigEntryNotReady(
+                "Timed out waiting for the Flowerhub portal"
+            ) from err
+        except ConfigEntryAuthFailed:
+            await _async_abort_setup(hass, entry, coordinator)
+            raise
+        if not coordinator.last_update_success:
+            await _async_abort_setup(hass, entry, coordinator)
+            raise ConfigEntryNotReady(
+                f"Flowerhub first refresh failed: {coordinator.last_exception}"
+            ) from coordinator.last_exception
+        if coordinator.push_updates:
+            coordinator.async_start_push_updates()
 
     # Store data for platforms
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    entry_data = hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
         "coordinator": coordinator,
     }
 
+    coordinator.async_schedule_month_rollover()
+
     # Register listener for options updates
     entry.async_on_unload(entry.add_update_listener(_options_update_listener))
 
@@ -79,30 +216,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # In tests, platforms aren't loaded.
         # create test specific behavior here if needed
         pass
+    if coordinator.data is not None:
+        manager.mark_state(entry.entry_id)
+
+    if cached is not None:
+
+        @callback
+        def _start_priming(hass: HomeAssistant) -> None:
+            entry_data["priming"] = entry.async_create_background_task(
+                hass,
+                _async_prime_staged(hass, entry, client, coordinator, manager),
+                f"{DOMAIN} priming {entry.entry_id}",
+            )
+
+        entry.async_on_unload(async_at_started(hass, _start_priming))
 
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached state and uptime counters of a removed entry."""
+    manager = await async_get_startup_manager(hass)
+    manager.forget(entry.entry_id)
+    uptime_store = await async_get_uptime_store(hass)
+    uptime_store.forget(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms first
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if not unload_ok:
         return False
+    # The entry's fleet sensors are gone with its platform; another entry
+    # with the option takes them over
+    async_get_fleet_aggregator(hass).async_release_sensor_host(entry.entry_id)
 
     data = hass.data.get(DOMAIN, {})
     entry_data = data.pop(entry.entry_id, None)
 
     if entry_data:
         coordinator = entry_data["coordinator"]
-        client = entry_data["client"]
-        client.stop_periodic_asset_fetch()
-        if hasattr(coordinator, "_unsub_shutdown") and coordinator._unsub_shutdown:
-            coordinator._unsub_shutdown()
-        remove_listener = entry_data.get("remove_listener")
-        if remove_listener:
-            try:
-                remove_listener()
-            except Exception:
-                LOGGER.exception("Error removing coordinator listener")
+        async_get_fleet_aggregator(hass).remove(entry.entry_id)
+        recorder = entry_data.get("recorder")
+        if recorder is not None and recorder.recording:
+            await recorder.async_stop()
+        priming = entry_data.get("priming")
+        if priming is not None and not priming.done():
+            priming.cancel()
+        # Stops the refresh timer, the client's fetch loop, pushed updates and
+        # auth callback re-authentications still in flight
+        await coordinator.async_shutdown()
+    if CONF_RATE_LIMIT in entry.options:
+        async_apply_entry_rates(hass, _loaded_entries(hass))
 
     return True
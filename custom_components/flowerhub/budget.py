@@ -0,0 +1,97 @@
+"""Per-cycle time budget for coordinator updates."""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import Any
+
+# Share of the update interval one cycle may use, and the floor for short intervals
+CYCLE_BUDGET_FRACTION = 0.8
+MIN_CYCLE_BUDGET = 10.0
+
+
+class CycleBudget:
+    """Deadline for one update cycle, and overrun metrics across cycles.
+
+    A cycle may use a fixed share of the update interval so it finishes
+    before the next tick is due. Required work runs against the remaining
+    time; optional work such as the uptime fetch is skipped when too little
+    is left. Time spent waiting for the local rate limiter is excluded, so a
+    busy limiter does not look like a slow portal. Cycles that still take
+    longer than the budget are counted as overruns, and ticks that fell inside
+    a cycle as missed.
+    """
+
+    __slots__ = (
+        "interval",
+        "total",
+        "_started",
+        "cycles",
+        "overruns",
+        "missed_ticks",
+        "skipped_optional",
+        "last_duration",
+        "max_duration",
+    )
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.total = max(interval * CYCLE_BUDGET_FRACTION, MIN_CYCLE_BUDGET)
+        self._started: float | None = None
+        self.cycles = 0
+        self.overruns = 0
+        self.missed_ticks = 0
+        self.skipped_optional = 0
+        self.last_duration: float | None = None
+        self.max_duration = 0.0
+
+    def start(self) -> None:
+        """Start a cycle."""
+        self._started = monotonic()
+
+    @property
+    def remaining(self) -> float:
+        """Return the seconds left in the current cycle (full budget if idle)."""
+        if self._started is None:
+            return self.total
+        return max(self.total - (monotonic() - self._started), 0.0)
+
+    def exclude(self, seconds: float) -> None:
+        """Extend the current cycle's deadline by time not spent on the portal."""
+        if self._started is not None:
+            self._started += seconds
+
+    def allows(self, seconds: float) -> bool:
+        """Return True if optional work of about ``seconds`` still fits."""
+        if self.remaining >= seconds:
+            return True
+        self.skipped_optional += 1
+        return False
+
+    def finish(self) -> None:
+        """End the cycle and record its duration."""
+        if self._started is None:
+            return
+        duration = monotonic() - self._started
+        self._started = None
+        self.cycles += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        if duration > self.total:
+            self.overruns += 1
+        if self.interval > 0:
+            self.missed_ticks += int(duration // self.interval)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return budget metrics for diagnostics."""
+        return {
+            "budget": self.total,
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "missed_ticks": self.missed_ticks,
+            "skipped_optional": self.skipped_optional,
+            "last_duration": round(self.last_duration, 3)
+            if self.last_duration is not None
+            else None,
+            "max_duration": round(self.max_duration, 3),
+        }
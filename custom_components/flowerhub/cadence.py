@@ -0,0 +1,137 @@
+"""Learning of the portal's update cadence from observed data changes."""
+
+from __future__ import annotations
+
+from collections import deque
+from statistics import median
+from typing import Any
+
+# Changes needed before a period is trusted, and how many are kept
+CADENCE_MIN_CHANGES = 4
+CADENCE_SAMPLES = 8
+# Longest period followed; slower portals are polled at the fixed interval
+CADENCE_MAX_PERIOD = 3600.0
+# Seconds to which polls narrow down the expected update time
+CADENCE_RESOLUTION = 10.0
+# Periods without the expected change before the estimate is dropped
+CADENCE_MAX_MISSES = 3
+
+
+class PortalCadence:
+    """Estimates when the portal publishes new asset data.
+
+    The client library stamps ``updated_at`` itself when it parses a
+    response, so the portal's own update times are inferred from the polls
+    at which the asset payload changed: each change happened after the
+    previous poll and at or before the poll that saw it. Once enough changes
+    arrive at a consistent interval that is clearly longer than the gap
+    between polls, that interval is taken as the portal's period.
+
+    With a period, the next update is expected within a window one period
+    after the last one. Polls probe the middle of the window until it is
+    CADENCE_RESOLUTION wide, then its start and end, so the last poll of each
+    period lands just after the update. Changes in the first half of a period
+    are ignored as unrelated to the cadence. When the window passes without a
+    change, polling falls back to the fixed interval, and after
+    CADENCE_MAX_MISSES periods without the expected change the estimate is
+    dropped.
+    """
+
+    __slots__ = ("_content", "_last_poll", "_bounds", "period", "_lo", "_hi", "misses")
+
+    def __init__(self) -> None:
+        self._content: Any = None
+        self._last_poll: float | None = None
+        # (latest poll before, poll at) each observed update
+        self._bounds: deque[tuple[float, float]] = deque(maxlen=CADENCE_SAMPLES)
+        self.period: float | None = None
+        # The next update is expected after _lo and at or before _hi
+        self._lo = 0.0
+        self._hi = 0.0
+        self.misses = 0
+
+    def observe(self, now: float, content: Any) -> bool:
+        """Record a successful poll at ``now``; return True if content changed."""
+        previous, self._last_poll = self._last_poll, now
+        changed = content != self._content
+        self._content = content
+        if previous is None:
+            return changed
+        if self.period is None:
+            if changed:
+                self._bounds.append((previous, now))
+                self._learn()
+        elif changed:
+            if now >= self._lo - self.period / 2:
+                # An update before the window still happened after the last poll
+                lower = previous if now <= self._lo else max(previous, self._lo)
+                self._bounds.append((lower, now))
+                self._learn()
+                self._lo, self._hi = lower + self.period, now + self.period
+                self.misses = 0
+        elif now < self._hi:
+            self._lo = max(self._lo, now)
+        else:
+            # Overdue: the update is still ahead of this poll
+            self.misses = int((now - self._hi) // self.period) + 1
+            self._lo = now
+            if self.misses >= CADENCE_MAX_MISSES:
+                self.reset()
+        return changed
+
+    def _learn(self) -> None:
+        """Adopt or refine the period when the observed updates are regular."""
+        if len(self._bounds) < CADENCE_MIN_CHANGES:
+            return
+        bounds = list(self._bounds)
+        intervals = [b[1] - a[1] for a, b in zip(bounds, bounds[1:])]
+        period = median(intervals)
+        # Each observed interval is off by at most the widest poll gap
+        width = max(upper - lower for lower, upper in bounds)
+        if (
+            period < 2 * width
+            or period > CADENCE_MAX_PERIOD
+            or any(abs(i - period) > width for i in intervals)
+        ):
+            return
+        if self.period is None:
+            # Intersect the windows of all updates, projected onto the next one
+            latest = bounds[-1][1]
+            lo = max(
+                lower + period * round((latest - lower) / period) for lower, _ in bounds
+            )
+            hi = min(
+                upper + period * round((latest - upper) / period) for _, upper in bounds
+            )
+            self._lo, self._hi = lo + period, max(hi, lo + CADENCE_RESOLUTION) + period
+            self.misses = 0
+        self.period = period
+
+    def next_delay(self, now: float) -> float | None:
+        """Return seconds until the next poll, or None for the fixed interval.
+
+        None is also returned while an expected update is overdue, so polling
+        continues at the fixed interval until the change shows up.
+        """
+        if self.period is None or now >= self._hi:
+            return None
+        if self._hi - self._lo > CADENCE_RESOLUTION:
+            due = (max(self._lo, now) + self._hi) / 2
+        else:
+            due = self._lo if now < self._lo else self._hi
+        return due - now
+
+    def reset(self) -> None:
+        """Forget the estimate and learn again from the next changes."""
+        self._bounds.clear()
+        self.period = None
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimate for diagnostics."""
+        return {
+            "period": round(self.period, 1) if self.period is not None else None,
+            "window": round(self._hi - self._lo, 1) if self.period else None,
+            "changes_observed": len(self._bounds),
+            "misses": self.misses,
+        }
@@ -0,0 +1,94 @@
+"""One-time capability probe of the installed Flowerhub client library."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, replace
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+CLIENT_DISTRIBUTION = "flowerhub-portal-api-client"
+
+# Client properties exposing hardware details directly (absent in some versions)
+_HARDWARE_PROPERTIES = (
+    "inverter_name",
+    "inverter_manufacturer",
+    "battery_name",
+    "battery_manufacturer",
+)
+# Ways clients accept an auth error callback, in order of preference
+_AUTH_CALLBACK_HOOKS = ("set_auth_error_callback", "on_auth_error", "on_auth_failed")
+
+
+@dataclass(frozen=True, slots=True)
+class ClientCapabilities:
+    """What the installed client supports, probed once at setup."""
+
+    version: str | None
+    asset_info: bool
+    asset_id: bool
+    asset_owner_id: bool
+    hardware_properties: bool
+    # Name of the attribute used to register an auth error callback, if any
+    auth_callback: str | None
+    periodic_fetch: bool
+    uptime_pie: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile for diagnostics."""
+        return asdict(self)
+
+
+_PROBE_CACHE: dict[type, ClientCapabilities] = {}
+
+
+def probe_client(client: Any) -> ClientCapabilities:
+    """Probe a client's attributes; the result is cached per client type."""
+    cached = _PROBE_CACHE.get(type(client))
+    if cached is not None:
+        return cached
+
+    auth_callback = None
+    for hook in _AUTH_CALLBACK_HOOKS:
+        if hook == "set_auth_error_callback":
+            if callable(getattr(client, hook, None)):
+                auth_callback = hook
+                break
+        elif hasattr(client, hook):
+            auth_callback = hook
+            break
+
+    capabilities = ClientCapabilities(
+        version=None,
+        asset_info=hasattr(client, "asset_info"),
+        asset_id=hasattr(client, "asset_id"),
+        asset_owner_id=hasattr(client, "asset_owner_id"),
+        hardware_properties=all(hasattr(client, a) for a in _HARDWARE_PROPERTIES),
+        auth_callback=auth_callback,
+        periodic_fetch=callable(getattr(client, "start_periodic_asset_fetch", None)),
+        uptime_pie=callable(getattr(client, "async_fetch_uptime_pie", None)),
+    )
+    _PROBE_CACHE[type(client)] = capabilities
+    return capabilities
+
+
+def _library_version() -> str | None:
+    try:
+        return version(CLIENT_DISTRIBUTION)
+    except PackageNotFoundError:
+        return None
+
+
+async def async_probe_client(hass: HomeAssistant, client: Any) -> ClientCapabilities:
+    """Probe a client and record the installed library version.
+
+    Reading package metadata touches the disk, so it runs in the executor.
+    """
+    capabilities = probe_client(client)
+    if capabilities.version is None:
+        lib_version = await hass.async_add_executor_job(_library_version)
+        if lib_version is not None:
+            capabilities = replace(capabilities, version=lib_version)
+            _PROBE_CACHE[type(client)] = capabilities
+    return capabilities
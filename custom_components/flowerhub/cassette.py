@@ -0,0 +1,169 @@
+"""Recording of client responses into replayable cassettes."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .debug_log import REDACTED, is_sensitive_key
+
+LOGGER = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+CASSETTE_DIR = "flowerhub_cassettes"
+# Calls kept per recording; later calls are counted but not stored
+CASSETTE_MAX_EVENTS = 10000
+# Client calls whose results the coordinator consumes
+RECORDED_METHODS = (
+    "async_readout_sequence",
+    "async_fetch_asset",
+    "async_fetch_uptime_pie",
+)
+# Client attributes the coordinator reads after a call
+RECORDED_STATE = ("asset_id", "asset_owner_id", "asset_info", "flowerhub_status")
+# Raw response bodies are not needed for replay
+_BODY_KEYS = frozenset({"json", "text"})
+
+
+def encode(value: Any) -> Any:
+    """Return a redacted, JSON-serializable form of a client value.
+
+    Datetimes and client objects are tagged so a replay can restore them.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, Mapping):
+        return {
+            str(key): REDACTED
+            if is_sensitive_key(str(key))
+            else None
+            if key in _BODY_KEYS
+            else encode(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if hasattr(value, "__dict__"):
+        return {"$obj": encode(vars(value))}
+    return str(value)
+
+
+class CassetteRecorder:
+    """Records what a client returns to the coordinator.
+
+    While recording, the client's fetch methods are wrapped on the instance.
+    Every call is stored with its offset from the start of the recording,
+    its result or error, and the client state the coordinator reads
+    afterwards. ``async_stop`` restores the client and writes a gzipped JSON
+    lines cassette: a header line followed by one line per call.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: Any, path: Path) -> None:
+        self._hass = hass
+        self._client = client
+        self.path = path
+        self._events: list[dict[str, Any]] = []
+        self.dropped = 0
+        self._started: float | None = None
+        self._depth = 0
+        self._header: dict[str, Any] = {}
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    @property
+    def recording(self) -> bool:
+        """Return True while calls are being recorded."""
+        return self._started is not None
+
+    def start(self, duration: float, **header: Any) -> None:
+        """Record the client's calls for ``duration`` seconds."""
+        self._started = monotonic()
+        self._header = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            **header,
+        }
+        for name in RECORDED_METHODS:
+            if callable(getattr(self._client, name, None)):
+                setattr(self._client, name, self._wrap(name))
+
+        @callback
+        def _stop(_now: datetime) -> None:
+            self._unsub_stop = None
+            self._hass.async_create_task(self.async_stop())
+
+        self._unsub_stop = async_call_later(self._hass, duration, _stop)
+
+    def _wrap(self, name: str) -> Any:
+        method = getattr(self._client, name)
+
+        async def recorded(*args: Any, **kwargs: Any) -> Any:
+            if self._depth or self._started is None:
+                # A readout calls the other fetch methods itself
+                return await method(*args, **kwargs)
+            offset = monotonic() - self._started
+            event: dict[str, Any] = {"t": round(offset, 3), "call": name}
+            if kwargs.get("period"):
+                event["period"] = kwargs["period"]
+            self._depth += 1
+            try:
+                result = await method(*args, **kwargs)
+            except Exception as err:
+                event["error"] = {"type": type(err).__name__, "message": str(err)}
+                self._record(event)
+                raise
+            finally:
+                self._depth -= 1
+            event["result"] = encode(result)
+            self._record(event)
+            return result
+
+        return recorded
+
+    def _record(self, event: dict[str, Any]) -> None:
+        if len(self._events) >= CASSETTE_MAX_EVENTS:
+            self.dropped += 1
+            return
+        event["state"] = {
+            attr: encode(getattr(self._client, attr, None)) for attr in RECORDED_STATE
+        }
+        self._events.append(event)
+
+    async def async_stop(self) -> Path:
+        """Stop recording, restore the client and write the cassette."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        for name in RECORDED_METHODS:
+            # Drop the instance wrappers so the class methods are used again
+            self._client.__dict__.pop(name, None)
+        self._started = None
+        header = {**self._header, "events": len(self._events), "dropped": self.dropped}
+        events, self._events = self._events, []
+        await self._hass.async_add_executor_job(self._write, header, events)
+        LOGGER.info(
+            "Wrote Flowerhub cassette with %s calls to %s", len(events), self.path
+        )
+        return self.path
+
+    def _write(self, header: dict[str, Any], events: list[dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            for line in (header, *events):
+                file.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+def cassette_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return a new cassette path for an entry in the config directory."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    return Path(hass.config.path(CASSETTE_DIR, f"{entry_id}-{stamp}.jsonl.gz"))
@@ -0,0 +1,137 @@
+"""Per-account circuit breaker around Flowerhub portal calls."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_CIRCUIT_BREAKERS
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling the portal after repeated server failures.
+
+    While open, callers should serve cached data. After ``probe_delay`` a single
+    caller is let through as a half-open probe; its outcome closes the breaker
+    or re-opens it with a doubled delay (capped at ``max_probe_delay``).
+
+    The breaker is shared by every entry of an account, so callers identify
+    themselves with ``owner``: only the caller that took the probe can release
+    it or fail it.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 3,
+        probe_delay: float = 60.0,
+        max_probe_delay: float = 1800.0,
+    ) -> None:
+        self.threshold = threshold
+        self.base_probe_delay = probe_delay
+        self.max_probe_delay = max_probe_delay
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.opened_count = 0
+        self._probe_delay = probe_delay
+        self._next_probe: float | None = None
+        self._probe_in_flight = False
+        self._probe_owner: object | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while portal calls are being short-circuited."""
+        return self.state is not BreakerState.CLOSED
+
+    def allow_request(self, owner: object | None = None) -> bool:
+        """Return True if ``owner`` may call the portal now."""
+        if self.state is BreakerState.CLOSED:
+            return True
+        if self._probe_in_flight:
+            return False
+        if self._next_probe is not None and monotonic() < self._next_probe:
+            return False
+        # Let a single half-open probe through
+        self.state = BreakerState.HALF_OPEN
+        self._probe_in_flight = True
+        self._probe_owner = owner
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self._probe_delay = self.base_probe_delay
+        self._next_probe = None
+        self._probe_in_flight = False
+        self._probe_owner = None
+
+    def _owns_probe(self, owner: object | None) -> bool:
+        return self._probe_in_flight and owner is self._probe_owner
+
+    def record_failure(self, owner: object | None = None) -> None:
+        """Count a server failure, opening the breaker at the threshold.
+
+        While half-open, only the failure of the probe's owner re-opens it.
+        """
+        self.failures += 1
+        if self.state is BreakerState.HALF_OPEN:
+            if not self._owns_probe(owner):
+                # A call started before the probe; the probe decides
+                return
+            # Failed probe: wait longer before the next one
+            self._probe_delay = min(self._probe_delay * 2, self.max_probe_delay)
+            self._open()
+        elif self.state is BreakerState.CLOSED and self.failures >= self.threshold:
+            self.opened_count += 1
+            self._open()
+
+    def release_probe(self, owner: object | None = None) -> None:
+        """Release ``owner``'s probe if it ended without a server verdict."""
+        if self._owns_probe(owner):
+            self._probe_in_flight = False
+            self._probe_owner = None
+            self.state = BreakerState.OPEN
+
+    def _open(self) -> None:
+        self.state = BreakerState.OPEN
+        self._probe_in_flight = False
+        self._probe_owner = None
+        self._next_probe = monotonic() + self._probe_delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return breaker state for diagnostics."""
+        next_probe_in = (
+            max(0.0, self._next_probe - monotonic())
+            if self._next_probe is not None
+            else None
+        )
+        return {
+            "state": str(self.state),
+            "failures": self.failures,
+            "opened_count": self.opened_count,
+            "probe_delay": self._probe_delay,
+            "next_probe_in": next_probe_in,
+        }
+
+
+def async_get_circuit_breaker(
+    hass: HomeAssistant, account: str, threshold: int = 3
+) -> CircuitBreaker:
+    """Return the circuit breaker shared by all entries of an account."""
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(
+        DATA_CIRCUIT_BREAKERS, {}
+    )
+    if account not in breakers:
+        breakers[account] = CircuitBreaker(threshold=threshold)
+    return breakers[account]
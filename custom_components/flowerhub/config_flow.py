@@ -6,13 +6,27 @@ import asyncio
 import logging
 from typing import Any
 
+import flowerhub_portal_api_client as fh_client
 import voluptuous as vol
 from aiohttp import ClientResponseError
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DEFAULT_NAME, DOMAIN, SCAN_INTERVAL_MAX, SCAN_INTERVAL_MIN
+from .const import (
+    CONF_DAILY_UPTIME,
+    CONF_FLEET_SENSORS,
+    CONF_PUSH_UPDATES,
+    CONF_RATE_LIMIT,
+    DEFAULT_NAME,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    RATE_LIMIT_MAX,
+    RATE_LIMIT_MIN,
+    SCAN_INTERVAL_MAX,
+    SCAN_INTERVAL_MIN,
+)
+from .rate_limiter import READOUT_COST, Priority, async_get_rate_limiter
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -23,18 +37,24 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    from flowerhub_portal_api_client import (
-        AuthenticationError as FHAuthenticationError,  # type: ignore
-    )
-except Exception:  # pragma: no cover - optional auth exception
-    FHAuthenticationError = None  # type: ignore
+FHAuthenticationError = getattr(fh_client, "AuthenticationError", None)
 
 AUTH_EXCEPTIONS: tuple[type[Exception], ...] = tuple(
     t for t in (FHAuthenticationError,) if isinstance(t, type)
 )
 
 
+async def _async_validate_credentials(
+    hass: HomeAssistant, username: str, password: str
+) -> None:
+    """Log in and prime a throwaway client to validate credentials."""
+    await async_get_rate_limiter(hass).acquire(Priority.INTERACTIVE, 1 + READOUT_COST)
+    session = async_get_clientsession(hass)
+    client = fh_client.AsyncFlowerhubClient(session=session)
+    await client.async_login(username, password)
+    await client.async_readout_sequence()
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
@@ -51,15 +71,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
             password = user_input["password"]
             # Validate by instantiating the client and trying to read
             try:
-                from flowerhub_portal_api_client import AsyncFlowerhubClient
-
-                session = async_get_clientsession(self.hass)
-                client = AsyncFlowerhubClient(session=session)
-                await client.async_login(username, password)
-                await client.async_readout_sequence()
-            except ImportError as err:
-                LOGGER.error("Flowerhub client library not found: %s", err)
-                errors["base"] = "missing_library"
+                await _async_validate_credentials(self.hass, username, password)
             except ClientResponseError as err:
                 LOGGER.warning(
                     "HTTP error during validation (status=%s): %s", err.status, err
@@ -115,13 +127,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
             username = user_input["username"]
             password = user_input["password"]
             try:
-                from flowerhub_portal_api_client import AsyncFlowerhubClient
-
-                session = async_get_clientsession(self.hass)
-                client = AsyncFlowerhubClient(session=session)
-                await client.async_login(username, password)
-                # Prime the client to ensure credentials are valid
-                await client.async_readout_sequence()
+                # Login and prime the client to ensure credentials are valid
+                await _async_validate_credentials(self.hass, username, password)
             except AUTH_EXCEPTIONS as err:
                 LOGGER.warning("Authentication failed during reauth: %s", err)
                 errors["base"] = "cannot_connect"
@@ -175,6 +182,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         current_username = self._config_entry.data.get("username", "")
         current_password = self._config_entry.data.get("password", "")
         current_scan_interval = self._config_entry.options.get("scan_interval", 60)
+        current_push_updates = self._config_entry.options.get(CONF_PUSH_UPDATES, False)
+        current_rate_limit = self._config_entry.options.get(
+            CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT
+        )
+        current_fleet_sensors = self._config_entry.options.get(
+            CONF_FLEET_SENSORS, False
+        )
+        current_daily_uptime = self._config_entry.options.get(CONF_DAILY_UPTIME, False)
 
         options_schema = vol.Schema(
             {
@@ -184,13 +199,28 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=SCAN_INTERVAL_MIN, max=SCAN_INTERVAL_MAX),
                 ),
+                vol.Optional(CONF_PUSH_UPDATES, default=current_push_updates): bool,
+                vol.Optional(CONF_RATE_LIMIT, default=current_rate_limit): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=RATE_LIMIT_MIN, max=RATE_LIMIT_MAX),
+                ),
+                vol.Optional(CONF_FLEET_SENSORS, default=current_fleet_sensors): bool,
+                vol.Optional(CONF_DAILY_UPTIME, default=current_daily_uptime): bool,
             }
         )
 
         if user_input is not None:
             username = user_input["username"]
             password = user_input.get("password", "")
-            scan_interval = user_input["scan_interval"]
+            options: dict[str, Any] = {"scan_interval": user_input["scan_interval"]}
+            for key in (
+                CONF_PUSH_UPDATES,
+                CONF_RATE_LIMIT,
+                CONF_FLEET_SENSORS,
+                CONF_DAILY_UPTIME,
+            ):
+                if key in user_input:
+                    options[key] = user_input[key]
 
             # Check if credentials need validation:
             # - Username changed, OR
@@ -201,14 +231,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
             if credentials_changed:
                 try:
-                    from flowerhub_portal_api_client import AsyncFlowerhubClient
-
-                    session = async_get_clientsession(self.hass)
-                    client = AsyncFlowerhubClient(session=session)
                     # Use new password if provided, otherwise keep current password
                     password_to_validate = password if password else current_password
-                    await client.async_login(username, password_to_validate)
-                    await client.async_readout_sequence()
+                    await _async_validate_credentials(
+                        self.hass, username, password_to_validate
+                    )
                 except AUTH_EXCEPTIONS as err:
                     LOGGER.warning("Authentication failed during options save: %s", err)
                     errors["base"] = "cannot_connect"
@@ -237,15 +264,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         self._config_entry,
                         data={"username": username, "password": password_to_save},
                     )
-                    # Save options (scan_interval)
-                    return self.async_create_entry(
-                        title="", data={"scan_interval": scan_interval}
-                    )
+                    # Save options (scan_interval, push_updates)
+                    return self.async_create_entry(title="", data=options)
             else:
-                # Only scan_interval changed, save options
-                return self.async_create_entry(
-                    title="", data={"scan_interval": scan_interval}
-                )
+                # Only options changed, save them
+                return self.async_create_entry(title="", data=options)
 
         return self.async_show_form(
             step_id="init",
@@ -254,6 +277,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             description_placeholders={
                 "min": str(SCAN_INTERVAL_MIN),
                 "max": str(SCAN_INTERVAL_MAX),
+                "rate_min": str(RATE_LIMIT_MIN),
+                "rate_max": str(RATE_LIMIT_MAX),
             },
         )
 
@@ -268,12 +293,11 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: config_entries.ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    from .const import DOMAIN
-
     data = hass.data[DOMAIN][entry.entry_id]
     client = data["client"]
 
     try:
+        await async_get_rate_limiter(hass).acquire(Priority.INTERACTIVE, READOUT_COST)
         readout = await client.async_readout_sequence()
         # readout["asset_resp"] is now AssetFetchResult TypedDict
         asset_resp = readout.get("asset_resp") if readout else None
@@ -3,3 +3,48 @@ DEFAULT_NAME = "Flowerhub"
 PLATFORMS = ["sensor"]
 SCAN_INTERVAL_MIN = 5
 SCAN_INTERVAL_MAX = 86400
+CONF_PUSH_UPDATES = "push_updates"
+CONF_FLEET_SENSORS = "fleet_sensors"
+CONF_DAILY_UPTIME = "daily_uptime"
+DATA_CIRCUIT_BREAKERS = f"{DOMAIN}_circuit_breakers"
+DATA_RATE_LIMITER = f"{DOMAIN}_rate_limiter"
+DATA_UPTIME_STORE = f"{DOMAIN}_uptime_store"
+DATA_FLEET = f"{DOMAIN}_fleet"
+DATA_STARTUP = f"{DOMAIN}_startup"
+CONF_RATE_LIMIT = "rate_limit"
+# Integration-wide portal requests per minute, and burst size
+DEFAULT_RATE_LIMIT = 60
+RATE_LIMIT_MIN = 6
+RATE_LIMIT_MAX = 600
+RATE_LIMIT_BURST = 10
+
+# Recent status/uptime samples kept in memory per entry
+HISTORY_SIZE = 360
+
+# Fired on real status/message transitions; the last few are kept per entry
+EVENT_STATUS_CHANGED = f"{DOMAIN}_status_changed"
+TRANSITION_LOG_SIZE = 50
+
+# Seconds between portal uptime pie fetches; uptime is accounted locally between
+UPTIME_RECONCILE_INTERVAL = 3600
+# Upper bound for one uptime pie fetch, and the cycle budget it needs to start
+UPTIME_FETCH_TIMEOUT = 30.0
+UPTIME_FETCH_MIN_BUDGET = 5.0
+# Seconds between refreshes of one entry requested by the refresh service;
+# requests in between are merged into the next refresh
+REFRESH_MIN_SPACING = 30
+# Update intervals without a pushed update before push mode falls back to polling
+PUSH_WATCHDOG_INTERVALS = 2
+# Longest time entities go without an update while the portal data is unchanged
+UNCHANGED_NOTIFY_INTERVAL = 300
+
+# Entries priming (login and first refresh) concurrently during startup
+STARTUP_CONCURRENCY = 4
+# Seconds setup waits for the first refresh without a cached state
+FIRST_REFRESH_TIMEOUT = 60
+
+# Debug payload dumps on every Nth cycle per entry, capped at this many characters
+DEBUG_SAMPLE_EVERY = 10
+DEBUG_PAYLOAD_MAX_LENGTH = 500
+# Seconds before the same update error is logged again
+ERROR_LOG_INTERVAL = 300
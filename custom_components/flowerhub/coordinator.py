@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from time import monotonic
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from time import monotonic, time
 from typing import Any
 
+import flowerhub_portal_api_client as fh_client
 from flowerhub_portal_api_client import AsyncFlowerhubClient
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
 from homeassistant.helpers.issue_registry import (
     IssueSeverity,
 )
@@ -17,40 +25,86 @@ from homeassistant.helpers.issue_registry import (
 )
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-
-try:  # Prefer explicit exception types from the client when available
-    # Names below reflect common patterns; imports are guarded for safety
-    from flowerhub_portal_api_client import (
-        AuthenticationError as FHAuthenticationError,  # type: ignore
-    )
-except Exception:  # pragma: no cover - optional
-    FHAuthenticationError = None  # type: ignore
+from .budget import CycleBudget
+from .cadence import PortalCadence
+from .capabilities import ClientCapabilities, probe_client
+from .circuit_breaker import CircuitBreaker, async_get_circuit_breaker
+from .const import (
+    DOMAIN,
+    EVENT_STATUS_CHANGED,
+    HISTORY_SIZE,
+    PUSH_WATCHDOG_INTERVALS,
+    REFRESH_MIN_SPACING,
+    TRANSITION_LOG_SIZE,
+    UNCHANGED_NOTIFY_INTERVAL,
+    UPTIME_FETCH_MIN_BUDGET,
+    UPTIME_FETCH_TIMEOUT,
+    UPTIME_RECONCILE_INTERVAL,
+)
+from .debug_log import EntryLog
+from .demand import DataCategory, DataDemand
+from .errors import (
+    ERROR_POLICIES,
+    AssetFetchError,
+    ErrorClass,
+    ErrorClassifier,
+    PayloadMismatchError,
+)
+from .fleet import async_get_fleet_aggregator
+from .history import SampleHistory
+from .rate_limiter import READOUT_COST, async_get_rate_limiter
+from .snapshot import FlowerhubSnapshot
+from .startup import StartupManager
+from .uptime import (
+    DailyUptime,
+    UptimeTracker,
+    local_day,
+    local_period,
+    next_month_start,
+    pie_values,
+)
+from .uptime_store import UptimeStore
 
-for _name in (
+# Explicit auth exception types exported by the client, resolved once at import.
+# Names below reflect common patterns; missing names are simply skipped.
+_AUTH_EXCEPTION_NAMES = (
+    "AuthenticationError",
     "AuthError",
     "TokenExpiredError",
     "TokenRefreshError",
     "InvalidTokenError",
     "UnauthorizedError",
     "ForbiddenError",
-):
-    try:
-        globals()[f"FH{_name}"] = getattr(
-            __import__("flowerhub_portal_api_client", fromlist=[_name]), _name
-        )
-    except Exception:  # pragma: no cover - optional
-        globals()[f"FH{_name}"] = None
+)
+AUTH_EXCEPTIONS: tuple[type[Exception], ...] = tuple(
+    t
+    for t in (getattr(fh_client, name, None) for name in _AUTH_EXCEPTION_NAMES)
+    if isinstance(t, type) and issubclass(t, Exception)
+)
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+# Required keys of the AssetFetchResult TypedDict, computed once
+_ASSET_FETCH_REQUIRED_KEYS = frozenset(
+    {"status_code", "asset_info", "flowerhub_status", "error"}
+)
+
+
 def _validate_asset_fetch_result(result: Any, context: str = "result") -> bool:
     """Validate that result matches AssetFetchResult TypedDict structure.
 
-    Returns True if valid, raises UpdateFailed with details if invalid.
+    Returns True if valid, raises PayloadMismatchError with details if invalid.
     """
+    # Fast path for well-formed results
+    if (
+        type(result) is dict
+        and result.keys() >= _ASSET_FETCH_REQUIRED_KEYS
+        and (result["status_code"] is None or type(result["status_code"]) is int)
+    ):
+        return True
+
     if not isinstance(result, dict):
         LOGGER.error(
             "Invalid %s type: expected dict (AssetFetchResult), got %s. "
@@ -58,11 +112,12 @@ def _validate_asset_fetch_result(result: Any, context: str = "result") -> bool:
             context,
             type(result).__name__,
         )
-        raise UpdateFailed(f"Library returned unexpected type: {type(result).__name__}")
+        raise PayloadMismatchError(
+            f"Library returned unexpected type: {type(result).__name__}"
+        )
 
     # Validate required keys from AssetFetchResult TypedDict
-    required_keys = {"status_code", "asset_info", "flowerhub_status", "error"}
-    missing_keys = required_keys - set(result.keys())
+    missing_keys = set(_ASSET_FETCH_REQUIRED_KEYS - result.keys())
 
     if missing_keys:
         LOGGER.error(
@@ -72,7 +127,9 @@ def _validate_asset_fetch_result(result: Any, context: str = "result") -> bool:
             missing_keys,
             list(result.keys()),
         )
-        raise UpdateFailed(f"Library response missing required fields: {missing_keys}")
+        raise PayloadMismatchError(
+            f"Library response missing required fields: {missing_keys}"
+        )
 
     # Validate types of key fields
     if result.get("status_code") is not None and not isinstance(
@@ -96,6 +153,11 @@ class FlowerhubDataUpdateCoordinator(DataUpdateCoordinator):
         entry_id: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        push_updates: bool = False,
+        capabilities: ClientCapabilities | None = None,
+        uptime_store: UptimeStore | None = None,
+        startup: StartupManager | None = None,
+        daily_uptime: bool = False,
     ):
         super().__init__(
             hass,
@@ -103,206 +165,318 @@ class FlowerhubDataUpdateCoordinator(DataUpdateCoordinator):
             name="flowerhub",
             update_method=self._async_update,
             update_interval=update_interval,
+            # Polls that bring nothing new return the previous snapshot
+            always_update=False,
         )
         self.client: AsyncFlowerhubClient = client
+        # Profile of what the client supports; avoids per-call reflection
+        self.capabilities = capabilities or probe_client(client)
         self._username = username
         self._password = password
         self._first_update = True
         self._entry_id = entry_id or "default"
+        # In push mode the client's periodic asset fetch drives updates
+        self._push_updates = push_updates
+        self._push_task: asyncio.Task | None = None
+        # Whether the client's loop runs, and whether it stalled and polling
+        # took over until the next successful update
+        self._push_active = False
+        self._push_stalled = False
+        self._unsub_push_watchdog: CALLBACK_TYPE | None = None
+        # Background re-authentications started by the client's auth callback
+        self._auth_task: asyncio.Task | None = None
+        # Update cycles and re-logins in progress; they recover from auth
+        # errors themselves, so the client's callback is ignored meanwhile
+        self._auth_handlers = 0
+        # Polling waits for the first explicit refresh when serving cached data
+        self._hold_polling = False
+        self._startup = startup
         self._consecutive_failures = 0
         self._repair_threshold = 3
+        self._last_error: str | None = None
+        self._server_issue_active = False
+        # Integration-wide limiter shared with config flows and diagnostics
+        self._limiter = async_get_rate_limiter(hass)
+        # Shared by all entries of the same account; opens with the repairs issue
+        self._breaker = async_get_circuit_breaker(
+            hass, (username or self._entry_id).lower(), self._repair_threshold
+        )
         # Track last successful update time (monotonic seconds)
         self._last_success_monotonic: float | None = None
         # Track last uptime fetch time (monotonic seconds)
         self._last_uptime_fetch_monotonic: float | None = None
         # Cache uptime data
         self._uptime_data: dict[str, Any] | None = None
-        explicit_types = [
-            FHAuthenticationError,
-            globals().get("FHAuthError"),
-            globals().get("FHTokenExpiredError"),
-            globals().get("FHTokenRefreshError"),
-            globals().get("FHInvalidTokenError"),
-            globals().get("FHUnauthorizedError"),
-            globals().get("FHForbiddenError"),
-        ]
-        self._auth_exception_types: tuple[type[Exception], ...] = tuple(
-            t for t in explicit_types if isinstance(t, type)
+        # Uptime is accounted locally from status samples between portal fetches
+        interval = update_interval.total_seconds() if update_interval else 60
+        self._uptime = UptimeTracker(max_gap=3 * interval)
+        # Each cycle finishes well before the next tick is due
+        self._budget = CycleBudget(interval)
+        self._uptime_reconcile_interval = max(UPTIME_RECONCILE_INTERVAL, interval)
+        self._uptime_fetched_at: datetime | None = None
+        self._last_uptime_update_monotonic: float | None = None
+        self._uptime_store = uptime_store
+        # Optional per-day series derived from the month-to-date values
+        self._daily = DailyUptime() if daily_uptime else None
+        # Final values of the last closed month, and the timer closing the current
+        self._previous_month: dict[str, Any] | None = None
+        self._unsub_rollover: CALLBACK_TYPE | None = None
+        if uptime_store is not None and self._entry_id is not None:
+            self._restore_uptime(uptime_store.get(self._entry_id))
+        self.history = SampleHistory(HISTORY_SIZE)
+        self._fleet = async_get_fleet_aggregator(hass)
+        self.transitions: deque[dict[str, Any]] = deque(maxlen=TRANSITION_LOG_SIZE)
+        self._classifier = ErrorClassifier(AUTH_EXCEPTIONS)
+        # Sampled payload logging and rate-limited repeated errors
+        self.log = EntryLog(LOGGER)
+        # Categories with enabled entities; others are not fetched
+        self.demand = DataDemand()
+        # Failures seen per error class, and consecutive ones for backoff
+        self._error_counts: dict[ErrorClass, int] = dict.fromkeys(ErrorClass, 0)
+        self._class_failures: dict[ErrorClass, int] = dict.fromkeys(ErrorClass, 0)
+        # Delay before the next poll while backing off, None for normal interval
+        self._retry_delay: float | None = None
+        # Portal update period learned from data changes, for poll scheduling
+        self.cadence = PortalCadence()
+        # When entities were last given a new snapshot (monotonic seconds)
+        self._last_published_monotonic: float | None = None
+        # Categories requested through the refresh service, merged until run
+        self._requested: set[DataCategory] = set()
+        self._uptime_requested = False
+        self._request_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=REFRESH_MIN_SPACING,
+            immediate=True,
+            function=self._async_refresh_requested,
         )
-        if not self._auth_exception_types:
-            self._auth_exception_types = self._detect_auth_exceptions()
 
         # If the client supports an auth error callback, hook it to schedule a reauth
         try:
-            callback = getattr(self.client, "set_auth_error_callback", None)
-            if callable(callback):
-                callback(self._on_auth_error)
-            elif hasattr(self.client, "on_auth_error"):
+            hook = self.capabilities.auth_callback
+            if hook == "set_auth_error_callback":
+                self.client.set_auth_error_callback(self._on_auth_error)
+            elif hook:
                 # Some clients expose a property callback
-                setattr(self.client, "on_auth_error", self._on_auth_error)
+                setattr(self.client, hook, self._on_auth_error)
         except Exception:  # pragma: no cover - best-effort wiring
             pass
 
-    async def _async_update(self) -> dict[str, Any]:
-        try:
-            if self._first_update:
-                LOGGER.debug("Flowerhub coordinator running initial readout sequence")
-                readout = await self.client.async_readout_sequence()
-                LOGGER.debug("Readout response: %s", readout)
-
-                # Validate readout results - library returns TypedDict
-                has_asset_info = bool(getattr(self.client, "asset_info", None))
-                if not readout or not readout.get("asset_id"):
-                    if not has_asset_info:
-                        LOGGER.error(
-                            "Initial readout failed: no asset_id returned. "
-                            "Response type: %s",
-                            type(readout).__name__,
-                        )
-                        raise UpdateFailed("Readout did not return a valid asset_id")
+    async def _async_update(self) -> FlowerhubSnapshot:
+        self._hold_polling = False
+        if not self._breaker.allow_request(self):
+            return self._serve_stale()
 
-                # Check asset_resp TypedDict result from library (v0.4.0+)
-                if readout and readout.get("asset_resp") is not None:
-                    asset_result = readout.get("asset_resp")
+        attempts = 0
+        fetched_asset = False
+        self._budget.start()
+        self.log.start_cycle()
+        self._auth_handlers += 1
+        try:
+            while True:
+                try:
+                    # The initial readout already includes the uptime pie
+                    readout = self._first_update
+                    await self._acquire(READOUT_COST if readout else 1)
+                    async with asyncio.timeout(self._budget.remaining):
+                        await self._async_fetch()
+                    fetched_asset = not readout
+                    break
+                except Exception as err:
+                    error_class = self._classify_error(err)
+                    if (
+                        attempts < ERROR_POLICIES[error_class].retries
+                        and self._budget.remaining > 0
+                    ):
+                        attempts += 1
+                        LOGGER.debug("Retrying after %s error: %s", error_class, err)
+                        continue
+                    # Returns only if re-authentication restored the client state
+                    await self._async_handle_update_error(err, error_class)
+                    break
 
-                    if asset_result is None:
-                        raise UpdateFailed("asset_resp missing from readout")
+            if fetched_asset:
+                # Optional; deferred when the asset fetch used up the budget
+                await self._maybe_fetch_uptime_data()
+            return self._build_data()
+        finally:
+            self._auth_handlers -= 1
+            # A half-open probe that ended without a server verdict
+            self._breaker.release_probe(self)
+            self._budget.finish()
 
-                    # Validate AssetFetchResult TypedDict structure
-                    _validate_asset_fetch_result(asset_result, "asset_resp")
+    def _serve_stale(self) -> FlowerhubSnapshot:
+        """Return cached data marked stale while the circuit breaker is open."""
+        # Keep the repairs issue in step with the account's breaker
+        if not self._server_issue_active:
+            self._raise_server_issue(self._last_error or "portal circuit open")
+        if self.data is None:
+            raise UpdateFailed("Flowerhub portal circuit open and no cached data")
+        LOGGER.debug("Flowerhub portal circuit open; serving cached data")
+        # Cached status says nothing about the current state
+        self._uptime.record(monotonic(), None)
+        snapshot = self.data.with_stale()
+        self._publish_sample(snapshot)
+        return snapshot
 
-                    status_code = asset_result.get("status_code")
-                    error = asset_result.get("error")
+    async def _async_fetch(self) -> None:
+        """Fetch fresh data from the portal into the client."""
+        if self._first_update:
+            LOGGER.debug("Flowerhub coordinator running initial readout sequence")
+            readout = await self.client.async_readout_sequence()
+            if self.log.sampled:
+                LOGGER.debug("Readout response: %s", self.log.payload(readout))
 
-                    if status_code and status_code >= 400:
-                        LOGGER.error(
-                            "API returned error status %d during initial readout: %s",
-                            status_code,
-                            error or "no error details",
-                        )
-                        msg = "Asset fetch failed during readout"
-                        if status_code:
-                            msg += f" (HTTP {status_code})"
-                        if error:
-                            msg += f": {error}"
-                        raise UpdateFailed(msg)
-
-                    LOGGER.debug(
-                        "Initial readout successful, status code: %d", status_code or 0
+            # Validate readout results - library returns TypedDict
+            has_asset_info = self.capabilities.asset_info and bool(
+                self.client.asset_info
+            )
+            if not readout or not readout.get("asset_id"):
+                if not has_asset_info:
+                    LOGGER.error(
+                        "Initial readout failed: no asset_id returned. "
+                        "Response type: %s",
+                        type(readout).__name__,
+                    )
+                    raise PayloadMismatchError(
+                        "Readout did not return a valid asset_id"
                     )
 
-                # Store uptime data from initial readout
-                if readout and readout.get("uptime_pie_resp") is not None:
-                    uptime_pie_resp = readout.get("uptime_pie_resp")
-                    if isinstance(uptime_pie_resp, dict):
-                        from datetime import datetime, timezone
-
-                        now_utc = datetime.now(timezone.utc)
-                        now_iso = now_utc.isoformat()
-                        # Next update based on coordinator's actual polling interval
-                        next_update_utc = now_utc + self.update_interval
-                        next_iso = next_update_utc.isoformat()
-                        self._uptime_data = {
-                            "uptime": uptime_pie_resp.get("uptime"),
-                            "downtime": uptime_pie_resp.get("downtime"),
-                            "no_data": uptime_pie_resp.get("noData"),
-                            "uptime_ratio_actual": uptime_pie_resp.get(
-                                "uptime_ratio_actual"
-                            ),
-                            "uptime_ratio_total": uptime_pie_resp.get(
-                                "uptime_ratio_total"
-                            ),
-                            "updated_at": now_iso,
-                            "next_update_at": next_iso,
-                        }
-                        self._last_uptime_fetch_monotonic = monotonic()
-                        LOGGER.debug(
-                            "Uptime data cached from initial readout: %s",
-                            self._uptime_data,
-                        )
-
-                self._first_update = False
-            else:
-                LOGGER.debug("Flowerhub coordinator fetching asset data")
-                # async_fetch_asset returns AssetFetchResult TypedDict (v0.4.0+)
-                result = await self.client.async_fetch_asset()
+            # Check asset_resp TypedDict result from library (v0.4.0+)
+            if readout and readout.get("asset_resp") is not None:
+                asset_result = readout.get("asset_resp")
 
-                if result is None:
-                    raise UpdateFailed("Asset fetch returned no data")
+                if asset_result is None:
+                    raise UpdateFailed("asset_resp missing from readout")
 
                 # Validate AssetFetchResult TypedDict structure
-                _validate_asset_fetch_result(result, "async_fetch_asset result")
+                _validate_asset_fetch_result(asset_result, "asset_resp")
 
-                status_code = result.get("status_code")
-                error = result.get("error")
-                has_asset_info = bool(getattr(self.client, "asset_info", None))
+                status_code = asset_result.get("status_code")
+                error = asset_result.get("error")
 
                 if status_code and status_code >= 400:
                     LOGGER.error(
-                        "API returned error status %d: %s",
+                        "API returned error status %d during initial readout: %s",
                         status_code,
                         error or "no error details",
                     )
-                    msg = f"Asset fetch failed (HTTP {status_code})"
+                    msg = "Asset fetch failed during readout"
+                    if status_code:
+                        msg += f" (HTTP {status_code})"
                     if error:
                         msg += f": {error}"
-                    raise UpdateFailed(msg)
-
-                if not status_code and not has_asset_info:
-                    LOGGER.warning(
-                        "Asset fetch missing status_code with no cached asset_info. "
-                        "Keys: %s",
-                        list(result.keys()),
-                    )
-                    raise UpdateFailed(
-                        "Asset fetch returned no status and client has no cached data"
-                    )
+                    raise AssetFetchError(msg, status_code)
 
                 LOGGER.debug(
-                    "Asset fetch successful, status code: %d", status_code or 0
+                    "Initial readout successful, status code: %d", status_code or 0
                 )
 
-                # Fetch uptime data alongside asset data
-                await self._maybe_fetch_uptime_data()
-        except Exception as err:
-            # Try to detect auth-related failures and recover automatically
-            if self._is_auth_error(err):
+            # Store uptime data from initial readout
+            if readout and readout.get("uptime_pie_resp") is not None:
+                uptime_pie_resp = readout.get("uptime_pie_resp")
+                if isinstance(uptime_pie_resp, dict):
+                    self._store_uptime_data(uptime_pie_resp)
+                    if self.log.sampled:
+                        LOGGER.debug(
+                            "Uptime data cached from initial readout: %s",
+                            self.log.payload(self._uptime_data),
+                        )
+
+            self._first_update = False
+        else:
+            LOGGER.debug("Flowerhub coordinator fetching asset data")
+            # async_fetch_asset returns AssetFetchResult TypedDict (v0.4.0+)
+            result = await self.client.async_fetch_asset()
+
+            if result is None:
+                raise PayloadMismatchError("Asset fetch returned no data")
+
+            # Validate AssetFetchResult TypedDict structure
+            _validate_asset_fetch_result(result, "async_fetch_asset result")
+
+            status_code = result.get("status_code")
+            error = result.get("error")
+            has_asset_info = self.capabilities.asset_info and bool(
+                self.client.asset_info
+            )
+
+            if status_code and status_code >= 400:
+                LOGGER.error(
+                    "API returned error status %d: %s",
+                    status_code,
+                    error or "no error details",
+                )
+                msg = f"Asset fetch failed (HTTP {status_code})"
+                if error:
+                    msg += f": {error}"
+                raise AssetFetchError(msg, status_code)
+
+            if not status_code and not has_asset_info:
                 LOGGER.warning(
-                    "Authentication error detected (type: %s): %s - attempting re-auth",
-                    type(err).__name__,
-                    err,
+                    "Asset fetch missing status_code with no cached asset_info. "
+                    "Keys: %s",
+                    list(result.keys()),
                 )
-                try:
-                    await self._reauth_and_prime()
-                    LOGGER.info(
-                        "Automatic re-authentication successful; client state restored"
-                    )
-                except Exception as reauth_err:
-                    LOGGER.error(
-                        "Re-authentication failed: %s (%s)",
-                        reauth_err,
-                        type(reauth_err).__name__,
-                    )
-                    # Only prompt user if the failure is an auth error; otherwise
-                    # treat as server error to avoid unnecessary credential prompts
-                    if self._is_auth_error(reauth_err):
-                        # Signal Home Assistant to start a reauth flow
-                        raise ConfigEntryAuthFailed(
-                            f"Re-authentication failed: {reauth_err}"
-                        ) from reauth_err
-                    # Non-auth reauth failures are treated as transient
-                    self._consecutive_failures += 1
-                    self._maybe_raise_server_issue(reauth_err)
-                    raise UpdateFailed(reauth_err) from reauth_err
-            else:
+                raise PayloadMismatchError(
+                    "Asset fetch returned no status and client has no cached data"
+                )
+
+            LOGGER.debug("Asset fetch successful, status code: %d", status_code or 0)
+
+    async def _async_handle_update_error(
+        self, err: Exception, error_class: ErrorClass
+    ) -> None:
+        """Apply the failure policy for an update error.
+
+        Returns only when automatic re-authentication succeeded; otherwise raises.
+        """
+        # Try to recover automatically from auth-related failures
+        if error_class is ErrorClass.AUTH:
+            LOGGER.warning(
+                "Authentication error detected (type: %s): %s - attempting re-auth",
+                type(err).__name__,
+                err,
+            )
+            try:
+                await self._reauth_and_prime(budgeted=True)
+            except Exception as reauth_err:
                 LOGGER.error(
-                    "Update failed with %s: %s", type(err).__name__, err, exc_info=True
+                    "Re-authentication failed: %s (%s)",
+                    reauth_err,
+                    type(reauth_err).__name__,
                 )
-                # Track non-auth failures and raise/refresh repairs issue as needed
-                self._consecutive_failures += 1
-                self._maybe_raise_server_issue(err)
-                raise UpdateFailed(err) from err
+                reauth_class = self._classify_error(reauth_err)
+                # Only prompt user if the failure is an auth error; otherwise
+                # treat as server error to avoid unnecessary credential prompts
+                if reauth_class is ErrorClass.AUTH:
+                    # Signal Home Assistant to start a reauth flow
+                    self._record_failure(reauth_err, reauth_class)
+                    raise ConfigEntryAuthFailed(
+                        f"Re-authentication failed: {reauth_err}"
+                    ) from reauth_err
+                # Non-auth reauth failures are treated as transient
+                self._record_failure(reauth_err, reauth_class)
+                raise UpdateFailed(reauth_err) from reauth_err
+            LOGGER.info("Automatic re-authentication successful; client state restored")
+            # The primed client now holds fresh data
+            return
+        repeats = self.log.error_repeats(err)
+        if repeats is not None:
+            LOGGER.error(
+                "Update failed with %s (%s): %s%s",
+                type(err).__name__,
+                error_class,
+                err,
+                f" (repeated {repeats} times since last logged)" if repeats else "",
+                # Tracebacks only on sampled cycles with debug logging enabled
+                exc_info=self.log.sampled,
+            )
+        self._record_failure(err, error_class)
+        raise UpdateFailed(err) from err
 
+    def _build_data(self) -> FlowerhubSnapshot:
+        """Build coordinator data from the client's current state."""
         status = self.client.flowerhub_status
         asset_info = self.client.asset_info or {}
 
@@ -314,121 +488,298 @@ class FlowerhubDataUpdateCoordinator(DataUpdateCoordinator):
         if not status.status:
             LOGGER.error(
                 "Flowerhub status.status field is empty. Status object: %s",
-                status.__dict__ if hasattr(status, "__dict__") else status,
+                self.log.payload(status),
             )
             raise UpdateFailed("Flowerhub status field is empty in response data")
-        inverter = asset_info.get("inverter", {}) or {}
-        battery = asset_info.get("battery", {}) or {}
         # Any success clears server failure tracking and any issue / repair warning
         self._clear_server_issue()
+        self.log.reset_errors()
+        self._breaker.record_success()
         self._consecutive_failures = 0
+        self._class_failures = dict.fromkeys(ErrorClass, 0)
+        self._retry_delay = None
         # Mark last successful update timestamp
         self._last_success_monotonic = monotonic()
-        return {
-            # Status info
-            "status": status.status if status else None,
-            "message": status.message if status else None,
-            "last_updated": status.updated_at.isoformat()
-            if status and status.updated_at
-            else None,
-            # Core asset details (mirrors client.asset_info)
-            "inverter": inverter or None,
-            "battery": battery or None,
-            "fuse_size": asset_info.get("fuseSize"),
-            "is_installed": asset_info.get("isInstalled"),
-            # Convenience flattened fields derived from inverter/battery
-            "inverter_name": inverter.get("name"),
-            "inverter_manufacturer": inverter.get("manufacturerName"),
-            "inverter_battery_stacks_supported": inverter.get(
-                "numberOfBatteryStacksSupported"
-            ),
-            "power_capacity": inverter.get("powerCapacity"),
-            "battery_name": battery.get("name"),
-            "battery_manufacturer": battery.get("manufacturerName"),
-            "battery_max_modules": battery.get("maxNumberOfBatteryModules"),
-            "battery_power_capacity": battery.get("powerCapacity"),
-            "energy_capacity": battery.get("energyCapacity"),
-            # Uptime data (current month)
-            "uptime": self._uptime_data.get("uptime") if self._uptime_data else None,
-            "downtime": self._uptime_data.get("downtime")
-            if self._uptime_data
-            else None,
-            "no_data": self._uptime_data.get("no_data") if self._uptime_data else None,
-            "uptime_ratio_actual": self._uptime_data.get("uptime_ratio_actual")
-            if self._uptime_data
-            else None,
-            "uptime_ratio_total": self._uptime_data.get("uptime_ratio_total")
-            if self._uptime_data
-            else None,
-            "uptime_last_updated": self._uptime_data.get("updated_at")
-            if self._uptime_data
-            else None,
-            "uptime_next_update": self._uptime_data.get("next_update_at")
-            if self._uptime_data
-            else None,
+        period = local_period()
+        if self._uptime.period is not None and self._uptime.period != period:
+            # Month boundary missed by the rollover timer: close the month with
+            # the local values and start the new one at zero
+            if (final := self._uptime.values()) is not None:
+                self._previous_month = {"period": self._uptime.period, **final}
+            self._uptime.rollover(self._last_success_monotonic, period)
+            self._uptime_fetched_at = datetime.now(timezone.utc)
+        changed = self.cadence.observe(
+            self._last_success_monotonic, (status.status, status.message, asset_info)
+        )
+        # Polls follow the portal's period when it is slower than the interval
+        self._uptime.max_gap = 3 * max(self._budget.interval, self.cadence.period or 0)
+        self._uptime.record(self._last_success_monotonic, status.status)
+        self._update_uptime_data()
+        previous = self.data if isinstance(self.data, FlowerhubSnapshot) else None
+        if (
+            not changed
+            and previous is not None
+            and not previous.stale
+            and previous["uptime_last_updated"] == self._uptime_fetched_at
+            and self._last_published_monotonic is not None
+            and self._last_success_monotonic - self._last_published_monotonic
+            < UNCHANGED_NOTIFY_INTERVAL
+        ):
+            if self.demand.wants(DataCategory.UPTIME) and (
+                (previous.uptime_data or None) != (self._uptime_data or None)
+            ):
+                # Nothing new from the portal, but locally accounted uptime moved
+                snapshot = previous.with_uptime(self._uptime_data)
+            else:
+                # Nothing new from the portal: entities are not notified
+                snapshot = previous
+            # History, fleet and startup cache still follow every successful poll
+            self._publish_sample(snapshot)
+            return snapshot
+        self._last_published_monotonic = self._last_success_monotonic
+        snapshot = FlowerhubSnapshot.from_client(
+            status, asset_info, self._uptime_data, previous
+        )
+        self._publish_sample(snapshot)
+        if previous is not None:
+            self._track_transition(previous, snapshot)
+        return snapshot
+
+    def _publish_sample(self, snapshot: FlowerhubSnapshot) -> None:
+        """Record a published snapshot in the history, fleet and startup cache."""
+        self.history.append(time(), snapshot)
+        if self._entry_id is not None:
+            self._fleet.report(
+                self._entry_id,
+                snapshot.status,
+                snapshot["uptime_ratio_actual"],
+                snapshot.stale,
+            )
+            if self._startup is not None and not snapshot.stale:
+                self._startup.update(self._entry_id, snapshot)
+
+    @callback
+    def async_set_cached_data(self, snapshot: FlowerhubSnapshot) -> None:
+        """Publish a cached snapshot and hold polling until the first refresh.
+
+        Used during staged startup: entities get a state right away while
+        login and the first refresh wait for a priming slot.
+        """
+        self.data = snapshot
+        self._hold_polling = True
+        self._fleet.report(
+            self._entry_id,
+            snapshot.status,
+            snapshot["uptime_ratio_actual"],
+            snapshot.stale,
+        )
+
+    def _track_transition(
+        self, previous: FlowerhubSnapshot, snapshot: FlowerhubSnapshot
+    ) -> None:
+        """Log and fire an event when status or message actually changed."""
+        if previous.status == snapshot.status and previous.message == snapshot.message:
+            return
+        event_data = {
+            "entry_id": self._entry_id,
+            "asset_id": self.client.asset_id if self.capabilities.asset_id else None,
+            "old_status": previous.status,
+            "new_status": snapshot.status,
+            "old_message": previous.message,
+            "new_message": snapshot.message,
         }
+        self.transitions.append(
+            {"timestamp": datetime.now(timezone.utc).isoformat(), **event_data}
+        )
+        self.hass.bus.async_fire(EVENT_STATUS_CHANGED, event_data)
 
-    def _is_auth_error(self, err: Exception) -> bool:
-        try:
-            if self._auth_exception_types and isinstance(
-                err, self._auth_exception_types
-            ):
-                return True
-        except Exception:  # pragma: no cover - fallback if isinstance fails
-            pass
+    @property
+    def push_updates(self) -> bool:
+        """Return True when updates are pushed by the client's fetch loop."""
+        return self._push_updates
 
-        # Detect HTTP-style auth failures (401/403) when a status is present
-        status = None
-        for attr in ("status", "status_code", "code"):
-            value = getattr(err, attr, None)
-            if isinstance(value, int):
-                status = value
-                break
-        if status is None:
-            try:
-                from aiohttp import ClientResponseError  # type: ignore
-
-                if isinstance(err, ClientResponseError):
-                    status = err.status
-            except Exception:  # pragma: no cover - aiohttp may not be available
-                pass
-        if status is not None:
-            if status in (401, 403):
-                return True
-            if status >= 500:
-                return False  # server errors are not auth failures
-
-        text = str(err).lower()
-        if any(
-            code in text
-            for code in ("401", "403", "unauthorized", "forbidden", "token", "expired")
-        ):
+    @callback
+    def _schedule_refresh(self) -> None:
+        if self._hold_polling or self._shutdown_requested:
+            return
+        if self._push_updates:
+            # In push mode the client's periodic fetch is the single source of
+            # ticks; polling only stands in after the loop stalled
+            if self._push_active or not self._push_stalled:
+                return
+            if self.last_update_success:
+                self._push_stalled = False
+                self.async_start_push_updates()
+                return
+        # Same guards as the base class, which the timers below bypass
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        if not self._listeners or self.update_interval is None:
+            return
+        # Back off according to the policy of the last failure class, or poll
+        # around the portal's next expected update once its period is known
+        delay = self._retry_delay or self.cadence.next_delay(monotonic())
+        if not delay:
+            super()._schedule_refresh()
+            return
+        self._async_unsub_refresh()
+        self._unsub_refresh = async_call_later(
+            self.hass, delay, self._handle_refresh_interval
+        )
+
+    @callback
+    def async_start_push_updates(self) -> bool:
+        """Hand periodic polling over to the client's own asset fetch loop.
+
+        Returns False (and keeps the coordinator timer) if the client does not
+        support periodic fetching.
+        """
+        if self._push_active:
             return True
-        name = err.__class__.__name__.lower()
-        return "auth" in name or "token" in name
-
-    def _detect_auth_exceptions(self) -> tuple[type[Exception], ...]:
-        candidates = (
-            "AuthenticationError",
-            "AuthError",
-            "TokenExpiredError",
-            "TokenRefreshError",
-            "InvalidTokenError",
-            "UnauthorizedError",
-            "ForbiddenError",
+        if not self._push_updates or not self.capabilities.periodic_fetch:
+            if self._push_updates:
+                LOGGER.warning(
+                    "Client does not support periodic asset fetch; "
+                    "falling back to coordinator polling"
+                )
+                self._push_updates = False
+                self._schedule_refresh()
+            return False
+        self._async_unsub_refresh()
+        interval = self.update_interval.total_seconds() if self.update_interval else 60
+        self.client.start_periodic_asset_fetch(
+            interval_seconds=interval, on_update=self._handle_pushed_update
+        )
+        self._push_active = True
+        self._arm_push_watchdog()
+        LOGGER.debug("Flowerhub push updates started (interval %ss)", interval)
+        return True
+
+    @callback
+    def async_stop_push_updates(self) -> None:
+        """Stop the client's fetch loop and cancel any pending push handling."""
+        if self._unsub_push_watchdog is not None:
+            self._unsub_push_watchdog()
+            self._unsub_push_watchdog = None
+        if self.capabilities.periodic_fetch:
+            self.client.stop_periodic_asset_fetch()
+        self._push_active = False
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+        self._push_task = None
+
+    @callback
+    def _arm_push_watchdog(self) -> None:
+        """(Re)start the deadline for the next pushed update."""
+        if self._unsub_push_watchdog is not None:
+            self._unsub_push_watchdog()
+        interval = self.update_interval.total_seconds() if self.update_interval else 60
+        self._unsub_push_watchdog = async_call_later(
+            self.hass, PUSH_WATCHDOG_INTERVALS * interval, self._push_watchdog
         )
-        types: list[type[Exception]] = []
+
+    @callback
+    def _push_watchdog(self, _now: datetime) -> None:
+        """Fall back to polling when the client's loop stopped delivering.
+
+        The client only calls back after successful fetches, so expired
+        credentials, portal outages and a dead loop all look like silence.
+        Polling runs the normal error handling (re-authentication, backoff,
+        repairs) and hands ticks back to the client's loop after the next
+        successful update.
+        """
+        self._unsub_push_watchdog = None
+        if self._shutdown_requested or not self._push_active:
+            return
+        LOGGER.warning(
+            "No pushed Flowerhub update for %s intervals; falling back to polling",
+            PUSH_WATCHDOG_INTERVALS,
+        )
+        self.async_stop_push_updates()
+        self._push_stalled = True
+        self._async_unsub_refresh()
+        self._unsub_refresh = async_call_later(
+            self.hass, 0, self._handle_refresh_interval
+        )
+
+    def _handle_pushed_update(self, _status: Any) -> None:
+        # Called by the client's fetch loop after a successful asset fetch
+        if not self._push_active:
+            return
+        self._arm_push_watchdog()
+        if self._push_task and not self._push_task.done():
+            LOGGER.debug("Previous pushed update still in progress; skipping")
+            return
+        self._push_task = self.hass.async_create_task(self._async_handle_push())
+
+    async def _async_handle_push(self) -> None:
+        self._budget.start()
+        self.log.start_cycle()
         try:
-            import importlib
-
-            mod = importlib.import_module("flowerhub_portal_api_client")
-            for name in candidates:
-                t = getattr(mod, name, None)
-                if isinstance(t, type) and issubclass(t, Exception):
-                    types.append(t)
-        except Exception:  # pragma: no cover - fallback if module import fails
-            pass
-        return tuple(types)
+            await self._maybe_fetch_uptime_data()
+            data = self._build_data()
+        except UpdateFailed as err:
+            LOGGER.warning("Pushed update rejected: %s", err)
+            self.async_set_update_error(err)
+            return
+        finally:
+            self._budget.finish()
+        if data is self.data and self.last_update_success:
+            # Nothing new from the portal
+            return
+        self.async_set_updated_data(data)
+
+    def _is_auth_error(self, err: Exception) -> bool:
+        return self._classifier.classify(err) is ErrorClass.AUTH
+
+    def _classify_error(self, err: Exception) -> ErrorClass:
+        """Classify an update failure and count it per class."""
+        error_class = self._classifier.classify(err)
+        self._error_counts[error_class] += 1
+        return error_class
+
+    def _record_failure(self, err: Exception, error_class: ErrorClass) -> None:
+        """Apply backoff and repairs policy for a failed update."""
+        if self._entry_id is not None:
+            # Entities keep showing the last data, which is now stale
+            data = self.data or {}
+            self._fleet.report(
+                self._entry_id,
+                data.get("status"),
+                data.get("uptime_ratio_actual"),
+                True,
+            )
+        policy = ERROR_POLICIES[error_class]
+        self._class_failures[error_class] += 1
+        interval = self.update_interval.total_seconds() if self.update_interval else 60
+        self._retry_delay = policy.next_delay(
+            self._class_failures[error_class], interval
+        )
+        if self._retry_delay:
+            LOGGER.debug(
+                "Backing off %s errors: next update in %.0fs",
+                error_class,
+                self._retry_delay,
+            )
+        self._last_error = str(err)
+        if policy.trips_breaker:
+            self._breaker.record_failure(self)
+        if policy.repairs:
+            # Track failures and raise/refresh repairs issue as needed
+            self._consecutive_failures += 1
+            self._maybe_raise_server_issue(err)
+        if self._breaker.is_open and not self._server_issue_active:
+            self._raise_server_issue(err)
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Return the portal circuit breaker shared by this account's entries."""
+        return self._breaker
+
+    @property
+    def error_counts(self) -> dict[str, int]:
+        """Return the number of update failures seen per error class."""
+        return {str(error_class): n for error_class, n in self._error_counts.items()}
 
     def _server_issue_id(self) -> str:
         return f"server_update_failures_{self._entry_id}"
@@ -437,6 +788,10 @@ class FlowerhubDataUpdateCoordinator(DataUpdateCoordinator):
         # Only raise a repairs issue for non-auth failures after threshold
         if self._consecutive_failures < self._repair_threshold:
             return
+        self._raise_server_issue(err)
+
+    def _raise_server_issue(self, err: Exception | str) -> None:
+        self._server_issue_active = True
         ir_async_create_issue(
             hass=self.hass,
             domain=DOMAIN,
@@ -446,27 +801,48 @@ class FlowerhubDataUpdateCoordinator(DataUpdateCoordinator):
             severity=IssueSeverity.ERROR,
             translation_key="server_update_failures",
             translation_placeholders={
-                "count": str(self._consecutive_failures),
+                "count": str(max(self._consecutive_failures, self._breaker.failures)),
                 "last_error": str(err),
             },
         )
 
     def _clear_server_issue(self) -> None:
+        self._server_issue_active = False
         ir_async_delete_issue(
             hass=self.hass, domain=DOMAIN, issue_id=self._server_issue_id()
         )
 
-    async def _reauth_and_prime(self) -> None:
+    async def _acquire(self, cost: float = 1.0) -> None:
+        """Wait for rate limiter tokens outside the cycle budget."""
+        self._budget.exclude(await self._limiter.acquire(cost=cost))
+
+    async def _reauth_and_prime(self, budgeted: bool = False) -> None:
         if not self._username or not self._password:
             # Cannot reauth without credentials
             raise RuntimeError("Missing credentials for re-authentication")
         # Perform full login and initial readout to restore state
         LOGGER.debug("Flowerhub performing re-login for coordinator recovery")
-        await self.client.async_login(self._username, self._password)
-        await self.client.async_readout_sequence()
+        await self._acquire(1 + READOUT_COST)
+        self._auth_handlers += 1
+        try:
+            async with asyncio.timeout(self._budget.remaining if budgeted else None):
+                await self.client.async_login(self._username, self._password)
+                await self.client.async_readout_sequence()
+        finally:
+            self._auth_handlers -= 1
 
     def _on_auth_error(self) -> None:
         # Schedule a background reauth; the next refresh will pick up data
+        if self._shutdown_requested:
+            return
+        if self._auth_handlers:
+            # The client calls back right before raising the auth error to
+            # the running cycle or re-login, which recovers on its own
+            return
+        if self._auth_task and not self._auth_task.done():
+            # One re-authentication at a time; later callbacks share it
+            return
+
         async def _do():
             try:
                 await self._reauth_and_prime()
@@ -475,46 +851,258 @@ class FlowerhubDataUpdateCoordinator(DataUpdateCoordinator):
             else:
                 LOGGER.info("Flowerhub auth callback reauth succeeded")
 
-        self.hass.async_create_task(_do())
+        self._auth_task = self.hass.async_create_task(_do())
+
+    @callback
+    def async_schedule_month_rollover(self) -> None:
+        """Close the uptime month at the next local midnight on the 1st."""
+        if self._unsub_rollover is not None:
+            self._unsub_rollover()
+        self._unsub_rollover = async_track_point_in_time(
+            self.hass, self._async_month_rollover, next_month_start()
+        )
+
+    async def _async_month_rollover(self, _now: datetime) -> None:
+        """Capture the final values of the ended month and start the new one."""
+        self._unsub_rollover = None
+        previous, period = self._uptime.period, local_period()
+        if previous is not None and previous != period:
+            now = monotonic()
+            # Time since the last poll still belongs to the ended month
+            self._uptime.advance(now)
+            await self._async_close_month(previous)
+            if self._shutdown_requested:
+                # Unloaded while the final pie was fetched
+                return
+            self._uptime.rollover(now, period)
+            self._uptime_fetched_at = datetime.now(timezone.utc)
+            self._update_uptime_data()
+            LOGGER.debug("Uptime month %s closed, counting %s", previous, period)
+            # Entities show the new month right away, without a poll
+            self._publish_uptime()
+        self.async_schedule_month_rollover()
+
+    @callback
+    def _publish_uptime(self) -> None:
+        """Give entities the current uptime data outside an update cycle."""
+        if isinstance(self.data, FlowerhubSnapshot):
+            self.data = self.data.with_uptime(self._uptime_data)
+            self.async_update_listeners()
+
+    async def async_request_data(self, categories: Iterable[DataCategory]) -> None:
+        """Fetch data of the given categories outside the poll schedule.
+
+        The first request runs right away. Requests within the following
+        REFRESH_MIN_SPACING seconds are merged into one refresh at its end.
+        Merging is per entry; entries of the same account each keep their own
+        client, so a request for several of them fetches once per entry.
+        """
+        if self._hold_polling or self._shutdown_requested:
+            # Not primed yet; the first refresh is already queued
+            return
+        self._requested.update(categories)
+        await self._request_debouncer.async_call()
+
+    async def _async_refresh_requested(self) -> None:
+        categories, self._requested = self._requested, set()
+        if DataCategory.UPTIME in categories:
+            self._uptime_requested = True
+        if categories - {DataCategory.UPTIME}:
+            # Status and hardware come from the same asset fetch, which is
+            # followed by the requested uptime fetch
+            await self.async_refresh()
+        elif categories and not self._breaker.is_open:
+            fetched_at = self._uptime_fetched_at
+            await self._maybe_fetch_uptime_data()
+            if self._uptime_fetched_at != fetched_at:
+                self._publish_uptime()
+
+    async def _async_close_month(self, period: str) -> None:
+        """Record the final uptime values of ``period``.
+
+        One last portal pie for the ended month replaces the local estimate
+        when it can be fetched.
+        """
+        final = self._uptime.values()
+        asset_id = self.client.asset_id if self.capabilities.asset_id else None
+        if (
+            asset_id
+            and self.capabilities.uptime_pie
+            and self.demand.wants(DataCategory.UPTIME)
+            and not self._breaker.is_open
+        ):
+            try:
+                await self._limiter.acquire()
+                async with asyncio.timeout(UPTIME_FETCH_TIMEOUT):
+                    resp = await self.client.async_fetch_uptime_pie(
+                        asset_id,
+                        period=period,
+                        raise_on_error=False,
+                        timeout_total=UPTIME_FETCH_TIMEOUT,
+                    )
+                if isinstance(resp, dict) and resp.get("uptime") is not None:
+                    final = pie_values(resp)
+            except Exception as err:
+                LOGGER.warning("Final uptime fetch for %s failed: %s", period, err)
+        if final is not None:
+            self._previous_month = {"period": period, **final}
+
+    async def async_shutdown(self) -> None:
+        """Release timers, tasks and client hooks held by the coordinator."""
+        self._request_debouncer.async_shutdown()
+        if self._unsub_rollover is not None:
+            self._unsub_rollover()
+            self._unsub_rollover = None
+        self.async_stop_push_updates()
+        if self._auth_task and not self._auth_task.done():
+            self._auth_task.cancel()
+        self._auth_task = None
+        # The client must not call back into an unloaded coordinator
+        try:
+            hook = self.capabilities.auth_callback
+            if hook == "set_auth_error_callback":
+                self.client.set_auth_error_callback(None)
+            elif hook:
+                setattr(self.client, hook, None)
+        except Exception:  # pragma: no cover - best-effort unwiring
+            pass
+        await super().async_shutdown()
+
+    @property
+    def budget(self) -> CycleBudget:
+        """Return the update cycle budget and its overrun metrics."""
+        return self._budget
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the longest regular gap between polls in seconds.
+
+        Polls follow the portal's learned period when it is slower than the
+        update interval, so entity availability allows for that gap.
+        """
+        interval = self.update_interval.total_seconds() if self.update_interval else 60
+        return max(interval, self.cadence.period or 0.0)
+
+    @property
+    def uptime_tracker(self) -> UptimeTracker:
+        """Return the local uptime accounting state."""
+        return self._uptime
+
+    @property
+    def uptime_data(self) -> dict[str, Any] | None:
+        """Return the month-to-date uptime values published with snapshots."""
+        return self._uptime_data
+
+    def _store_uptime_data(self, uptime_pie_resp: dict[str, Any]) -> None:
+        """Reconcile local uptime with a portal pie and record when it was fetched."""
+        self._uptime_requested = False
+        self._last_uptime_fetch_monotonic = monotonic()
+        self._uptime_fetched_at = datetime.now(timezone.utc)
+        self._uptime.reconcile(
+            self._last_uptime_fetch_monotonic, uptime_pie_resp, local_period()
+        )
+        self._update_uptime_data()
+
+    def _restore_uptime(self, record: dict[str, Any] | None) -> None:
+        """Restore persisted month-to-date counters if they are for this month."""
+        if not record or record["tracker"]["period"] != local_period():
+            return
+        self._uptime.restore(record["tracker"])
+        if self._daily is not None and record.get("daily"):
+            self._daily.restore(record["daily"])
+        self._previous_month = record.get("previous_month")
+        self._uptime_fetched_at = datetime.fromisoformat(record["fetched_at"])
+        self._update_uptime_data()
+        LOGGER.debug("Restored uptime counters for %s", self._uptime.period)
+
+    def _update_uptime_data(self) -> None:
+        """Publish the running month-to-date uptime values."""
+        values = self._uptime.values()
+        if values is None or self._uptime_fetched_at is None:
+            return
+        self._uptime_data = {
+            **values,
+            "period": self._uptime.period,
+            "previous_month": self._previous_month,
+            "updated_at": self._uptime_fetched_at,
+            "next_update_at": self._uptime_fetched_at
+            + timedelta(seconds=self._uptime_reconcile_interval),
+        }
+        if self._daily is not None:
+            self._daily.update(self._uptime.period, local_day(), values)
+            self._uptime_data["daily_uptime_ratio"] = self._daily.ratios()
+        self._last_uptime_update_monotonic = monotonic()
+        if self._uptime_store is not None and self._entry_id is not None:
+            asset_id = self.client.asset_id if self.capabilities.asset_id else None
+            if asset_id:
+                self._uptime_store.update(
+                    self._entry_id,
+                    asset_id,
+                    {
+                        "fetched_at": self._uptime_fetched_at.isoformat(),
+                        "tracker": self._uptime.to_storage(),
+                        "daily": self._daily.to_storage() if self._daily else None,
+                        "previous_month": self._previous_month,
+                    },
+                )
+
+    def _uptime_fetch_due(self) -> bool:
+        """Return True when the portal pie should be fetched to reconcile."""
+        if self._last_uptime_fetch_monotonic is None or self._uptime_requested:
+            return True
+        # A new month starts from the portal's values, not last month's counters
+        if self._uptime.period != local_period():
+            return True
+        return (
+            monotonic() - self._last_uptime_fetch_monotonic
+            >= self._uptime_reconcile_interval
+        )
 
     async def _maybe_fetch_uptime_data(self) -> None:
-        """Fetch uptime data for the current month.
+        """Fetch uptime data for the current month when a reconcile is due.
 
-        Fetches are aligned with the main coordinator polling interval.
-        Uses the client library's default period (current month in local timezone).
+        Between fetches uptime is accounted locally from status samples; the
+        portal pie is fetched every UPTIME_RECONCILE_INTERVAL and at the start
+        of a month. The period is passed explicitly, since the client library
+        defaults to the month in the host's time zone.
         """
         try:
-            asset_id = getattr(self.client, "asset_id", None)
+            if not self.capabilities.uptime_pie:
+                return
+            asset_id = self.client.asset_id if self.capabilities.asset_id else None
             if not asset_id:
                 LOGGER.debug("Skipping uptime fetch: no asset_id available")
                 return
+            if not self._uptime_fetch_due():
+                return
+            if not self.demand.wants(DataCategory.UPTIME):
+                # Stays due, so it is fetched once an uptime entity is enabled
+                LOGGER.debug("Skipping uptime fetch: no uptime entities enabled")
+                return
+            if not self._budget.allows(UPTIME_FETCH_MIN_BUDGET):
+                # Still due, so the next cycle picks it up
+                LOGGER.debug(
+                    "Deferring uptime fetch: %.1fs left in cycle budget",
+                    self._budget.remaining,
+                )
+                return
 
             LOGGER.debug("Fetching uptime data for current month")
-            uptime_pie_resp = await self.client.async_fetch_uptime_pie(
-                asset_id,
-                raise_on_error=False,
-                timeout_total=30.0,
-            )
+            await self._acquire()
+            async with asyncio.timeout(self._budget.remaining):
+                uptime_pie_resp = await self.client.async_fetch_uptime_pie(
+                    asset_id,
+                    period=local_period(),
+                    raise_on_error=False,
+                    timeout_total=min(UPTIME_FETCH_TIMEOUT, self._budget.remaining),
+                )
 
             if isinstance(uptime_pie_resp, dict):
-                from datetime import datetime, timezone
-
-                now_utc = datetime.now(timezone.utc)
-                now_iso = now_utc.isoformat()
-                # Next update based on coordinator's actual polling interval
-                next_update_utc = now_utc + self.update_interval
-                next_iso = next_update_utc.isoformat()
-                self._uptime_data = {
-                    "uptime": uptime_pie_resp.get("uptime"),
-                    "downtime": uptime_pie_resp.get("downtime"),
-                    "no_data": uptime_pie_resp.get("noData"),
-                    "uptime_ratio_actual": uptime_pie_resp.get("uptime_ratio_actual"),
-                    "uptime_ratio_total": uptime_pie_resp.get("uptime_ratio_total"),
-                    "updated_at": now_iso,
-                    "next_update_at": next_iso,
-                }
-                self._last_uptime_fetch_monotonic = monotonic()
-                LOGGER.debug("Uptime data updated: %s", self._uptime_data)
+                self._store_uptime_data(uptime_pie_resp)
+                if self.log.sampled:
+                    LOGGER.debug(
+                        "Uptime data updated: %s", self.log.payload(self._uptime_data)
+                    )
             else:
                 LOGGER.warning(
                     "Uptime fetch returned unexpected type: %s",
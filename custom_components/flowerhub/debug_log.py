@@ -0,0 +1,183 @@
+"""Sampled, size-capped and rate-limited logging for coordinators."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from time import monotonic
+from typing import Any
+
+from .const import (
+    DEBUG_PAYLOAD_MAX_LENGTH,
+    DEBUG_SAMPLE_EVERY,
+    ERROR_LOG_INTERVAL,
+)
+
+REDACTED = "**REDACTED**"
+# Parts of keys whose values never appear in logs or cassettes: credentials and
+# personal data, matched case-insensitively anywhere in the key (mainEmail,
+# firstName, serialNumber)
+_REDACT_KEY_PARTS = (
+    "password",
+    "token",
+    "secret",
+    "authorization",
+    "cookie",
+    "email",
+    "phone",
+    "name",
+    "address",
+    "serial",
+)
+# Equipment and company names shown in device info and needed for replay
+_PUBLIC_NAME_KEYS = frozenset({"name", "manufacturername"})
+# Raw response bodies are summarized by size only
+_BODY_KEYS = frozenset({"json", "text"})
+_MAX_DEPTH = 4
+_MAX_ITEMS = 5
+_MAX_STRING = 200
+# Distinct repeated errors remembered per entry
+_MAX_ERROR_KEYS = 32
+
+
+def is_sensitive_key(key: str) -> bool:
+    """Return True for keys whose values must not be logged or recorded."""
+    key = key.lower()
+    if key in _PUBLIC_NAME_KEYS:
+        return False
+    return any(part in key for part in _REDACT_KEY_PARTS)
+
+
+def _redact(value: Any, depth: int = 0) -> Any:
+    """Return a redacted, truncated copy of a payload for logging."""
+    if depth >= _MAX_DEPTH:
+        return "..."
+    if not isinstance(value, (Mapping, list, tuple, str, int, float, bool)):
+        if value is None:
+            return None
+        # Client objects such as the status object
+        value = getattr(value, "__dict__", None) or str(value)
+    if isinstance(value, Mapping):
+        result = {}
+        for key, item in value.items():
+            if is_sensitive_key(str(key)):
+                result[key] = REDACTED
+            elif key in _BODY_KEYS and item:
+                result[key] = f"<{type(item).__name__}, {len(str(item))} chars>"
+            else:
+                result[key] = _redact(item, depth + 1)
+        return result
+    if isinstance(value, (list, tuple)):
+        items = [_redact(item, depth + 1) for item in value[:_MAX_ITEMS]]
+        if len(value) > _MAX_ITEMS:
+            items.append(f"... {len(value) - _MAX_ITEMS} more")
+        return items
+    if isinstance(value, str) and len(value) > _MAX_STRING:
+        return f"{value[:_MAX_STRING]}... ({len(value)} chars)"
+    return value
+
+
+class PayloadSummary:
+    """Log argument that redacts and caps a payload only when formatted."""
+
+    __slots__ = ("_payload", "_max_length")
+
+    def __init__(self, payload: Any, max_length: int) -> None:
+        self._payload = payload
+        self._max_length = max_length
+
+    def __str__(self) -> str:
+        text = repr(_redact(self._payload))
+        if len(text) > self._max_length:
+            return f"{text[: self._max_length]}... ({len(text)} chars)"
+        return text
+
+    __repr__ = __str__
+
+
+class EntryLog:
+    """Per-entry logging policy.
+
+    Payload dumps and tracebacks are only logged on every ``sample_every``-th
+    cycle, and only when debug logging is enabled. Payloads are logged as
+    redacted summaries capped at ``max_payload_length`` characters. The same
+    error is logged at most once per ERROR_LOG_INTERVAL, together with the
+    number of repeats suppressed in between.
+    """
+
+    __slots__ = (
+        "_logger",
+        "sample_every",
+        "max_payload_length",
+        "_cycle",
+        "_errors",
+    )
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sample_every: int = DEBUG_SAMPLE_EVERY,
+        max_payload_length: int = DEBUG_PAYLOAD_MAX_LENGTH,
+    ) -> None:
+        self._logger = logger
+        self.sample_every = sample_every
+        self.max_payload_length = max_payload_length
+        self._cycle = 0
+        # error key -> [monotonic time last logged, repeats suppressed since]
+        self._errors: dict[tuple[str, str], list[Any]] = {}
+
+    def start_cycle(self) -> None:
+        """Advance the sampling counter at the start of an update cycle."""
+        self._cycle += 1
+
+    @property
+    def sampled(self) -> bool:
+        """Return True when this cycle's payloads should be logged."""
+        return (
+            self._logger.isEnabledFor(logging.DEBUG)
+            and (self._cycle - 1) % self.sample_every == 0
+        )
+
+    def payload(self, payload: Any) -> PayloadSummary:
+        """Wrap a payload for lazy, redacted, size-capped formatting."""
+        return PayloadSummary(payload, self.max_payload_length)
+
+    def error_repeats(self, err: BaseException) -> int | None:
+        """Return repeats suppressed since the error was last logged.
+
+        Returns None while the same error should stay suppressed.
+        """
+        key = (type(err).__name__, str(err)[:_MAX_STRING])
+        now = monotonic()
+        seen = self._errors.get(key)
+        if seen is not None and now - seen[0] < ERROR_LOG_INTERVAL:
+            seen[1] += 1
+            return None
+        if seen is None and len(self._errors) >= _MAX_ERROR_KEYS:
+            self._errors.clear()
+        repeats = seen[1] if seen is not None else 0
+        self._errors[key] = [now, 0]
+        return repeats
+
+    def reset_errors(self) -> None:
+        """Forget logged errors after a successful update."""
+        self._errors.clear()
+
+    def configure(
+        self, sample_every: int | None = None, max_payload_length: int | None = None
+    ) -> None:
+        """Change sampling and payload caps at runtime."""
+        if sample_every is not None:
+            self.sample_every = sample_every
+            self._cycle = 0
+        if max_payload_length is not None:
+            self.max_payload_length = max_payload_length
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the logging policy for diagnostics."""
+        return {
+            "debug": self._logger.isEnabledFor(logging.DEBUG),
+            "sample_every": self.sample_every,
+            "max_payload_length": self.max_payload_length,
+            "suppressed_errors": sum(seen[1] for seen in self._errors.values()),
+        }
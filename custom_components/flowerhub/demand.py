@@ -0,0 +1,59 @@
+"""Tracking of which data categories have enabled entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+
+class DataCategory(StrEnum):
+    """Groups of coordinator data consumed by entities."""
+
+    STATUS = "status"
+    HARDWARE = "hardware"
+    UPTIME = "uptime"
+
+
+class DataDemand:
+    """Counts enabled entities per data category.
+
+    Entities register while they are added to Home Assistant; disabled
+    entities are never added, so a category without consumers has no enabled
+    entity. Until the entity platform starts tracking, every category counts
+    as wanted.
+    """
+
+    __slots__ = ("_counts", "tracking")
+
+    def __init__(self) -> None:
+        self._counts: dict[DataCategory, int] = dict.fromkeys(DataCategory, 0)
+        self.tracking = False
+
+    def start_tracking(self) -> None:
+        """Fetch only categories with consumers from now on."""
+        self.tracking = True
+
+    def add(self, category: DataCategory) -> Callable[[], None]:
+        """Register a consumer of a category; returns a callback to remove it."""
+        self._counts[category] += 1
+        removed = False
+
+        def remove() -> None:
+            nonlocal removed
+            if not removed:
+                removed = True
+                self._counts[category] -= 1
+
+        return remove
+
+    def wants(self, category: DataCategory) -> bool:
+        """Return True if data of the category should be fetched."""
+        return not self.tracking or self._counts[category] > 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return consumers per category for diagnostics."""
+        return {
+            "tracking": self.tracking,
+            "consumers": {str(category): n for category, n in self._counts.items()},
+        }
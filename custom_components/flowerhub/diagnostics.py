@@ -7,6 +7,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .fleet import async_get_fleet_aggregator
+from .rate_limiter import async_get_rate_limiter
+from .startup import async_get_startup_manager
 
 
 async def async_get_config_entry_diagnostics(
@@ -18,7 +21,7 @@ async def async_get_config_entry_diagnostics(
     client = data["client"]
 
     # Gather diagnostic information
-    coordinator_data = coordinator.data if coordinator.data else {}
+    coordinator_data = coordinator.data.as_dict() if coordinator.data else {}
 
     # Get connection status information
     connection_status = {
@@ -41,7 +44,30 @@ async def async_get_config_entry_diagnostics(
             "last_success_monotonic": getattr(
                 coordinator, "_last_success_monotonic", None
             ),
+            "error_counts": getattr(coordinator, "error_counts", None),
+            "retry_delay": getattr(coordinator, "_retry_delay", None),
+            "circuit_breaker": coordinator.circuit_breaker.as_dict()
+            if hasattr(coordinator, "circuit_breaker")
+            else None,
+            "cycle_budget": coordinator.budget.as_dict()
+            if hasattr(coordinator, "budget")
+            else None,
+            "logging": coordinator.log.as_dict()
+            if hasattr(coordinator, "log")
+            else None,
+            "demand": coordinator.demand.as_dict()
+            if hasattr(coordinator, "demand")
+            else None,
+            "cadence": coordinator.cadence.as_dict()
+            if hasattr(coordinator, "cadence")
+            else None,
         },
+        "rate_limiter": async_get_rate_limiter(hass).as_dict(),
+        "fleet": async_get_fleet_aggregator(hass).as_dict(),
+        "startup": (await async_get_startup_manager(hass)).as_dict(),
+        "client_capabilities": coordinator.capabilities.as_dict()
+        if hasattr(coordinator, "capabilities")
+        else None,
         "connection_status": connection_status,
         "client_info": {
             "asset_id": getattr(client, "asset_id", None),
@@ -52,6 +78,13 @@ async def async_get_config_entry_diagnostics(
             "battery_manufacturer": getattr(client, "battery_manufacturer", None),
         },
         "coordinator_data": coordinator_data,
+        "history": coordinator.history.as_dict()
+        if hasattr(coordinator, "history")
+        else None,
+        "uptime_tracker": coordinator.uptime_tracker.as_dict()
+        if hasattr(coordinator, "uptime_tracker")
+        else None,
+        "status_transitions": list(getattr(coordinator, "transitions", [])),
     }
 
     return diagnostics_data
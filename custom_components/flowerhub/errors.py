@@ -0,0 +1,153 @@
+"""Error classification for Flowerhub portal failures.
+
+Failures are mapped to a small set of classes, each with its own retry, backoff
+and repairs policy. Verdicts that depend only on the exception type and HTTP
+status are cached so the classification cost is paid once per error shape.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+from json import JSONDecodeError
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+
+class ErrorClass(StrEnum):
+    """Classes of portal failures."""
+
+    AUTH = "auth"
+    RATE_LIMITED = "rate_limited"
+    SERVER = "server"
+    TIMEOUT = "timeout"
+    NETWORK = "network"
+    PAYLOAD = "payload"
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorPolicy:
+    """How the coordinator reacts to a class of failure."""
+
+    # Immediate retries within the same update cycle
+    retries: int = 0
+    # Exponential backoff for the next poll; 0 keeps the normal interval
+    backoff_base: float = 0.0
+    backoff_max: float = 0.0
+    # Whether failures count towards the server_update_failures repairs issue
+    repairs: bool = True
+    # Whether failures count towards opening the portal circuit breaker
+    trips_breaker: bool = False
+
+    def next_delay(self, failures: int, interval: float) -> float | None:
+        """Return the delay before the next poll, or None for the normal interval."""
+        if not self.backoff_base or failures <= 0:
+            return None
+        delay = self.backoff_base * (2 ** (failures - 1))
+        return max(interval, min(delay, self.backoff_max))
+
+
+ERROR_POLICIES: dict[ErrorClass, ErrorPolicy] = {
+    # Auth failures are handled by re-login / reauth flow instead; logins the
+    # portal keeps rejecting are retried with backoff
+    ErrorClass.AUTH: ErrorPolicy(backoff_base=60.0, backoff_max=300.0, repairs=False),
+    ErrorClass.RATE_LIMITED: ErrorPolicy(
+        backoff_base=120.0, backoff_max=1800.0, repairs=False
+    ),
+    ErrorClass.SERVER: ErrorPolicy(
+        backoff_base=60.0, backoff_max=900.0, trips_breaker=True
+    ),
+    ErrorClass.TIMEOUT: ErrorPolicy(
+        retries=1, backoff_base=30.0, backoff_max=600.0, trips_breaker=True
+    ),
+    ErrorClass.NETWORK: ErrorPolicy(
+        retries=1, backoff_base=30.0, backoff_max=600.0, trips_breaker=True
+    ),
+    # A payload mismatch will not fix itself by polling faster or slower
+    ErrorClass.PAYLOAD: ErrorPolicy(),
+    ErrorClass.UNKNOWN: ErrorPolicy(backoff_base=60.0, backoff_max=900.0),
+}
+
+
+class PayloadMismatchError(UpdateFailed):
+    """Raised when the client returns data in an unexpected shape."""
+
+
+class AssetFetchError(UpdateFailed):
+    """Raised when the portal reports an HTTP error status for a fetch."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+_AUTH_TEXT = ("401", "403", "unauthorized", "forbidden", "token", "expired")
+_STATUS_ATTRS = ("status", "status_code", "code")
+_CACHE_SIZE = 128
+
+
+def _error_status(err: BaseException) -> int | None:
+    for attr in _STATUS_ATTRS:
+        value = getattr(err, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+class ErrorClassifier:
+    """Classify exceptions, caching verdicts per exception type and status."""
+
+    def __init__(self, auth_exception_types: tuple[type[Exception], ...] = ()):
+        self._auth_types = auth_exception_types
+        self._cache: dict[tuple[type, int | None], ErrorClass] = {}
+
+    def classify(self, err: BaseException) -> ErrorClass:
+        """Return the error class for an exception."""
+        status = _error_status(err)
+        key = (type(err), status)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        verdict = self._classify_structural(err, status)
+        if verdict is not None:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = verdict
+            return verdict
+
+        # Message heuristics depend on the instance and are not cached
+        text = str(err).lower()
+        if any(code in text for code in _AUTH_TEXT):
+            return ErrorClass.AUTH
+        return ErrorClass.UNKNOWN
+
+    def _classify_structural(
+        self, err: BaseException, status: int | None
+    ) -> ErrorClass | None:
+        if self._auth_types and isinstance(err, self._auth_types):
+            return ErrorClass.AUTH
+
+        # HTTP-style failures when a status is present
+        if status is not None:
+            if status in (401, 403):
+                return ErrorClass.AUTH
+            if status == 429:
+                return ErrorClass.RATE_LIMITED
+            if status >= 500:
+                return ErrorClass.SERVER
+
+        if isinstance(err, (TimeoutError, asyncio.TimeoutError)):
+            return ErrorClass.TIMEOUT
+        if isinstance(err, (PayloadMismatchError, ClientPayloadError, JSONDecodeError)):
+            return ErrorClass.PAYLOAD
+        if isinstance(err, (ClientConnectionError, OSError)):
+            return ErrorClass.NETWORK
+
+        name = err.__class__.__name__.lower()
+        if "auth" in name or "token" in name:
+            return ErrorClass.AUTH
+        return None
@@ -0,0 +1,141 @@
+"""Integration-wide aggregates across all Flowerhub entries."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_FLEET
+
+
+class FleetAggregator:
+    """Running fleet counts and sums, updated from per-entry deltas.
+
+    Each coordinator reports its latest status, uptime ratio and staleness.
+    The aggregator subtracts the entry's previous contribution and adds the
+    new one, so an update costs O(1) regardless of the number of entries.
+
+    The fleet sensors exist once. Entries with the fleet sensors option offer
+    to host them; the first one loaded gets them, and when it unloads they
+    move to the next entry still offering.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str | None, float | None, bool]] = {}
+        self.status_counts: Counter[str | None] = Counter()
+        self._ratio_sum = 0.0
+        self._ratio_count = 0
+        self.stale_count = 0
+        self._listeners: list[Callable[[], None]] = []
+        # Entries offering to host the fleet sensors -> adds them to the entry
+        self._sensor_hosts: dict[str, Callable[[], None]] = {}
+        self.sensor_host: str | None = None
+
+    @property
+    def entry_count(self) -> int:
+        """Return the number of entries reporting."""
+        return len(self._entries)
+
+    @property
+    def average_uptime_ratio(self) -> float | None:
+        """Return the mean uptime ratio of entries that have one."""
+        if not self._ratio_count:
+            return None
+        return self._ratio_sum / self._ratio_count
+
+    def _apply(
+        self, contribution: tuple[str | None, float | None, bool], sign: int
+    ) -> None:
+        status, ratio, stale = contribution
+        self.status_counts[status] += sign
+        if not self.status_counts[status]:
+            del self.status_counts[status]
+        if ratio is not None:
+            self._ratio_sum += sign * ratio
+            self._ratio_count += sign
+        if stale:
+            self.stale_count += sign
+
+    @callback
+    def report(
+        self, entry_id: str, status: str | None, ratio: float | None, stale: bool
+    ) -> None:
+        """Record an entry's latest values."""
+        contribution = (status, ratio, stale)
+        previous = self._entries.get(entry_id)
+        if previous == contribution:
+            return
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(contribution, 1)
+        self._entries[entry_id] = contribution
+        if not self._ratio_count:
+            # Reset float drift once no entry contributes a ratio
+            self._ratio_sum = 0.0
+        self._notify()
+
+    @callback
+    def remove(self, entry_id: str) -> None:
+        """Drop an unloaded entry from the aggregates."""
+        previous = self._entries.pop(entry_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+            if not self._ratio_count:
+                self._ratio_sum = 0.0
+            self._notify()
+
+    @callback
+    def async_offer_sensor_host(
+        self, entry_id: str, add_sensors: Callable[[], None]
+    ) -> None:
+        """Offer an entry to host the fleet sensors; the first one gets them."""
+        self._sensor_hosts[entry_id] = add_sensors
+        if self.sensor_host is None:
+            self.sensor_host = entry_id
+            add_sensors()
+
+    @callback
+    def async_release_sensor_host(self, entry_id: str) -> None:
+        """Withdraw an unloaded entry and move the sensors to the next host."""
+        self._sensor_hosts.pop(entry_id, None)
+        if self.sensor_host != entry_id:
+            return
+        self.sensor_host = next(iter(self._sensor_hosts), None)
+        if self.sensor_host is not None:
+            self._sensor_hosts[self.sensor_host]()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for aggregate changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return aggregates for diagnostics."""
+        return {
+            "entries": self.entry_count,
+            "status_counts": {str(k): v for k, v in self.status_counts.items()},
+            "average_uptime_ratio": self.average_uptime_ratio,
+            "stale": self.stale_count,
+            "sensor_host": self.sensor_host,
+        }
+
+
+def async_get_fleet_aggregator(hass: HomeAssistant) -> FleetAggregator:
+    """Return the integration-wide fleet aggregator."""
+    aggregator: FleetAggregator | None = hass.data.get(DATA_FLEET)
+    if aggregator is None:
+        aggregator = hass.data[DATA_FLEET] = FleetAggregator()
+    return aggregator
@@ -0,0 +1,111 @@
+"""Fixed-size, array-backed history of recent status and uptime samples."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Any
+
+# Distinct status strings interned per buffer; further ones are stored as unknown
+MAX_STATUS_NAMES = 64
+_UNKNOWN_STATUS = -1
+_FLAG_STALE = 1
+
+
+class SampleHistory:
+    """Ring buffer of the last ``capacity`` coordinator samples.
+
+    Samples are stored as parallel typed arrays (timestamp, status code,
+    uptime ratios, flags) preallocated at construction, so memory per entry is
+    constant regardless of uptime. Missing ratios are stored as NaN.
+    """
+
+    __slots__ = (
+        "capacity",
+        "_timestamps",
+        "_status",
+        "_ratio_actual",
+        "_ratio_total",
+        "_flags",
+        "_status_names",
+        "_status_codes",
+        "_next",
+        "_size",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._status = array("b", bytes(capacity))
+        self._ratio_actual = array("d", bytes(8 * capacity))
+        self._ratio_total = array("d", bytes(8 * capacity))
+        self._flags = array("B", bytes(capacity))
+        self._status_names: list[str] = []
+        self._status_codes: dict[str, int] = {}
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _status_code(self, status: str | None) -> int:
+        if status is None:
+            return _UNKNOWN_STATUS
+        code = self._status_codes.get(status)
+        if code is None:
+            if len(self._status_names) >= MAX_STATUS_NAMES:
+                return _UNKNOWN_STATUS
+            code = self._status_codes[status] = len(self._status_names)
+            self._status_names.append(status)
+        return code
+
+    def append(self, timestamp: float, data: Mapping[str, Any]) -> None:
+        """Record one sample taken from coordinator data."""
+        i = self._next
+        self._timestamps[i] = timestamp
+        self._status[i] = self._status_code(data.get("status"))
+        actual = data.get("uptime_ratio_actual")
+        total = data.get("uptime_ratio_total")
+        self._ratio_actual[i] = math.nan if actual is None else actual
+        self._ratio_total[i] = math.nan if total is None else total
+        self._flags[i] = _FLAG_STALE if data.get("stale") else 0
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def samples(
+        self, limit: int | None = None, since: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Return samples oldest first, optionally the last ``limit`` or newer."""
+        count = self._size if limit is None else min(limit, self._size)
+        start = (self._next - count) % self.capacity
+        result = []
+        for offset in range(count):
+            i = (start + offset) % self.capacity
+            timestamp = self._timestamps[i]
+            if since is not None and timestamp < since:
+                continue
+            code = self._status[i]
+            actual = self._ratio_actual[i]
+            total = self._ratio_total[i]
+            result.append(
+                {
+                    "timestamp": datetime.fromtimestamp(
+                        timestamp, timezone.utc
+                    ).isoformat(),
+                    "status": self._status_names[code] if code >= 0 else None,
+                    "uptime_ratio_actual": None if math.isnan(actual) else actual,
+                    "uptime_ratio_total": None if math.isnan(total) else total,
+                    "stale": bool(self._flags[i] & _FLAG_STALE),
+                }
+            )
+        return result
+
+    def as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return buffer metadata and samples for diagnostics."""
+        return {
+            "capacity": self.capacity,
+            "size": self._size,
+            "samples": self.samples(limit),
+        }
@@ -0,0 +1,192 @@
+"""Integration-wide token bucket limiting requests to the Flowerhub portal."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from enum import IntEnum
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_RATE_LIMIT,
+    DATA_RATE_LIMITER,
+    DEFAULT_RATE_LIMIT,
+    RATE_LIMIT_BURST,
+)
+
+# Portal requests made by one client readout (asset id, asset, uptime pie)
+READOUT_COST = 3
+
+
+class Priority(IntEnum):
+    """Request lanes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class _LaneStats:
+    __slots__ = ("acquired", "queued", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float) -> None:
+        self.acquired += 1
+        if waited > 0:
+            self.queued += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+
+class PortalRateLimiter:
+    """Token bucket shared by coordinators, config flows and diagnostics.
+
+    Callers over the limit are queued, not rejected. Queued interactive
+    requests (config, reauth and options flows) are always served before
+    background polls.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float = DEFAULT_RATE_LIMIT,
+        burst: float = RATE_LIMIT_BURST,
+    ) -> None:
+        self._rate = rate_per_minute / 60.0
+        self._burst = burst
+        self._tokens = burst
+        self._updated = monotonic()
+        self._lanes: dict[Priority, deque[tuple[float, asyncio.Future[None]]]] = {
+            lane: deque() for lane in Priority
+        }
+        self._stats = {lane: _LaneStats() for lane in Priority}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def rate_per_minute(self) -> float:
+        """Return the configured sustained request rate."""
+        return self._rate * 60.0
+
+    def set_rate(self, rate_per_minute: float) -> None:
+        """Change the sustained request rate."""
+        self._refill()
+        self._rate = rate_per_minute / 60.0
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+            self._schedule()
+
+    async def acquire(
+        self, priority: Priority = Priority.BACKGROUND, cost: float = 1.0
+    ) -> float:
+        """Wait for ``cost`` tokens and return the time spent queued."""
+        cost = min(cost, self._burst)
+        self._refill()
+        if self._tokens >= cost and not any(self._lanes.values()):
+            self._tokens -= cost
+            self._stats[priority].record(0.0)
+            return 0.0
+
+        start = monotonic()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append((cost, future))
+        self._schedule()
+        await future
+        waited = monotonic() - start
+        self._stats[priority].record(waited)
+        return waited
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _head(self) -> tuple[float, asyncio.Future[None]] | None:
+        for lane in Priority:
+            queue = self._lanes[lane]
+            # Drop waiters that were cancelled while queued
+            while queue and queue[0][1].done():
+                queue.popleft()
+            if queue:
+                return queue[0]
+        return None
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            return
+        head = self._head()
+        if head is None:
+            return
+        delay = max(0.0, (head[0] - self._tokens) / self._rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        self._timer = None
+        self._refill()
+        while (head := self._head()) is not None:
+            cost, future = head
+            if self._tokens < cost:
+                break
+            self._tokens -= cost
+            for lane in Priority:
+                if self._lanes[lane] and self._lanes[lane][0] is head:
+                    self._lanes[lane].popleft()
+                    break
+            future.set_result(None)
+        self._schedule()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return limiter state and per-lane wait metrics for diagnostics."""
+        self._refill()
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "lanes": {
+                lane.name.lower(): {
+                    "waiting": sum(not f.done() for _, f in self._lanes[lane]),
+                    "acquired": stats.acquired,
+                    "queued": stats.queued,
+                    "total_wait": round(stats.total_wait, 3),
+                    "max_wait": round(stats.max_wait, 3),
+                    "avg_wait": round(stats.total_wait / stats.queued, 3)
+                    if stats.queued
+                    else 0.0,
+                }
+                for lane, stats in self._stats.items()
+            },
+        }
+
+
+def async_get_rate_limiter(hass: HomeAssistant) -> PortalRateLimiter:
+    """Return the integration-wide portal rate limiter."""
+    limiter: PortalRateLimiter | None = hass.data.get(DATA_RATE_LIMITER)
+    if limiter is None:
+        limiter = hass.data[DATA_RATE_LIMITER] = PortalRateLimiter()
+    return limiter
+
+
+@callback
+def async_apply_entry_rates(
+    hass: HomeAssistant, entries: Iterable[ConfigEntry]
+) -> None:
+    """Limit the shared rate to the strictest rate set on the given entries.
+
+    The limiter is shared by all entries, so the lowest configured rate wins
+    regardless of the order entries are set up or unloaded in. Without any
+    configured rate the default applies.
+    """
+    rates = [
+        e.options[CONF_RATE_LIMIT] for e in entries if CONF_RATE_LIMIT in e.options
+    ]
+    async_get_rate_limiter(hass).set_rate(min(rates, default=DEFAULT_RATE_LIMIT))
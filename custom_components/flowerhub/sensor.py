@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from time import monotonic
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.const import (
     PERCENTAGE,
@@ -18,8 +20,13 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTime,
 )
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 
-from .const import DEFAULT_NAME, DOMAIN
+from .capabilities import ClientCapabilities, probe_client
+from .const import CONF_FLEET_SENSORS, DEFAULT_NAME, DOMAIN
+from .demand import DataCategory
+from .fleet import FleetAggregator, async_get_fleet_aggregator
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -28,34 +35,91 @@ async def async_setup_entry(hass, entry, async_add_entities):
         coordinator = data["coordinator"]
     else:
         coordinator = data  # for test
-    async_add_entities(
-        [
-            FlowerhubStatusSensor(coordinator, entry),
-            FlowerhubStatusMessageSensor(coordinator, entry),
-            FlowerhubLastUpdatedSensor(coordinator, entry),
-            FlowerhubInverterNameSensor(coordinator, entry),
-            FlowerhubBatteryNameSensor(coordinator, entry),
-            FlowerhubPowerCapacitySensor(coordinator, entry),
-            FlowerhubEnergyCapacitySensor(coordinator, entry),
-            FlowerhubFuseSizeSensor(coordinator, entry),
-            FlowerhubIsInstalledSensor(coordinator, entry),
-            FlowerhubInverterManufacturerSensor(coordinator, entry),
-            FlowerhubInverterBatteryStacksSensor(coordinator, entry),
-            FlowerhubBatteryManufacturerSensor(coordinator, entry),
-            FlowerhubBatteryMaxModulesSensor(coordinator, entry),
-            FlowerhubBatteryPowerCapacitySensor(coordinator, entry),
-            FlowerhubMonthlyUptimeRatioSensor(coordinator, entry),
-            FlowerhubMonthlyUptimeRatioTotalSensor(coordinator, entry),
-            FlowerhubMonthlyUptimeSensor(coordinator, entry),
-            FlowerhubMonthlyDowntimeSensor(coordinator, entry),
-        ],
-        True,
-    )
+
+    # Only sensors with data are created; registered ones are kept so their
+    # entity ids and history survive, and the rest are added once data appears
+    registered = {
+        registry_entry.unique_id
+        for registry_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+    }
+    demand = getattr(coordinator, "demand", None)
+    if demand is not None:
+        demand.start_tracking()
+    snapshot = coordinator.data or {}
+    entities = []
+    # Pending sensors -> removal of the demand they hold until they are added,
+    # so the data that would create them is still fetched
+    pending = {}
+    for sensor_cls in SENSOR_CLASSES:
+        entity = sensor_cls(coordinator, entry)
+        if entity.has_data(snapshot) or entity.unique_id in registered:
+            entities.append(entity)
+        else:
+            pending[entity] = demand.add(entity._data_category) if demand else None
+    async_add_entities(entities)
+
+    if pending and hasattr(coordinator, "async_add_listener"):
+
+        @callback
+        def _async_add_new_sensors() -> None:
+            snapshot = coordinator.data or {}
+            ready = [entity for entity in pending if entity.has_data(snapshot)]
+            if not ready:
+                return
+            async_add_entities(ready)
+            for entity in ready:
+                # Added entities register their own demand
+                if remove_demand := pending.pop(entity):
+                    remove_demand()
+
+        @callback
+        def _async_release_pending() -> None:
+            for remove_demand in pending.values():
+                if remove_demand:
+                    remove_demand()
+            pending.clear()
+
+        entry.async_on_unload(coordinator.async_add_listener(_async_add_new_sensors))
+        entry.async_on_unload(_async_release_pending)
+
+    if entry.options.get(CONF_FLEET_SENSORS):
+        fleet = async_get_fleet_aggregator(hass)
+
+        @callback
+        def _async_add_fleet_sensors() -> None:
+            async_add_entities(
+                [
+                    FlowerhubFleetEntriesSensor(fleet),
+                    FlowerhubFleetUptimeRatioSensor(fleet),
+                    FlowerhubFleetStaleSensor(fleet),
+                ]
+            )
+
+        # Added here only if no other entry hosts them yet
+        fleet.async_offer_sensor_host(entry.entry_id, _async_add_fleet_sensors)
+
+
+def _poll_interval(coordinator) -> float:
+    """Return the seconds between polls, following a learned portal period."""
+    poll_interval = getattr(coordinator, "poll_interval", None)
+    if isinstance(poll_interval, (int, float)):
+        return float(poll_interval)
+    try:
+        interval = getattr(coordinator, "update_interval", None)
+        return float(interval.total_seconds()) if interval else 60.0
+    except Exception:  # pragma: no cover - fallback to default interval
+        return 60.0
 
 
 class FlowerhubBaseSensor(SensorEntity):
     _attr_has_entity_name = True
     _device_model = "Powergrid balancing system"
+    # Snapshot key the sensor needs a value for; None for sensors always created
+    _data_key: str | None = None
+    # Data the sensor consumes; fetching depends on enabled consumers
+    _data_category = DataCategory.HARDWARE
 
     def __init__(self, coordinator, entry):
         self.coordinator = coordinator
@@ -67,28 +131,45 @@ class FlowerhubBaseSensor(SensorEntity):
             self.async_on_remove(
                 self.coordinator.async_add_listener(self._handle_coordinator_update)
             )
+        if hasattr(self.coordinator, "demand"):
+            self.async_on_remove(self.coordinator.demand.add(self._data_category))
 
     def _handle_coordinator_update(self):
         self.async_write_ha_state()
 
+    @property
+    def _data(self):
+        # Empty until the first refresh when no cached state was available
+        return self.coordinator.data or {}
+
+    def has_data(self, data) -> bool:
+        """Return True if the sensor has a value in the given coordinator data."""
+        return self._data_key is None or data.get(self._data_key) is not None
+
     @property
     def device_info(self):
         data = getattr(self.coordinator, "data", {}) or {}
         client = getattr(self.coordinator, "client", None)
 
+        caps = getattr(self.coordinator, "capabilities", None)
+        if client is not None and not isinstance(caps, ClientCapabilities):
+            caps = probe_client(client)
+
         # Prefer client-exposed properties; fall back to coordinator data
-        inverter_name = (
-            getattr(client, "inverter_name", None) if client else None
-        ) or data.get("inverter_name")
-        inverter_manufacturer = (
-            getattr(client, "inverter_manufacturer", None) if client else None
-        ) or data.get("inverter_manufacturer")
-        battery_name = (
-            getattr(client, "battery_name", None) if client else None
-        ) or data.get("battery_name")
-        battery_manufacturer = (
-            getattr(client, "battery_manufacturer", None) if client else None
-        ) or data.get("battery_manufacturer")
+        if caps is not None and caps.hardware_properties:
+            inverter_name = client.inverter_name or data.get("inverter_name")
+            inverter_manufacturer = client.inverter_manufacturer or data.get(
+                "inverter_manufacturer"
+            )
+            battery_name = client.battery_name or data.get("battery_name")
+            battery_manufacturer = client.battery_manufacturer or data.get(
+                "battery_manufacturer"
+            )
+        else:
+            inverter_name = data.get("inverter_name")
+            inverter_manufacturer = data.get("inverter_manufacturer")
+            battery_name = data.get("battery_name")
+            battery_manufacturer = data.get("battery_manufacturer")
 
         hw_parts = []
         if inverter_name or inverter_manufacturer:
@@ -101,8 +182,10 @@ class FlowerhubBaseSensor(SensorEntity):
             )
 
         # Optionally include asset identifiers if available on the client
-        asset_id = getattr(client, "asset_id", None) if client else None
-        asset_owner_id = getattr(client, "asset_owner_id", None) if client else None
+        asset_id = client.asset_id if caps is not None and caps.asset_id else None
+        asset_owner_id = (
+            client.asset_owner_id if caps is not None and caps.asset_owner_id else None
+        )
 
         if asset_id:
             hw_parts.append(f"Asset ID: {asset_id}")
@@ -128,6 +211,8 @@ class FlowerhubBaseSensor(SensorEntity):
 
 
 class FlowerhubStatusSensor(FlowerhubBaseSensor):
+    _data_category = DataCategory.STATUS
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -139,36 +224,33 @@ class FlowerhubStatusSensor(FlowerhubBaseSensor):
     @property
     def available(self) -> bool:
         # For connection status only: consider entity unavailable
-        # if no successful update occurred within 3x the update interval
+        # if no successful update occurred within 3x the poll interval
         coord = self.coordinator
-        try:
-            interval = getattr(coord, "update_interval", None)
-            interval_sec = float(interval.total_seconds()) if interval else 60.0
-        except Exception:  # pragma: no cover - fallback to default interval
-            interval_sec = 60.0
+        interval_sec = _poll_interval(coord)
 
         last_success = getattr(coord, "_last_success_monotonic", None)
         if last_success is None:
             return bool(getattr(coord, "last_update_success", False))
 
-        from time import monotonic
-
         age = monotonic() - last_success
         return age <= (3.0 * interval_sec)
 
     @property
     def state(self):
-        return self.coordinator.data.get("status")
+        return self._data.get("status")
 
     @property
     def extra_state_attributes(self):
         return {
-            "message": self.coordinator.data.get("message"),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "message": self._data.get("message"),
+            "last_updated": self._data.get("last_updated"),
+            "stale": self._data.get("stale", False),
         }
 
 
 class FlowerhubStatusMessageSensor(FlowerhubBaseSensor):
+    _data_category = DataCategory.STATUS
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -180,7 +262,7 @@ class FlowerhubStatusMessageSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        message = self.coordinator.data.get("message")
+        message = self._data.get("message")
         if not message:
             return None
 
@@ -192,6 +274,7 @@ class FlowerhubStatusMessageSensor(FlowerhubBaseSensor):
 
 
 class FlowerhubLastUpdatedSensor(FlowerhubBaseSensor):
+    _data_category = DataCategory.STATUS
     _device_model = "Solar System"
 
     def __init__(self, coordinator, entry):
@@ -207,12 +290,12 @@ class FlowerhubLastUpdatedSensor(FlowerhubBaseSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return the last updated timestamp."""
-        if self.coordinator.data and self.coordinator.data.get("last_updated"):
-            return datetime.fromisoformat(self.coordinator.data["last_updated"])
-        return None
+        return self._data.get("last_updated")
 
 
 class FlowerhubInverterNameSensor(FlowerhubBaseSensor):
+    _data_key = "inverter_name"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -224,10 +307,12 @@ class FlowerhubInverterNameSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        return self.coordinator.data.get("inverter_name")
+        return self._data.get("inverter_name")
 
 
 class FlowerhubBatteryNameSensor(FlowerhubBaseSensor):
+    _data_key = "battery_name"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -239,10 +324,12 @@ class FlowerhubBatteryNameSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        return self.coordinator.data.get("battery_name")
+        return self._data.get("battery_name")
 
 
 class FlowerhubPowerCapacitySensor(FlowerhubBaseSensor):
+    _data_key = "power_capacity"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -256,10 +343,12 @@ class FlowerhubPowerCapacitySensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("power_capacity")
+        return self._data.get("power_capacity")
 
 
 class FlowerhubEnergyCapacitySensor(FlowerhubBaseSensor):
+    _data_key = "energy_capacity"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -273,10 +362,12 @@ class FlowerhubEnergyCapacitySensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("energy_capacity")
+        return self._data.get("energy_capacity")
 
 
 class FlowerhubFuseSizeSensor(FlowerhubBaseSensor):
+    _data_key = "fuse_size"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -290,10 +381,12 @@ class FlowerhubFuseSizeSensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("fuse_size")
+        return self._data.get("fuse_size")
 
 
 class FlowerhubIsInstalledSensor(FlowerhubBaseSensor):
+    _data_key = "is_installed"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -305,11 +398,13 @@ class FlowerhubIsInstalledSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        is_installed = self.coordinator.data.get("is_installed")
+        is_installed = self._data.get("is_installed")
         return "Yes" if is_installed else "No"
 
 
 class FlowerhubInverterManufacturerSensor(FlowerhubBaseSensor):
+    _data_key = "inverter_manufacturer"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -321,11 +416,13 @@ class FlowerhubInverterManufacturerSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        inverter = self.coordinator.data.get("inverter", {})
+        inverter = self._data.get("inverter") or {}
         return inverter.get("manufacturerName")
 
 
 class FlowerhubInverterBatteryStacksSensor(FlowerhubBaseSensor):
+    _data_key = "inverter_battery_stacks_supported"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -337,11 +434,13 @@ class FlowerhubInverterBatteryStacksSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        inverter = self.coordinator.data.get("inverter", {})
+        inverter = self._data.get("inverter") or {}
         return inverter.get("numberOfBatteryStacksSupported")
 
 
 class FlowerhubBatteryManufacturerSensor(FlowerhubBaseSensor):
+    _data_key = "battery_manufacturer"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -353,11 +452,13 @@ class FlowerhubBatteryManufacturerSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        battery = self.coordinator.data.get("battery", {})
+        battery = self._data.get("battery") or {}
         return battery.get("manufacturerName")
 
 
 class FlowerhubBatteryMaxModulesSensor(FlowerhubBaseSensor):
+    _data_key = "battery_max_modules"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -369,11 +470,13 @@ class FlowerhubBatteryMaxModulesSensor(FlowerhubBaseSensor):
 
     @property
     def state(self):
-        battery = self.coordinator.data.get("battery", {})
+        battery = self._data.get("battery") or {}
         return battery.get("maxNumberOfBatteryModules")
 
 
 class FlowerhubBatteryPowerCapacitySensor(FlowerhubBaseSensor):
+    _data_key = "battery_power_capacity"
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -387,13 +490,16 @@ class FlowerhubBatteryPowerCapacitySensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        battery = self.coordinator.data.get("battery", {})
+        battery = self._data.get("battery") or {}
         return battery.get("powerCapacity")
 
 
 class FlowerhubMonthlyUptimeRatioSensor(FlowerhubBaseSensor):
     """Sensor for monthly uptime ratio (percentage)."""
 
+    _data_key = "uptime_ratio_actual"
+    _data_category = DataCategory.UPTIME
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -407,35 +513,36 @@ class FlowerhubMonthlyUptimeRatioSensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("uptime_ratio_actual")
+        return self._data.get("uptime_ratio_actual")
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data or {}
-        return {
+        data = self._data
+        attributes = {
             "uptime": data.get("uptime"),
             "downtime": data.get("downtime"),
             "no_data": data.get("no_data"),
             "last_updated": data.get("uptime_last_updated"),
             "next_update": data.get("uptime_next_update"),
+            "period": data.get("uptime_period"),
         }
+        # Final values of the month closed at the last rollover
+        if (previous := data.get("uptime_previous_month")) is not None:
+            attributes["previous_month"] = previous
+        # Uptime ratio per day of the month so far (daily uptime option)
+        if (daily := data.get("uptime_daily_ratio")) is not None:
+            attributes["daily"] = daily
+        return attributes
 
     @property
     def available(self) -> bool:
         coord = self.coordinator
-        try:
-            # Use main coordinator's update interval
-            interval = getattr(coord, "update_interval", None)
-            interval_sec = float(interval.total_seconds()) if interval else 60.0
-        except Exception:
-            interval_sec = 60.0
-
-        last_success = getattr(coord, "_last_uptime_fetch_monotonic", None)
+        interval_sec = _poll_interval(coord)
+
+        last_success = getattr(coord, "_last_uptime_update_monotonic", None)
         if last_success is None:
             return bool(getattr(coord, "last_update_success", False))
 
-        from time import monotonic
-
         age = monotonic() - last_success
         return age <= (3.0 * interval_sec)
 
@@ -443,6 +550,9 @@ class FlowerhubMonthlyUptimeRatioSensor(FlowerhubBaseSensor):
 class FlowerhubMonthlyUptimeSensor(FlowerhubBaseSensor):
     """Sensor for monthly uptime in seconds (diagnostic)."""
 
+    _data_key = "uptime"
+    _data_category = DataCategory.UPTIME
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -456,11 +566,11 @@ class FlowerhubMonthlyUptimeSensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("uptime")
+        return self._data.get("uptime")
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data or {}
+        data = self._data
         return {
             "last_updated": data.get("uptime_last_updated"),
             "next_update": data.get("uptime_next_update"),
@@ -469,19 +579,12 @@ class FlowerhubMonthlyUptimeSensor(FlowerhubBaseSensor):
     @property
     def available(self) -> bool:
         coord = self.coordinator
-        try:
-            # Use main coordinator's update interval
-            interval = getattr(coord, "update_interval", None)
-            interval_sec = float(interval.total_seconds()) if interval else 60.0
-        except Exception:
-            interval_sec = 60.0
-
-        last_success = getattr(coord, "_last_uptime_fetch_monotonic", None)
+        interval_sec = _poll_interval(coord)
+
+        last_success = getattr(coord, "_last_uptime_update_monotonic", None)
         if last_success is None:
             return bool(getattr(coord, "last_update_success", False))
 
-        from time import monotonic
-
         age = monotonic() - last_success
         return age <= (3.0 * interval_sec)
 
@@ -489,6 +592,9 @@ class FlowerhubMonthlyUptimeSensor(FlowerhubBaseSensor):
 class FlowerhubMonthlyUptimeRatioTotalSensor(FlowerhubBaseSensor):
     """Sensor for total monthly uptime ratio (percentage)."""
 
+    _data_key = "uptime_ratio_total"
+    _data_category = DataCategory.UPTIME
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -502,11 +608,11 @@ class FlowerhubMonthlyUptimeRatioTotalSensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("uptime_ratio_total")
+        return self._data.get("uptime_ratio_total")
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data or {}
+        data = self._data
         return {
             "uptime": data.get("uptime"),
             "downtime": data.get("downtime"),
@@ -518,19 +624,12 @@ class FlowerhubMonthlyUptimeRatioTotalSensor(FlowerhubBaseSensor):
     @property
     def available(self) -> bool:
         coord = self.coordinator
-        try:
-            # Use main coordinator's update interval
-            interval = getattr(coord, "update_interval", None)
-            interval_sec = float(interval.total_seconds()) if interval else 60.0
-        except Exception:
-            interval_sec = 60.0
-
-        last_success = getattr(coord, "_last_uptime_fetch_monotonic", None)
+        interval_sec = _poll_interval(coord)
+
+        last_success = getattr(coord, "_last_uptime_update_monotonic", None)
         if last_success is None:
             return bool(getattr(coord, "last_update_success", False))
 
-        from time import monotonic
-
         age = monotonic() - last_success
         return age <= (3.0 * interval_sec)
 
@@ -538,6 +637,9 @@ class FlowerhubMonthlyUptimeRatioTotalSensor(FlowerhubBaseSensor):
 class FlowerhubMonthlyDowntimeSensor(FlowerhubBaseSensor):
     """Sensor for monthly downtime in seconds (diagnostic)."""
 
+    _data_key = "downtime"
+    _data_category = DataCategory.UPTIME
+
     def __init__(self, coordinator, entry):
         super().__init__(coordinator, entry)
         self.entity_description = SensorEntityDescription(
@@ -551,11 +653,11 @@ class FlowerhubMonthlyDowntimeSensor(FlowerhubBaseSensor):
 
     @property
     def native_value(self):
-        return self.coordinator.data.get("downtime")
+        return self._data.get("downtime")
 
     @property
     def extra_state_attributes(self):
-        data = self.coordinator.data or {}
+        data = self._data
         return {
             "last_updated": data.get("uptime_last_updated"),
             "next_update": data.get("uptime_next_update"),
@@ -564,18 +666,106 @@ class FlowerhubMonthlyDowntimeSensor(FlowerhubBaseSensor):
     @property
     def available(self) -> bool:
         coord = self.coordinator
-        try:
-            # Use main coordinator's update interval
-            interval = getattr(coord, "update_interval", None)
-            interval_sec = float(interval.total_seconds()) if interval else 60.0
-        except Exception:
-            interval_sec = 60.0
-
-        last_success = getattr(coord, "_last_uptime_fetch_monotonic", None)
+        interval_sec = _poll_interval(coord)
+
+        last_success = getattr(coord, "_last_uptime_update_monotonic", None)
         if last_success is None:
             return bool(getattr(coord, "last_update_success", False))
 
-        from time import monotonic
-
         age = monotonic() - last_success
         return age <= (3.0 * interval_sec)
+
+
+SENSOR_CLASSES = (
+    FlowerhubStatusSensor,
+    FlowerhubStatusMessageSensor,
+    FlowerhubLastUpdatedSensor,
+    FlowerhubInverterNameSensor,
+    FlowerhubBatteryNameSensor,
+    FlowerhubPowerCapacitySensor,
+    FlowerhubEnergyCapacitySensor,
+    FlowerhubFuseSizeSensor,
+    FlowerhubIsInstalledSensor,
+    FlowerhubInverterManufacturerSensor,
+    FlowerhubInverterBatteryStacksSensor,
+    FlowerhubBatteryManufacturerSensor,
+    FlowerhubBatteryMaxModulesSensor,
+    FlowerhubBatteryPowerCapacitySensor,
+    FlowerhubMonthlyUptimeRatioSensor,
+    FlowerhubMonthlyUptimeRatioTotalSensor,
+    FlowerhubMonthlyUptimeSensor,
+    FlowerhubMonthlyDowntimeSensor,
+)
+
+
+class FlowerhubFleetSensor(SensorEntity):
+    """Integration-level sensor over all Flowerhub entries."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, fleet: FleetAggregator, key: str):
+        self._fleet = fleet
+        self.entity_description = SensorEntityDescription(
+            key=key,
+            translation_key=key,
+            state_class=SensorStateClass.MEASUREMENT,
+        )
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        super().__init__()
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._fleet.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, "fleet")},
+            "name": f"{DEFAULT_NAME} fleet",
+            "manufacturer": "Flowerhub",
+            "model": "Fleet aggregate",
+        }
+
+
+class FlowerhubFleetEntriesSensor(FlowerhubFleetSensor):
+    """Number of entries reporting, with per-status counts."""
+
+    def __init__(self, fleet: FleetAggregator):
+        super().__init__(fleet, "fleet_entries")
+
+    @property
+    def native_value(self):
+        return self._fleet.entry_count
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "status_counts": {
+                str(status): count
+                for status, count in self._fleet.status_counts.items()
+            }
+        }
+
+
+class FlowerhubFleetUptimeRatioSensor(FlowerhubFleetSensor):
+    """Average monthly uptime ratio across entries."""
+
+    def __init__(self, fleet: FleetAggregator):
+        super().__init__(fleet, "fleet_uptime_ratio")
+        self._attr_native_unit_of_measurement = PERCENTAGE
+        self._attr_suggested_display_precision = 1
+
+    @property
+    def native_value(self):
+        return self._fleet.average_uptime_ratio
+
+
+class FlowerhubFleetStaleSensor(FlowerhubFleetSensor):
+    """Number of entries whose data is stale."""
+
+    def __init__(self, fleet: FleetAggregator):
+        super().__init__(fleet, "fleet_stale_entries")
+
+    @property
+    def native_value(self):
+        return self._fleet.stale_count
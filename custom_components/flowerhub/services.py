@@ -0,0 +1,208 @@
+"""Services for the Flowerhub integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .cassette import CassetteRecorder, cassette_path
+from .const import DOMAIN, HISTORY_SIZE
+from .demand import DataCategory
+
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_SET_DEBUG_LOGGING = "set_debug_logging"
+SERVICE_RECORD_CASSETTE = "record_cassette"
+SERVICE_REFRESH = "refresh"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_LIMIT = "limit"
+ATTR_SINCE = "since"
+ATTR_ENABLED = "enabled"
+ATTR_SAMPLE_EVERY = "sample_every"
+ATTR_MAX_PAYLOAD_LENGTH = "max_payload_length"
+ATTR_DURATION = "duration"
+ATTR_DEVICE_ID = "device_id"
+ATTR_CATEGORIES = "categories"
+
+# Refresh service categories; status and asset data come from one asset fetch
+REFRESH_CATEGORIES = {
+    "status": DataCategory.STATUS,
+    "asset": DataCategory.HARDWARE,
+    "uptime": DataCategory.UPTIME,
+}
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=HISTORY_SIZE)
+        ),
+        vol.Optional(ATTR_SINCE): cv.datetime,
+    }
+)
+
+SET_DEBUG_LOGGING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_SAMPLE_EVERY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional(ATTR_MAX_PAYLOAD_LENGTH): vol.All(
+            vol.Coerce(int), vol.Range(min=100, max=100000)
+        ),
+    }
+)
+
+RECORD_CASSETTE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=3600): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=86400)
+        ),
+    }
+)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_CATEGORIES, default=list(REFRESH_CATEGORIES)): vol.All(
+            cv.ensure_list, [vol.In(REFRESH_CATEGORIES)]
+        ),
+    }
+)
+
+
+def _entries(hass: HomeAssistant, entry_id: str | None) -> dict[str, Any]:
+    entries = hass.data.get(DOMAIN, {})
+    if entry_id is None:
+        return dict(entries)
+    if entry_id not in entries:
+        raise ServiceValidationError(f"No loaded Flowerhub entry {entry_id}")
+    return {entry_id: entries[entry_id]}
+
+
+def _coordinators(hass: HomeAssistant, entry_id: str | None) -> dict[str, Any]:
+    return {eid: data["coordinator"] for eid, data in _entries(hass, entry_id).items()}
+
+
+def _targeted_coordinators(hass: HomeAssistant, call: ServiceCall) -> dict[str, Any]:
+    """Return coordinators of the entries and devices a call targets, or all."""
+    entry_ids = set(call.data.get(ATTR_CONFIG_ENTRY_ID, []))
+    device_ids = call.data.get(ATTR_DEVICE_ID, [])
+    if device_ids:
+        loaded = hass.data.get(DOMAIN, {})
+        registry = dr.async_get(hass)
+        for device_id in device_ids:
+            device = registry.async_get(device_id)
+            matches = loaded.keys() & device.config_entries if device else set()
+            if not matches:
+                raise ServiceValidationError(
+                    f"No loaded Flowerhub entry for device {device_id}"
+                )
+            entry_ids |= matches
+    if not entry_ids:
+        return _coordinators(hass, None)
+    coordinators = {}
+    for entry_id in entry_ids:
+        coordinators.update(_coordinators(hass, entry_id))
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        since = call.data.get(ATTR_SINCE)
+        since_ts = dt_util.as_utc(since).timestamp() if since else None
+        coordinators = _coordinators(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        return {
+            "entries": {
+                entry_id: coordinator.history.samples(
+                    call.data.get(ATTR_LIMIT), since_ts
+                )
+                for entry_id, coordinator in coordinators.items()
+            }
+        }
+
+    async def async_set_debug_logging(call: ServiceCall) -> None:
+        coordinators = _coordinators(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        if ATTR_ENABLED in call.data:
+            # Same effect as logger.set_level for the integration's loggers;
+            # NOTSET falls back to the configured default level
+            logging.getLogger(__package__).setLevel(
+                logging.DEBUG if call.data[ATTR_ENABLED] else logging.NOTSET
+            )
+        for coordinator in coordinators.values():
+            coordinator.log.configure(
+                call.data.get(ATTR_SAMPLE_EVERY),
+                call.data.get(ATTR_MAX_PAYLOAD_LENGTH),
+            )
+
+    async def async_record_cassette(call: ServiceCall) -> None:
+        for entry_id, data in _entries(
+            hass, call.data.get(ATTR_CONFIG_ENTRY_ID)
+        ).items():
+            recorder: CassetteRecorder | None = data.get("recorder")
+            if recorder is not None and recorder.recording:
+                raise ServiceValidationError(
+                    f"Flowerhub entry {entry_id} is already recording"
+                )
+            coordinator = data["coordinator"]
+            recorder = data["recorder"] = CassetteRecorder(
+                hass, data["client"], cassette_path(hass, entry_id)
+            )
+            recorder.start(
+                call.data[ATTR_DURATION],
+                client_version=coordinator.capabilities.version,
+                update_interval=coordinator.update_interval.total_seconds(),
+            )
+
+    async def async_refresh(call: ServiceCall) -> None:
+        categories = {REFRESH_CATEGORIES[name] for name in call.data[ATTR_CATEGORIES]}
+        coordinators = _targeted_coordinators(hass, call)
+        await asyncio.gather(
+            *(
+                coordinator.async_request_data(categories)
+                for coordinator in coordinators.values()
+            )
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, async_refresh, schema=REFRESH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD_CASSETTE,
+        async_record_cassette,
+        schema=RECORD_CASSETTE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DEBUG_LOGGING,
+        async_set_debug_logging,
+        schema=SET_DEBUG_LOGGING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,171 @@
+"""Immutable snapshot of the data published by the Flowerhub coordinator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Flattened keys derived from the inverter/battery objects: key -> (object, field)
+_HARDWARE_KEYS: dict[str, tuple[str, str]] = {
+    "inverter_name": ("inverter", "name"),
+    "inverter_manufacturer": ("inverter", "manufacturerName"),
+    "inverter_battery_stacks_supported": (
+        "inverter",
+        "numberOfBatteryStacksSupported",
+    ),
+    "power_capacity": ("inverter", "powerCapacity"),
+    "battery_name": ("battery", "name"),
+    "battery_manufacturer": ("battery", "manufacturerName"),
+    "battery_max_modules": ("battery", "maxNumberOfBatteryModules"),
+    "battery_power_capacity": ("battery", "powerCapacity"),
+    "energy_capacity": ("battery", "energyCapacity"),
+}
+# Uptime keys: key -> field of the cached uptime pie
+_UPTIME_KEYS: dict[str, str] = {
+    "uptime": "uptime",
+    "downtime": "downtime",
+    "no_data": "no_data",
+    "uptime_ratio_actual": "uptime_ratio_actual",
+    "uptime_ratio_total": "uptime_ratio_total",
+    "uptime_last_updated": "updated_at",
+    "uptime_next_update": "next_update_at",
+    "uptime_daily_ratio": "daily_uptime_ratio",
+    "uptime_period": "period",
+    "uptime_previous_month": "previous_month",
+}
+
+
+def _share(
+    new: Mapping[str, Any] | None, previous: Mapping[str, Any] | None
+) -> Mapping[str, Any] | None:
+    """Return the previous read-only object when unchanged, else wrap the new one."""
+    if not new:
+        return None
+    if previous is not None and previous == new:
+        return previous
+    return MappingProxyType(dict(new))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FlowerhubSnapshot(Mapping[str, Any]):
+    """Coordinator data for one poll.
+
+    Values keep their native types (``last_updated`` is a datetime). The
+    inverter, battery and uptime objects are read-only and shared with the
+    previous snapshot when unchanged; flattened fields are derived from them
+    on access instead of being copied. Supports read-only dict-style access
+    for entities and diagnostics.
+    """
+
+    status: str | None
+    message: str | None
+    last_updated: datetime | None
+    inverter: Mapping[str, Any] | None
+    battery: Mapping[str, Any] | None
+    fuse_size: Any
+    is_installed: Any
+    uptime_data: Mapping[str, Any] | None = None
+    # True when served from cache while the portal circuit is open
+    stale: bool = False
+
+    @classmethod
+    def from_client(
+        cls,
+        status: Any,
+        asset_info: Mapping[str, Any],
+        uptime_data: Mapping[str, Any] | None,
+        previous: FlowerhubSnapshot | None = None,
+    ) -> FlowerhubSnapshot:
+        """Build a snapshot, reusing unchanged objects from ``previous``."""
+        return cls(
+            status=status.status,
+            message=status.message,
+            last_updated=status.updated_at or None,
+            inverter=_share(
+                asset_info.get("inverter"), previous.inverter if previous else None
+            ),
+            battery=_share(
+                asset_info.get("battery"), previous.battery if previous else None
+            ),
+            fuse_size=asset_info.get("fuseSize"),
+            is_installed=asset_info.get("isInstalled"),
+            uptime_data=_share(uptime_data, previous.uptime_data if previous else None),
+        )
+
+    @classmethod
+    def from_storage(
+        cls, record: Mapping[str, Any], uptime_data: Mapping[str, Any] | None
+    ) -> FlowerhubSnapshot:
+        """Rebuild a cached snapshot saved with ``to_storage``; marked stale."""
+        last_updated = record.get("last_updated")
+        return cls(
+            status=record.get("status"),
+            message=record.get("message"),
+            last_updated=datetime.fromisoformat(last_updated) if last_updated else None,
+            inverter=_share(record.get("inverter"), None),
+            battery=_share(record.get("battery"), None),
+            fuse_size=record.get("fuse_size"),
+            is_installed=record.get("is_installed"),
+            uptime_data=_share(uptime_data, None),
+            stale=True,
+        )
+
+    def to_storage(self) -> dict[str, Any]:
+        """Return the JSON-serializable fields needed to restore entity states."""
+        return {
+            "status": self.status,
+            "message": self.message,
+            "last_updated": self.last_updated.isoformat()
+            if self.last_updated
+            else None,
+            "inverter": dict(self.inverter) if self.inverter else None,
+            "battery": dict(self.battery) if self.battery else None,
+            "fuse_size": self.fuse_size,
+            "is_installed": self.is_installed,
+        }
+
+    def with_stale(self, stale: bool = True) -> FlowerhubSnapshot:
+        """Return a copy marked as served from cache."""
+        return replace(self, stale=stale)
+
+    def with_uptime(self, uptime_data: Mapping[str, Any] | None) -> FlowerhubSnapshot:
+        """Return a copy with new uptime data."""
+        return replace(self, uptime_data=_share(uptime_data, self.uptime_data))
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _HARDWARE_KEYS:
+            obj, field = _HARDWARE_KEYS[key]
+            return (getattr(self, obj) or _EMPTY).get(field)
+        if key in _UPTIME_KEYS:
+            return (self.uptime_data or _EMPTY).get(_UPTIME_KEYS[key])
+        if key in _FIELD_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict copy, e.g. for diagnostics."""
+        return {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in self.items()
+        }
+
+
+_FIELD_KEYS = frozenset(
+    f.name for f in fields(FlowerhubSnapshot) if f.name != "uptime_data"
+)
+_KEYS = (
+    tuple(f.name for f in fields(FlowerhubSnapshot) if f.name in _FIELD_KEYS)
+    + tuple(_HARDWARE_KEYS)
+    + tuple(_UPTIME_KEYS)
+)
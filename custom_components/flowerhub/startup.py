@@ -0,0 +1,208 @@
+"""Staged, bounded-concurrency startup of Flowerhub entries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_STARTUP, DOMAIN, STARTUP_CONCURRENCY
+from .snapshot import FlowerhubSnapshot
+
+STORAGE_KEY = f"{DOMAIN}_startup"
+STORAGE_VERSION = 1
+# Cached states change only with status, message or hardware; batch the writes
+SAVE_DELAY = 60
+
+
+def _cache_key(snapshot: FlowerhubSnapshot) -> tuple[Any, ...]:
+    """Return the fields whose change warrants rewriting the cache."""
+    return (
+        snapshot.status,
+        snapshot.message,
+        snapshot.inverter,
+        snapshot.battery,
+        snapshot.fuse_size,
+        snapshot.is_installed,
+    )
+
+
+class StartupManager:
+    """Cached entity states, the priming queue and startup progress.
+
+    The last published snapshot of every entry is kept in Home Assistant
+    storage so entities can be registered with a state before the portal has
+    been contacted. Priming (login and first refresh) runs through a
+    semaphore so only a few entries talk to the portal at once, and the time
+    until the first state is available and until every entry is fresh is
+    recorded for diagnostics.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, concurrency: int = STARTUP_CONCURRENCY
+    ) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._cached: dict[str, dict[str, Any]] = {}
+        self._latest: dict[str, FlowerhubSnapshot] = {}
+        self._saved_keys: dict[str, tuple[Any, ...]] = {}
+        self._save_pending = False
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._started = monotonic()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._queued = 0
+        self._priming = 0
+
+    async def async_load(self) -> None:
+        """Load the cached entry states."""
+        if (stored := await self._store.async_load()) is not None:
+            self._cached = stored["entries"]
+
+    def cached_snapshot(
+        self, entry_id: str, uptime_data: Mapping[str, Any] | None
+    ) -> FlowerhubSnapshot | None:
+        """Return the entry's last known snapshot, marked stale."""
+        if (latest := self._latest.get(entry_id)) is not None:
+            # Reloaded entry: the in-memory snapshot is newer than storage
+            return latest.with_stale()
+        record = self._cached.get(entry_id)
+        if record is None:
+            return None
+        return FlowerhubSnapshot.from_storage(record, uptime_data)
+
+    def update(self, entry_id: str, snapshot: FlowerhubSnapshot) -> None:
+        """Remember an entry's latest snapshot; write only if its state changed."""
+        self._latest[entry_id] = snapshot
+        key = _cache_key(snapshot)
+        if self._saved_keys.get(entry_id) == key:
+            return
+        self._saved_keys[entry_id] = key
+        if not self._save_pending:
+            # Store.async_delay_save postpones a pending write on every call
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def forget(self, entry_id: str) -> None:
+        """Drop the cached state of a removed entry."""
+        self._latest.pop(entry_id, None)
+        self._saved_keys.pop(entry_id, None)
+        self._entries.pop(entry_id, None)
+        if self._cached.pop(entry_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        for entry_id, snapshot in self._latest.items():
+            self._cached[entry_id] = snapshot.to_storage()
+        return {"entries": self._cached}
+
+    def begin(self, entry_id: str, staged: bool) -> None:
+        """Start tracking an entry's setup."""
+        self._entries[entry_id] = {
+            "staged": staged,
+            "setup_started": monotonic(),
+            "state_at": None,
+            "state_after": None,
+            "fresh_at": None,
+            "fresh_after": None,
+            "error": None,
+        }
+
+    def _elapsed(self, entry_id: str) -> float | None:
+        progress = self._entries.get(entry_id)
+        if progress is None:
+            return None
+        return round(monotonic() - progress["setup_started"], 3)
+
+    def mark_state(self, entry_id: str) -> None:
+        """Record that the entry's entities have a state (cached or fresh)."""
+        if (progress := self._entries.get(entry_id)) and progress["state_at"] is None:
+            progress["state_after"] = self._elapsed(entry_id)
+            progress["state_at"] = monotonic()
+
+    def mark_fresh(self, entry_id: str) -> None:
+        """Record that the entry's first refresh succeeded."""
+        if (progress := self._entries.get(entry_id)) is None:
+            return
+        self.mark_state(entry_id)
+        progress["fresh_after"] = self._elapsed(entry_id)
+        progress["fresh_at"] = monotonic()
+        progress["error"] = None
+
+    def mark_failed(self, entry_id: str, reason: str) -> None:
+        """Record that priming the entry failed."""
+        if (progress := self._entries.get(entry_id)) is not None:
+            progress["error"] = reason
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free priming slot."""
+        self._queued += 1
+        entered = False
+        try:
+            async with self._semaphore:
+                self._queued -= 1
+                entered = True
+                self._priming += 1
+                try:
+                    yield
+                finally:
+                    self._priming -= 1
+        finally:
+            if not entered:
+                self._queued -= 1
+
+    def _since_start(self, key: str, *, last: bool) -> float | None:
+        times = [progress.get(key) for progress in self._entries.values()]
+        if not times or (last and None in times):
+            return None
+        known = [t for t in times if t is not None]
+        if not known:
+            return None
+        return round((max(known) if last else min(known)) - self._started, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return startup progress for diagnostics."""
+        return {
+            "concurrency": self.concurrency,
+            "entries": len(self._entries),
+            "queued": self._queued,
+            "priming": self._priming,
+            "fresh": sum(
+                1 for p in self._entries.values() if p["fresh_at"] is not None
+            ),
+            "failed": sum(1 for p in self._entries.values() if p["error"]),
+            "first_state_after": self._since_start("state_at", last=False),
+            "all_states_after": self._since_start("state_at", last=True),
+            "all_fresh_after": self._since_start("fresh_at", last=True),
+            "by_entry": {
+                entry_id: {
+                    key: value
+                    for key, value in progress.items()
+                    if key not in ("setup_started", "state_at", "fresh_at")
+                }
+                for entry_id, progress in self._entries.items()
+            },
+        }
+
+
+async def _async_load_manager(hass: HomeAssistant) -> StartupManager:
+    manager = StartupManager(hass)
+    await manager.async_load()
+    return manager
+
+
+async def async_get_startup_manager(hass: HomeAssistant) -> StartupManager:
+    """Return the loaded integration-wide startup manager."""
+    task: asyncio.Task[StartupManager] | None = hass.data.get(DATA_STARTUP)
+    if task is None:
+        # Concurrently set up entries share a single load
+        task = hass.data[DATA_STARTUP] = hass.async_create_task(
+            _async_load_manager(hass)
+        )
+    return await task
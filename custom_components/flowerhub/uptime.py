@@ -0,0 +1,265 @@
+"""Local month-to-date uptime accounting between portal uptime fetches."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from enum import StrEnum
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Status values (lower case) counted as up or down; anything else is no data
+UP_STATUSES = frozenset({"connected", "online"})
+DOWN_STATUSES = frozenset({"disconnected", "offline"})
+
+
+def local_period() -> str:
+    """Return the current month in Home Assistant's time zone as YYYY-MM."""
+    now = dt_util.now()
+    return f"{now.year:04d}-{now.month:02d}"
+
+
+def local_day() -> int:
+    """Return the current day of the month in Home Assistant's time zone."""
+    return dt_util.now().day
+
+
+def next_month_start(now: datetime | None = None) -> datetime:
+    """Return midnight on the first of the next month, timezone aware.
+
+    Months follow Home Assistant's configured time zone, not the host's; a
+    naive ``now`` is taken as wall time in that zone.
+    """
+    if now is None:
+        now = dt_util.now()
+    elif now.tzinfo is not None:
+        now = dt_util.as_local(now)
+    year, month = (now.year + 1, 1) if now.month == 12 else (now.year, now.month + 1)
+    return dt_util.start_of_local_day(date(year, month, 1))
+
+
+def pie_values(portal: dict[str, Any]) -> dict[str, Any]:
+    """Return uptime values named as in coordinator data from a portal pie."""
+    return {
+        "uptime": portal.get("uptime"),
+        "downtime": portal.get("downtime"),
+        "no_data": portal.get("noData"),
+        "uptime_ratio_actual": portal.get("uptime_ratio_actual"),
+        "uptime_ratio_total": portal.get("uptime_ratio_total"),
+    }
+
+
+class UptimeCategory(StrEnum):
+    """Uptime pie categories, named as in coordinator data."""
+
+    UPTIME = "uptime"
+    DOWNTIME = "downtime"
+    NO_DATA = "no_data"
+
+
+def classify_status(status: str | None) -> UptimeCategory:
+    """Return the uptime category a status sample counts towards."""
+    if status is None:
+        return UptimeCategory.NO_DATA
+    status = status.lower()
+    if status in UP_STATUSES:
+        return UptimeCategory.UPTIME
+    if status in DOWN_STATUSES:
+        return UptimeCategory.DOWNTIME
+    return UptimeCategory.NO_DATA
+
+
+def uptime_ratios(
+    uptime: float | None, downtime: float | None, no_data: float | None
+) -> tuple[float | None, float | None]:
+    """Return (actual, total) uptime ratios, computed as the client library does."""
+    total = (uptime or 0.0) + (downtime or 0.0) + (no_data or 0.0)
+    actual_total = (uptime or 0.0) + (downtime or 0.0)
+    return (
+        (uptime or 0.0) / actual_total * 100.0 if actual_total > 0 else None,
+        (uptime or 0.0) / total * 100.0 if total > 0 else None,
+    )
+
+
+class UptimeTracker:
+    """Running uptime counters: the last portal pie plus local accruals.
+
+    Each status sample holds until the next one, so the time between samples
+    is credited to the category of the earlier sample. Gaps longer than
+    ``max_gap`` (missed or failed polls) only count up to ``max_gap`` and the
+    rest is counted as no data. ``reconcile`` replaces the baseline with the
+    authoritative portal values and drops the local accruals.
+    """
+
+    __slots__ = (
+        "max_gap",
+        "period",
+        "_portal",
+        "_local",
+        "_last_time",
+        "_last_category",
+    )
+
+    def __init__(self, max_gap: float) -> None:
+        self.max_gap = max_gap
+        # Local month (YYYY-MM) the counters belong to
+        self.period: str | None = None
+        self._portal: dict[str, Any] | None = None
+        self._local = dict.fromkeys(UptimeCategory, 0.0)
+        self._last_time: float | None = None
+        self._last_category: UptimeCategory | None = None
+
+    @property
+    def has_baseline(self) -> bool:
+        """Return True once portal values have been received."""
+        return self._portal is not None
+
+    def _accrue(self, now: float) -> None:
+        if self._last_time is not None and self._last_category is not None:
+            elapsed = max(0.0, now - self._last_time)
+            held = min(elapsed, self.max_gap)
+            self._local[self._last_category] += held
+            self._local[UptimeCategory.NO_DATA] += elapsed - held
+        self._last_time = now
+
+    def record(self, now: float, status: str | None) -> None:
+        """Account the time since the previous sample and store this one."""
+        self._accrue(now)
+        self._last_category = classify_status(status)
+
+    def advance(self, now: float) -> None:
+        """Account the time up to ``now`` to the last sample's category."""
+        self._accrue(now)
+
+    def reconcile(self, now: float, portal: dict[str, Any], period: str) -> None:
+        """Adopt portal uptime values for ``period`` as the new baseline."""
+        self.period = period
+        self._portal = pie_values(portal)
+        self._local = dict.fromkeys(UptimeCategory, 0.0)
+        self._last_time = now
+
+    def rollover(self, now: float, period: str) -> None:
+        """Start counting a new month from zero."""
+        self.reconcile(now, {"uptime": 0.0, "downtime": 0.0, "noData": 0.0}, period)
+
+    def to_storage(self) -> dict[str, Any]:
+        """Return the month-to-date counters for persisting."""
+        return {
+            "period": self.period,
+            "portal": self._portal,
+            "local": {str(category): secs for category, secs in self._local.items()},
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore counters saved by ``to_storage``."""
+        self.period = stored["period"]
+        self._portal = stored["portal"]
+        self._local = {
+            category: float(stored["local"].get(category, 0.0))
+            for category in UptimeCategory
+        }
+
+    def values(self) -> dict[str, Any] | None:
+        """Return month-to-date uptime values, or None before the first fetch."""
+        if self._portal is None:
+            return None
+        local = {category: round(secs) for category, secs in self._local.items()}
+        if not any(local.values()):
+            # Nothing accrued since the fetch: report the portal values verbatim
+            return dict(self._portal)
+        uptime, downtime, no_data = (
+            (self._portal[category] or 0.0) + local[category]
+            for category in UptimeCategory
+        )
+        actual, total = uptime_ratios(uptime, downtime, no_data)
+        return {
+            "uptime": uptime,
+            "downtime": downtime,
+            "no_data": no_data,
+            "uptime_ratio_actual": actual,
+            "uptime_ratio_total": total,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return tracker state for diagnostics."""
+        return {
+            **self.to_storage(),
+            "last_category": self._last_category and str(self._last_category),
+        }
+
+
+def _day_share(end: tuple[float, ...], start: tuple[float, ...]) -> list[float]:
+    # Portal reconciles can lower local estimates; a day never goes negative
+    return [max(0.0, e - s) for e, s in zip(end, start)]
+
+
+class DailyUptime:
+    """Per-day uptime, downtime and no data seconds for the current month.
+
+    The portal only reports month-to-date totals, so a day's share is the
+    difference between the totals at the end and at the start of that day.
+    Days before today are final and cached as they are; only today's share
+    follows new totals. Days before tracking started, or while Home
+    Assistant was not running across midnight, are unknown.
+    """
+
+    __slots__ = ("period", "_final", "_day", "_start", "_last")
+
+    def __init__(self) -> None:
+        self.period: str | None = None
+        # Finalized days: day of month -> [uptime, downtime, no_data]
+        self._final: dict[int, list[float]] = {}
+        # Open day and the month-to-date totals at its start and last update
+        self._day: int | None = None
+        self._start: tuple[float, ...] = (0.0, 0.0, 0.0)
+        self._last: tuple[float, ...] = (0.0, 0.0, 0.0)
+
+    def update(self, period: str, day: int, values: dict[str, Any]) -> None:
+        """Account month-to-date ``values`` for ``day`` of ``period``."""
+        totals = tuple(
+            float(values.get(category) or 0.0) for category in UptimeCategory
+        )
+        if period != self.period:
+            self.period = period
+            self._final = {}
+            # A month followed from its first day starts from zero
+            self._start = (0.0, 0.0, 0.0) if day == 1 else totals
+        elif self._day is not None and day != self._day:
+            # Close the open day at the last totals seen before midnight
+            self._final[self._day] = _day_share(self._last, self._start)
+            self._start = self._last if day == self._day + 1 else totals
+        self._day = day
+        self._last = totals
+
+    def ratios(self) -> list[float | None]:
+        """Return the uptime ratio (actual) per day so far, None when unknown."""
+        if self._day is None:
+            return []
+        result: list[float | None] = []
+        for day in range(1, self._day + 1):
+            if day == self._day:
+                share = _day_share(self._last, self._start)
+            elif (share := self._final.get(day)) is None:
+                result.append(None)
+                continue
+            actual, _total = uptime_ratios(*share)
+            result.append(round(actual, 1) if actual is not None else None)
+        return result
+
+    def to_storage(self) -> dict[str, Any]:
+        """Return the finalized days and the open day for persisting."""
+        return {
+            "period": self.period,
+            "final": {str(day): share for day, share in self._final.items()},
+            "day": self._day,
+            "start": list(self._start),
+            "last": list(self._last),
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore state saved by ``to_storage``."""
+        self.period = stored["period"]
+        self._final = {int(day): share for day, share in stored["final"].items()}
+        self._day = stored["day"]
+        self._start = tuple(stored["start"])
+        self._last = tuple(stored["last"])
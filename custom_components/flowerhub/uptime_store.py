@@ -0,0 +1,84 @@
+"""Persistent month-to-date uptime counters per asset."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_UPTIME_STORE, DOMAIN
+
+STORAGE_KEY = f"{DOMAIN}_uptime"
+STORAGE_VERSION = 1
+# Counters change every poll; write them at most this often (and on shutdown)
+SAVE_DELAY = 300
+
+
+class UptimeStore:
+    """Month-to-date uptime counters, keyed by asset id.
+
+    Entries remember their last asset id so counters can be restored at setup,
+    before the first readout has resolved the asset.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, Any] = {"assets": {}, "entries": {}}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load stored counters."""
+        if (stored := await self._store.async_load()) is not None:
+            self._data = stored
+
+    def get(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the counters last saved for an entry's asset."""
+        asset_id = self._data["entries"].get(entry_id)
+        if asset_id is None:
+            return None
+        return self._data["assets"].get(asset_id)
+
+    def update(self, entry_id: str, asset_id: Any, record: dict[str, Any]) -> None:
+        """Replace an asset's counters and schedule a write."""
+        key = str(asset_id)
+        self._data["entries"][entry_id] = key
+        self._data["assets"][key] = record
+        self._schedule_save()
+
+    def forget(self, entry_id: str) -> None:
+        """Drop a removed entry, and its asset's counters unless still used."""
+        asset_id = self._data["entries"].pop(entry_id, None)
+        if asset_id is None:
+            return
+        if asset_id not in self._data["entries"].values():
+            self._data["assets"].pop(asset_id, None)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        if not self._save_pending:
+            # Store.async_delay_save postpones a pending write on every call
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        return self._data
+
+
+async def _async_load_store(hass: HomeAssistant) -> UptimeStore:
+    store = UptimeStore(hass)
+    await store.async_load()
+    return store
+
+
+async def async_get_uptime_store(hass: HomeAssistant) -> UptimeStore:
+    """Return the loaded integration-wide uptime store."""
+    task: asyncio.Task[UptimeStore] | None = hass.data.get(DATA_UPTIME_STORE)
+    if task is None:
+        # Concurrently set up entries share a single load
+        task = hass.data[DATA_UPTIME_STORE] = hass.async_create_task(
+            _async_load_store(hass)
+        )
+    return await task
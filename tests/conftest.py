@@ -29,9 +29,10 @@ class FakeStatus:
     def __init__(self, status=None, message=None):
         self.status = status
         self.message = message
-        from datetime import datetime
+        from datetime import datetime, timezone
 
-        self.updated_at = datetime.now()
+        # The client stamps statuses with aware UTC times
+        self.updated_at = datetime.now(timezone.utc)
 
 
 class FakeAsyncFlowerhubClient:
@@ -40,6 +41,8 @@ class FakeAsyncFlowerhubClient:
         self.flowerhub_status = FakeStatus(status="initial", message="ok")
         self._counter = 0
         self.stopped = False
+        self.periodic_interval = None
+        self.periodic_on_update = None
         self.asset_id = 75
         self.asset_owner_id = 32
         self.asset_info = {
@@ -104,7 +107,7 @@ class FakeAsyncFlowerhubClient:
         }
 
     async def async_fetch_uptime_pie(
-        self, asset_id, raise_on_error=True, timeout_total=None
+        self, asset_id, *, period=None, raise_on_error=True, timeout_total=None
     ):
         # Simulate uptime data fetch
         return {
@@ -119,8 +122,15 @@ class FakeAsyncFlowerhubClient:
             "error": None,
         }
 
+    def start_periodic_asset_fetch(
+        self, interval_seconds=60.0, run_immediately=False, on_update=None
+    ):
+        self.periodic_interval = interval_seconds
+        self.periodic_on_update = on_update
+
     def stop_periodic_asset_fetch(self):
         self.stopped = True
+        self.periodic_on_update = None
 
 
 # Inject fake module `flowerhub_portal_api_client` used by the integration
@@ -132,3 +142,20 @@ sys.modules["flowerhub_portal_api_client"] = fake_mod
 @pytest.fixture
 def fake_client_class():
     return FakeAsyncFlowerhubClient
+
+
+@pytest.fixture
+def owner_profile():
+    """Asset owner profile as returned by the portal, with personal data."""
+    return {
+        "id": 32,
+        "firstName": "Anna",
+        "lastName": "Svensson",
+        "mainEmail": "anna@example.com",
+        "contactEmail": "contact@example.com",
+        "phone": "+46701234567",
+        "address": {"street": "Storgatan 1", "postalCode": "11122", "city": "Sthlm"},
+        "accountStatus": "active",
+        "serialNumber": "FH-0042-XYZ",
+        "installer": {"id": 7, "name": "Solar AB"},
+    }
@@ -0,0 +1,185 @@
+"""Tests for learning the portal's update cadence."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import flowerhub.coordinator as coordinator_mod
+import flowerhub.sensor as sensor_mod
+import pytest
+from flowerhub.cadence import CADENCE_MAX_MISSES, CADENCE_RESOLUTION, PortalCadence
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.rate_limiter import async_get_rate_limiter
+from flowerhub.sensor import FlowerhubStatusSensor
+
+PERIOD = 300.0
+INTERVAL = 60.0
+
+
+def _update(now, offset=130.0):
+    """Content of a portal publishing new data every PERIOD from ``offset``."""
+    return (now - offset) // PERIOD
+
+
+def _poll(cadence, until, start=0.0):
+    """Poll at the fixed interval; return the time of the last poll."""
+    now = start
+    while now <= until:
+        cadence.observe(now, _update(now))
+        now += INTERVAL
+    return now - INTERVAL
+
+
+def test_period_learned_from_regular_changes():
+    cadence = PortalCadence()
+    last = _poll(cadence, 3 * PERIOD)
+    assert cadence.period is None
+    assert cadence.next_delay(last) is None
+    last = _poll(cadence, 5 * PERIOD, start=last + INTERVAL)
+    assert cadence.period == PERIOD
+
+    # The update at 1630 fell between the polls at 1620 and 1680; the next
+    # poll probes the middle of that window
+    assert last == 1500
+    assert cadence.next_delay(last) == 150
+
+
+def test_scheduled_polls_catch_updates_right_after_they_happen():
+    cadence = PortalCadence()
+    now = _poll(cadence, 5 * PERIOD)
+    polls = 0
+    delays = []
+    while now < 15 * PERIOD:
+        now += cadence.next_delay(now)
+        polls += 1
+        if cadence.observe(now, _update(now)):
+            delays.append((now - 130.0) % PERIOD)
+    # Two polls per period instead of five, each update seen within seconds
+    assert polls <= 2 * 10 + 3
+    assert len(delays) == 10
+    assert max(delays[3:]) <= CADENCE_RESOLUTION
+    assert cadence.misses == 0
+
+
+def test_irregular_changes_keep_the_fixed_interval():
+    cadence = PortalCadence()
+    for now, content in enumerate([1, 2, 2, 3, 4, 4, 4, 4, 5, 6, 6, 7]):
+        cadence.observe(now * INTERVAL, content)
+    assert cadence.period is None
+    assert cadence.next_delay(12 * INTERVAL) is None
+
+
+def test_estimate_dropped_when_portal_stops_changing():
+    cadence = PortalCadence()
+    now = _poll(cadence, 5 * PERIOD)
+    assert cadence.period == PERIOD
+    content = _update(now)
+    for _ in range(CADENCE_MAX_MISSES * 5 + 5):
+        cadence.observe(now, content)
+        now += INTERVAL
+    assert cadence.period is None
+    assert cadence.as_dict() == {
+        "period": None,
+        "window": None,
+        "changes_observed": 0,
+        "misses": 0,
+    }
+
+
+class Status:
+    def __init__(self, status):
+        self.status = status
+        self.message = "ok"
+        self.updated_at = None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_portal_data_does_not_notify_entities(hass, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(coordinator_mod, "monotonic", lambda: now[0])
+    async_get_rate_limiter(hass).set_rate(1e6)
+    client = MagicMock()
+    client.asset_id = 75
+    client.asset_info = {"fuseSize": 16}
+    client.flowerhub_status = Status("Connected")
+    coordinator = FlowerhubDataUpdateCoordinator(
+        hass,
+        client,
+        update_interval=timedelta(seconds=INTERVAL),
+        entry_id="cadence",
+        username="user",
+        password="pass",
+    )
+    coordinator._first_update = False
+    client.async_fetch_asset = AsyncMock(
+        return_value={
+            "status_code": 200,
+            "asset_info": client.asset_info,
+            "flowerhub_status": client.flowerhub_status,
+            "error": None,
+        }
+    )
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+    snapshot = coordinator.data
+    assert listener.call_count == 1
+
+    # The client stamps a new updated_at, but the portal data is the same
+    now[0] += INTERVAL
+    client.flowerhub_status = Status("Connected")
+    await coordinator.async_refresh()
+    assert coordinator.data is snapshot
+    assert listener.call_count == 1
+
+    now[0] += INTERVAL
+    client.flowerhub_status = Status("Disconnected")
+    await coordinator.async_refresh()
+    assert coordinator.data.status == "Disconnected"
+    assert listener.call_count == 2
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_status_stays_available_between_cadence_polls(hass, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(coordinator_mod, "monotonic", lambda: now[0])
+    monkeypatch.setattr(sensor_mod, "monotonic", lambda: now[0])
+    async_get_rate_limiter(hass).set_rate(1e6)
+    client = MagicMock()
+    client.asset_id = 75
+    client.asset_info = {"fuseSize": 16}
+    coordinator = FlowerhubDataUpdateCoordinator(
+        hass,
+        client,
+        update_interval=timedelta(seconds=INTERVAL),
+        entry_id="cadence",
+        username="user",
+        password="pass",
+    )
+    coordinator._first_update = False
+    client.async_fetch_asset = AsyncMock(
+        return_value={
+            "status_code": 200,
+            "asset_info": client.asset_info,
+            "flowerhub_status": None,
+            "error": None,
+        }
+    )
+    sensor = FlowerhubStatusSensor(coordinator, MagicMock(entry_id="cadence"))
+
+    gaps = []
+    while now[0] < 15 * PERIOD:
+        client.flowerhub_status = Status(f"Connected {_update(now[0])}")
+        await coordinator.async_refresh()
+        delay = coordinator.cadence.next_delay(now[0]) or INTERVAL
+        # Just before the next poll, the last update is as old as it gets
+        now[0] += delay - 1
+        gaps.append(delay)
+        assert sensor.available, f"unavailable {delay:.0f}s after a poll"
+        now[0] += 1
+
+    assert coordinator.cadence.period == PERIOD
+    # Gaps between polls are longer than three update intervals
+    assert max(gaps) > 3 * INTERVAL
+    assert coordinator.poll_interval == PERIOD
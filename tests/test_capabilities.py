@@ -0,0 +1,85 @@
+"""Tests for the one-time client capability probe."""
+
+from datetime import timedelta
+
+import pytest
+from flowerhub.capabilities import async_probe_client, probe_client
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+
+
+class MinimalClient:
+    """Client exposing only the fetch methods."""
+
+    async def async_fetch_asset(self):
+        return None
+
+
+class CallbackClient:
+    def __init__(self):
+        self.asset_id = 7
+        self.asset_info = {}
+        self.callback = None
+
+    def set_auth_error_callback(self, callback):
+        self.callback = callback
+
+    def start_periodic_asset_fetch(self, **kwargs):
+        pass
+
+    async def async_fetch_uptime_pie(self, asset_id, **kwargs):
+        return None
+
+
+class PropertyCallbackClient:
+    def __init__(self):
+        self.on_auth_error = None
+
+
+def test_probe_minimal_client():
+    caps = probe_client(MinimalClient())
+    assert caps.asset_info is False
+    assert caps.asset_id is False
+    assert caps.hardware_properties is False
+    assert caps.auth_callback is None
+    assert caps.periodic_fetch is False
+    assert caps.uptime_pie is False
+
+
+def test_probe_is_cached_per_type():
+    first = probe_client(CallbackClient())
+    assert probe_client(CallbackClient()) is first
+    assert first.auth_callback == "set_auth_error_callback"
+    assert first.periodic_fetch is True
+    assert first.uptime_pie is True
+
+
+@pytest.mark.asyncio
+async def test_async_probe_records_library_version(hass):
+    caps = await async_probe_client(hass, CallbackClient())
+    assert "version" in caps.as_dict()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_wires_auth_callback_from_profile(hass):
+    client = CallbackClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60)
+    )
+    assert client.callback == coord._on_auth_error
+
+    prop_client = PropertyCallbackClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, prop_client, update_interval=timedelta(seconds=60)
+    )
+    assert prop_client.on_auth_error == coord._on_auth_error
+
+
+@pytest.mark.asyncio
+async def test_uptime_fetch_skipped_without_capability(hass):
+    client = MinimalClient()
+    client.asset_id = 1  # set after probing; the profile says no uptime pie
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60)
+    )
+    await coord._maybe_fetch_uptime_data()
+    assert coord._uptime_data is None
@@ -0,0 +1,175 @@
+"""Tests for recording cassettes and replaying them."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+
+import flowerhub.services as services
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.cassette import REDACTED, CassetteRecorder, encode
+from flowerhub.const import DOMAIN
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.rate_limiter import async_get_rate_limiter
+from flowerhub.services import SERVICE_RECORD_CASSETTE, async_setup_services
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from replay_client import ReplayClient, decode, load_cassette
+
+
+def test_encode_redacts_and_tags_values():
+    when = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    status = type("Status", (), {})()
+    status.status = "Connected"
+    status.updated_at = when
+
+    encoded = encode(
+        {
+            "password": "hunter2",
+            "refresh_token": "abc",
+            "json": {"raw": "body"},
+            "flowerhub_status": status,
+        }
+    )
+    assert encoded["password"] == REDACTED
+    assert encoded["refresh_token"] == REDACTED
+    assert encoded["json"] is None
+    json.dumps(encoded)
+
+    decoded = decode(encoded)
+    assert decoded["flowerhub_status"].status == "Connected"
+    assert decoded["flowerhub_status"].updated_at == when
+
+
+def _coordinator(hass, client):
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60), entry_id="entry"
+    )
+    async_get_rate_limiter(hass).set_rate(1e6)
+    return coord
+
+
+@pytest.mark.asyncio
+async def test_recorded_session_replays_identically(hass, tmp_path, fake_client_class):
+    client = fake_client_class()
+    recorder = CassetteRecorder(hass, client, tmp_path / "session.jsonl.gz")
+    recorder.start(3600)
+    coord = _coordinator(hass, client)
+    recorded = []
+    for _ in range(4):
+        await coord.async_refresh()
+        recorded.append(coord.data.as_dict())
+    path = await recorder.async_stop()
+
+    # The client is restored once recording stops
+    assert "async_fetch_asset" not in vars(client)
+    header, events = load_cassette(path)
+    assert header["events"] == len(events) == 4
+    assert [e["call"] for e in events] == ["async_readout_sequence"] + [
+        "async_fetch_asset"
+    ] * 3
+
+    replay = ReplayClient(path)
+    coord = _coordinator(hass, replay)
+    replayed = []
+    for _ in range(4):
+        await coord.async_refresh()
+        replayed.append(coord.data.as_dict())
+
+    assert replay.exhausted is False
+    for before, after in zip(recorded, replayed):
+        assert after["status"] == before["status"]
+        assert after["inverter"] == before["inverter"]
+        assert after["uptime"] == before["uptime"]
+
+
+def _write_cassette(path, offsets):
+    status = {"$obj": {"status": "Connected", "message": "ok", "updated_at": None}}
+    result = {
+        "status_code": 200,
+        "asset_info": {"inverter": {}, "battery": {}},
+        "flowerhub_status": status,
+        "error": None,
+    }
+    state = {
+        "asset_id": 75,
+        "asset_owner_id": 32,
+        "asset_info": {"inverter": {}, "battery": {}},
+        "flowerhub_status": status,
+    }
+    with gzip.open(path, "wt") as file:
+        file.write(json.dumps({"version": 1}) + "\n")
+        for offset in offsets:
+            event = {"t": offset, "call": "async_fetch_asset"}
+            file.write(json.dumps({**event, "result": result, "state": state}) + "\n")
+
+
+@pytest.mark.asyncio
+async def test_replay_at_accelerated_speed(tmp_path):
+    path = tmp_path / "timed.jsonl.gz"
+    _write_cassette(path, [0.0, 1.0, 2.0])
+    replay = ReplayClient(path, speed=20)
+
+    start = monotonic()
+    for _ in range(3):
+        await replay.async_fetch_asset()
+    assert monotonic() - start >= 0.09
+    assert replay.flowerhub_status.status == "Connected"
+
+    await replay.async_fetch_asset()
+    assert replay.exhausted is True
+
+
+@pytest.mark.asyncio
+async def test_record_cassette_service(hass, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        services, "cassette_path", lambda hass, entry_id: tmp_path / f"{entry_id}.gz"
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="entry",
+        data={"username": "testuser", "password": "testpass"},
+    )
+    await async_setup_entry(hass, entry)
+    async_setup_services(hass)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_RECORD_CASSETTE, {"duration": 60}, blocking=True
+    )
+    await coordinator.async_refresh()
+
+    # Unloading the entry writes the cassette
+    assert await async_unload_entry(hass, entry)
+    header, events = load_cassette(tmp_path / "entry.gz")
+    assert header["update_interval"] == 60
+    assert [e["call"] for e in events] == ["async_fetch_asset"]
+    assert events[0]["state"]["flowerhub_status"]["$obj"]["status"] == "state_2"
+
+
+@pytest.mark.asyncio
+async def test_recorder_redacts_owner_personal_data(
+    hass, tmp_path, fake_client_class, owner_profile
+):
+    client = fake_client_class()
+    client.asset_info = {**client.asset_info, "owner": owner_profile}
+    recorder = CassetteRecorder(hass, client, tmp_path / "owner.jsonl.gz")
+    recorder.start(3600)
+    coord = _coordinator(hass, client)
+    await coord.async_refresh()
+    path = await recorder.async_stop()
+
+    with gzip.open(path, "rt") as file:
+        text = file.read()
+    personal = (
+        owner_profile["firstName"],
+        owner_profile["lastName"],
+        owner_profile["mainEmail"],
+        owner_profile["contactEmail"],
+        owner_profile["phone"],
+        owner_profile["address"]["street"],
+        owner_profile["serialNumber"],
+    )
+    assert not [value for value in personal if value in text]
+    # The inverter model still replays
+    assert "SUN2000 M1" in text
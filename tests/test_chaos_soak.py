@@ -0,0 +1,289 @@
+"""Opt-in chaos soak test measuring recovery under injected portal faults.
+
+Runs only with ``FLOWERHUB_SOAK=1``. Simulated time is compressed: the
+coordinator's clocks are patched to a fake clock that jumps to each scheduled
+update (interval or backoff delay), so days of polling run in CI time.
+Outages of random kinds and lengths are laid out on the simulated timeline
+and the fake client fails accordingly. Like Home Assistant, the soak stops
+polling when re-authentication is rejected, and reloads the entry once the
+user could complete the reauth flow.
+
+Tunables: ``FLOWERHUB_SOAK_HOURS`` (simulated duration, default 48) and
+``FLOWERHUB_SOAK_SEED`` (default 1). Metrics are printed (run with ``-s``).
+"""
+
+import asyncio
+import bisect
+import json
+import os
+import random
+from collections import Counter
+from datetime import timedelta
+from statistics import mean
+
+import flowerhub.budget as budget_mod
+import flowerhub.circuit_breaker as breaker_mod
+import flowerhub.coordinator as coordinator_mod
+import flowerhub.debug_log as debug_log_mod
+import pytest
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.rate_limiter import async_get_rate_limiter
+from homeassistant.exceptions import ConfigEntryAuthFailed
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("FLOWERHUB_SOAK"), reason="set FLOWERHUB_SOAK=1 to run"
+)
+
+INTERVAL = 60
+AUTH_KINDS = ("unauthorized", "token_expired")
+KINDS = (*AUTH_KINDS, "server", "timeout", "malformed", "slow_uptime")
+# Worst case: capped server backoff or breaker probe delay, plus one interval
+MAX_RECOVERY = 1800 + INTERVAL
+# A rejected login stops polling until the reauth flow reloads the entry,
+# which logs in once more
+MAX_LOGINS_PER_AUTH_OUTAGE = 2
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Status:
+    def __init__(self, status):
+        self.status = status
+        self.message = "ok"
+        self.updated_at = None
+
+
+class UnauthorizedError(Exception):
+    pass
+
+
+class TokenExpiredError(Exception):
+    pass
+
+
+class ChaosClient:
+    """Fails according to the outage covering the current simulated time."""
+
+    def __init__(self, clock, outages):
+        self.clock = clock
+        self.outages = outages
+        self._starts = [start for start, _end, _kind in outages]
+        self._applied = 0
+        self.token_valid = True
+        self._revoked_by = None
+        self.asset_id = 75
+        self.asset_owner_id = 32
+        self.asset_info = {"inverter": {"name": "SUN2000"}, "battery": {}}
+        self.flowerhub_status = Status("Connected")
+        self.logins = []
+        self.readouts = 0
+        # Called right before authentication errors are raised, like the
+        # real client's hook
+        self.on_auth_failed = None
+
+    def fault(self):
+        index = bisect.bisect_right(self._starts, self.clock.now) - 1
+        # Sessions are revoked or expire at the start of auth outages, even
+        # when no call falls inside the outage itself
+        for _start, _end, kind in self.outages[self._applied : index + 1]:
+            if kind in AUTH_KINDS:
+                self.token_valid = False
+                self._revoked_by = kind
+        self._applied = max(self._applied, index + 1)
+        if index < 0:
+            return None
+        _start, end, kind = self.outages[index]
+        if self.clock.now >= end:
+            return None
+        return kind
+
+    def outage_end(self):
+        """Return when the outage covering the current time ends."""
+        index = bisect.bisect_right(self._starts, self.clock.now) - 1
+        if index < 0:
+            return self.clock.now
+        return max(self.clock.now, self.outages[index][1])
+
+    def _auth_failed(self, err):
+        if self.on_auth_failed:
+            self.on_auth_failed()
+        raise err
+
+    def _check_session(self):
+        if not self.token_valid:
+            # Refreshing the token fails as well
+            if self._revoked_by == "token_expired":
+                self._auth_failed(TokenExpiredError("access token expired"))
+            self._auth_failed(UnauthorizedError("HTTP 401 unauthorized"))
+
+    async def async_login(self, username, password):
+        self.logins.append((self.clock.now, self.fault()))
+        if self.fault() == "unauthorized":
+            self._auth_failed(UnauthorizedError("Login failed (401)"))
+        self.token_valid = True
+
+    async def async_readout_sequence(self):
+        self.readouts += 1
+        await self.async_fetch_asset()
+        return {"asset_id": self.asset_id, "asset_owner_id": self.asset_owner_id}
+
+    async def async_fetch_asset(self):
+        kind = self.fault()
+        if kind == "timeout":
+            raise asyncio.TimeoutError()
+        if kind == "server":
+            return {
+                "status_code": 503,
+                "asset_info": None,
+                "flowerhub_status": None,
+                "error": "Service Unavailable",
+            }
+        if kind == "malformed":
+            return {"unexpected": True}
+        self._check_session()
+        self.flowerhub_status = Status("Connected")
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+    async def async_fetch_uptime_pie(self, asset_id, **kwargs):
+        if self.fault() == "slow_uptime":
+            # Simulated latency: the portal takes most of the cycle budget
+            self.clock.now += 45
+        return {"uptime": 1.0, "downtime": 0.0, "noData": 0.0}
+
+
+def _outages(rng, duration):
+    outages = []
+    now = rng.expovariate(1 / 1800)
+    while now < duration:
+        kind = rng.choice(KINDS)
+        length = 1.0 if kind == "token_expired" else rng.uniform(60, 1200)
+        outages.append((now, now + length, kind))
+        now += length + rng.expovariate(1 / 1800) + INTERVAL
+    return outages
+
+
+@pytest.mark.asyncio
+async def test_chaos_soak_recovers(hass, monkeypatch):
+    hours = float(os.environ.get("FLOWERHUB_SOAK_HOURS", "48"))
+    rng = random.Random(int(os.environ.get("FLOWERHUB_SOAK_SEED", "1")))
+    duration = hours * 3600
+
+    clock = FakeClock()
+    for module in (coordinator_mod, breaker_mod, budget_mod, debug_log_mod):
+        monkeypatch.setattr(module, "monotonic", clock)
+    async_get_rate_limiter(hass).set_rate(1e6)
+
+    outages = _outages(rng, duration)
+    client = ChaosClient(clock, outages)
+
+    def coordinator():
+        return FlowerhubDataUpdateCoordinator(
+            hass,
+            client,
+            update_interval=timedelta(seconds=INTERVAL),
+            entry_id="soak",
+            username="user",
+            password="pass",
+        )
+
+    coord = coordinator()
+    error_counts = Counter()
+    fresh_times = []
+    issue_raised = 0
+    issue_active = False
+    reauth_flows = 0
+    cycles = 0
+    while clock.now < duration:
+        await coord.async_refresh()
+        # Re-authentications started by the client's hook run in the background
+        await hass.async_block_till_done()
+        cycles += 1
+        if not coord.last_update_success and isinstance(
+            coord.last_exception, ConfigEntryAuthFailed
+        ):
+            # Polling stops; the user completes the reauth flow once the portal
+            # accepts the credentials again, which reloads the entry
+            reauth_flows += 1
+            error_counts.update(coord.error_counts)
+            await coord.async_shutdown()
+            clock.now = client.outage_end()
+            coord = coordinator()
+            await client.async_login("user", "pass")
+            continue
+        if coord.last_update_success and not coord.data.stale:
+            fresh_times.append(clock.now)
+        if coord._server_issue_active and not issue_active:
+            issue_raised += 1
+        issue_active = coord._server_issue_active
+        clock.now += coord._retry_delay or INTERVAL
+
+    error_counts.update(coord.error_counts)
+
+    # Time from the end of each outage until the next fresh update; rejected
+    # credentials recover when the user completes the reauth flow
+    latencies = []
+    for _start, end, kind in outages:
+        if end >= duration - MAX_RECOVERY or kind == "unauthorized":
+            continue
+        index = bisect.bisect_left(fresh_times, end)
+        assert index < len(fresh_times), f"no recovery after {kind} outage at {end}"
+        latencies.append((kind, fresh_times[index] - end))
+
+    auth_outages = sum(1 for *_, kind in outages if kind in AUTH_KINDS)
+    # Logins from the start of each auth outage until the next outage starts
+    ends = [start for start, *_ in outages[1:]] + [duration]
+    logins_per_outage = {
+        kind: [
+            sum(1 for at, _ in client.logins if start <= at < next_start)
+            for (start, _end, k), next_start in zip(outages, ends)
+            if k == kind
+        ]
+        for kind in AUTH_KINDS
+    }
+    redundant_logins = sum(max(n - 1, 0) for n in logins_per_outage["token_expired"])
+    logins_outside_auth = [
+        at for at, kind in client.logins if kind is not None and kind not in AUTH_KINDS
+    ]
+    metrics = {
+        "simulated_hours": hours,
+        "cycles": cycles,
+        "outages": len(outages),
+        "recovery_mean": round(mean(lat for _, lat in latencies), 1),
+        "recovery_max": round(max(lat for _, lat in latencies), 1),
+        "recovery_max_by_kind": {
+            kind: round(max(lat for k, lat in latencies if k == kind), 1)
+            for kind in {k for k, _ in latencies}
+        },
+        "logins": len(client.logins),
+        "redundant_logins": redundant_logins,
+        "readouts": client.readouts,
+        "redundant_readouts": max(client.readouts - 1 - auth_outages, 0),
+        "reauth_flows": reauth_flows,
+        "repairs_issue_raised": issue_raised,
+        "budget": coord.budget.as_dict(),
+        "error_counts": dict(error_counts),
+    }
+    print(json.dumps(metrics, indent=2, default=str))
+
+    assert max(lat for _, lat in latencies) <= MAX_RECOVERY
+    # Server, timeout and payload faults never trigger logins
+    assert logins_outside_auth == []
+    # An expired token costs one login, also with the client's auth hook
+    assert redundant_logins == 0
+    # Rejected logins are not retried by polling
+    assert max(logins_per_outage["unauthorized"], default=0) <= (
+        MAX_LOGINS_PER_AUTH_OUTAGE
+    )
+    # At most one repairs issue per outage, not one per failed poll
+    assert issue_raised <= len(outages)
@@ -0,0 +1,160 @@
+"""Tests for the portal circuit breaker."""
+
+from datetime import timedelta
+
+import pytest
+from flowerhub.circuit_breaker import BreakerState, CircuitBreaker
+from flowerhub.const import DOMAIN
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from homeassistant.helpers.issue_registry import async_get as ir_async_get
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+
+class ServerError(Exception):
+    def __init__(self):
+        super().__init__("server error")
+        self.status = 503
+
+
+class Status:
+    status = "Connected"
+    message = "ok"
+    updated_at = None
+
+
+class OutageClient:
+    def __init__(self):
+        self.failing = False
+        self.calls = 0
+        self.asset_id = None
+        self.asset_info = {"inverter": {}, "battery": {}}
+        self.flowerhub_status = Status()
+
+    async def async_fetch_asset(self):
+        self.calls += 1
+        if self.failing:
+            raise ServerError()
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+
+def test_breaker_opens_probes_and_backs_off(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("flowerhub.circuit_breaker.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(threshold=2, probe_delay=10, max_probe_delay=25)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow_request()
+
+    # A single probe is let through once the delay has passed
+    now[0] += 10
+    assert breaker.allow_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert not breaker.allow_request()
+
+    # Failed probe re-opens with a doubled delay
+    breaker.record_failure()
+    now[0] += 10
+    assert not breaker.allow_request()
+    now[0] += 10
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.as_dict()["probe_delay"] == 25
+
+    now[0] += 25
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.as_dict()["probe_delay"] == 10
+
+
+def test_only_the_probe_owner_ends_the_probe(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("flowerhub.circuit_breaker.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(threshold=1, probe_delay=10)
+    first, second = object(), object()
+
+    breaker.record_failure(first)
+    now[0] += 10
+    assert breaker.allow_request(first)
+    assert not breaker.allow_request(second)
+
+    # Another entry's cycle neither releases nor fails the probe
+    breaker.release_probe(second)
+    breaker.record_failure(second)
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert not breaker.allow_request(second)
+
+    breaker.record_failure(first)
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.as_dict()["probe_delay"] == 20
+    now[0] += 20
+    assert breaker.allow_request(second)
+    breaker.release_probe(first)
+    assert breaker.state is BreakerState.HALF_OPEN
+    breaker.release_probe(second)
+    assert breaker.state is BreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_serves_stale_data_with_repairs_issue(hass, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("flowerhub.circuit_breaker.monotonic", lambda: now[0])
+    client = OutageClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass,
+        client,
+        update_interval=timedelta(seconds=60),
+        entry_id="entry_1",
+        username="user",
+        password="p",
+    )
+    coord._first_update = False
+    coord.data = await coord._async_update()
+
+    client.failing = True
+    for _ in range(3):
+        with pytest.raises(UpdateFailed):
+            await coord._async_update()
+
+    ir = ir_async_get(hass)
+    issue_id = "server_update_failures_entry_1"
+    assert coord.circuit_breaker.is_open
+    assert ir.async_get_issue(DOMAIN, issue_id) is not None
+
+    # While open, the portal is not called and cached data is marked stale
+    calls = client.calls
+    data = await coord._async_update()
+    assert client.calls == calls
+    assert data["stale"] is True
+    assert data["status"] == "Connected"
+
+    # Successful half-open probe closes the breaker and clears the issue
+    client.failing = False
+    now[0] += 60
+    data = await coord._async_update()
+    assert data["stale"] is False
+    assert not coord.circuit_breaker.is_open
+    assert ir.async_get_issue(DOMAIN, issue_id) is None
+
+
+@pytest.mark.asyncio
+async def test_breaker_shared_per_account(hass):
+    a = FlowerhubDataUpdateCoordinator(
+        hass, OutageClient(), timedelta(seconds=60), entry_id="a", username="User"
+    )
+    b = FlowerhubDataUpdateCoordinator(
+        hass, OutageClient(), timedelta(seconds=60), entry_id="b", username="user"
+    )
+    c = FlowerhubDataUpdateCoordinator(
+        hass, OutageClient(), timedelta(seconds=60), entry_id="c", username="other"
+    )
+    assert a.circuit_breaker is b.circuit_breaker
+    assert a.circuit_breaker is not c.circuit_breaker
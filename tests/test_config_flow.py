@@ -47,11 +47,7 @@ async def test_config_flow_cannot_connect(hass: HomeAssistant, monkeypatch):
         async def async_readout_sequence(self):
             raise Exception("failed")
 
-    monkeypatch.setitem(
-        __import__("sys").modules,
-        "flowerhub_portal_api_client",
-        type("m", (), {"AsyncFlowerhubClient": BadClient}),
-    )
+    monkeypatch.setattr("flowerhub_portal_api_client.AsyncFlowerhubClient", BadClient)
 
     flow = ConfigFlow()
     flow.hass = hass
@@ -0,0 +1,134 @@
+"""Tests for the per-cycle update time budget."""
+
+import asyncio
+from datetime import timedelta
+
+import flowerhub.budget as budget_mod
+import pytest
+from flowerhub.budget import MIN_CYCLE_BUDGET, CycleBudget
+from flowerhub.const import RATE_LIMIT_BURST
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.errors import ErrorClass
+from flowerhub.rate_limiter import async_get_rate_limiter
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+
+def test_budget_derived_from_interval():
+    assert CycleBudget(60).total == 48
+    assert CycleBudget(5).total == MIN_CYCLE_BUDGET
+
+
+def test_overruns_and_missed_ticks(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(budget_mod, "monotonic", lambda: now[0])
+    budget = CycleBudget(60)
+
+    budget.start()
+    now[0] = 45.0
+    assert budget.remaining == 3.0
+    assert budget.allows(5.0) is False
+    budget.finish()
+    assert budget.overruns == 0
+
+    budget.start()
+    now[0] += 130.0
+    assert budget.remaining == 0.0
+    budget.finish()
+    assert budget.as_dict() == {
+        "budget": 48.0,
+        "cycles": 2,
+        "overruns": 1,
+        "missed_ticks": 2,
+        "skipped_optional": 1,
+        "last_duration": 130.0,
+        "max_duration": 130.0,
+    }
+
+
+class Status:
+    status = "Connected"
+    message = "ok"
+    updated_at = None
+
+
+class BudgetClient:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.asset_id = 75
+        self.asset_info = {"inverter": {}, "battery": {}}
+        self.flowerhub_status = Status()
+        self.uptime_calls = 0
+
+    async def async_fetch_asset(self):
+        await asyncio.sleep(self.delay)
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+    async def async_fetch_uptime_pie(self, asset_id, **kwargs):
+        self.uptime_calls += 1
+        return {"uptime": 1.0, "downtime": 0.0, "noData": 0.0}
+
+
+def _coordinator(hass, client):
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60), entry_id="entry"
+    )
+    coord._first_update = False
+    async_get_rate_limiter(hass).set_rate(1e6)
+    return coord
+
+
+@pytest.mark.asyncio
+async def test_fetch_past_budget_fails_as_timeout(hass):
+    client = BudgetClient(delay=1.0)
+    coord = _coordinator(hass, client)
+    coord.budget.total = 0.05
+
+    await coord.async_refresh()
+
+    assert coord.last_update_success is False
+    assert isinstance(coord.last_exception, UpdateFailed)
+    assert coord.error_counts[ErrorClass.TIMEOUT] == 1
+    assert coord.budget.cycles == 1
+    assert client.uptime_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_uptime_fetch_deferred_when_budget_nearly_spent(hass):
+    client = BudgetClient()
+    coord = _coordinator(hass, client)
+    coord.budget.total = 1.0
+
+    await coord.async_refresh()
+    assert coord.last_update_success is True
+    assert client.uptime_calls == 0
+    assert coord.budget.skipped_optional == 1
+    assert coord._uptime_fetch_due() is True
+
+    coord.budget.total = 48.0
+    await coord.async_refresh()
+    assert client.uptime_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_wait_does_not_use_budget(hass):
+    client = BudgetClient()
+    coord = _coordinator(hass, client)
+    coord.budget.total = 0.2
+    # Drain the limiter so the next token is half a second away
+    limiter = async_get_rate_limiter(hass)
+    limiter.set_rate(120)
+    for _ in range(RATE_LIMIT_BURST):
+        await limiter.acquire()
+
+    await coord.async_refresh()
+
+    # Queueing locally is neither a portal timeout nor a breaker failure
+    assert coord.last_update_success is True
+    assert coord.error_counts[ErrorClass.TIMEOUT] == 0
+    assert not coord._breaker.is_open
+    assert coord.budget.overruns == 0
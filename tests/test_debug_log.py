@@ -0,0 +1,112 @@
+"""Tests for sampled, redacted and rate-limited coordinator logging."""
+
+import logging
+
+import flowerhub.debug_log as debug_log
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import DOMAIN, ERROR_LOG_INTERVAL
+from flowerhub.debug_log import REDACTED, EntryLog, PayloadSummary
+from flowerhub.services import SERVICE_SET_DEBUG_LOGGING, async_setup_services
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+def test_payload_summary_is_redacted_and_capped():
+    payload = {
+        "asset_id": 75,
+        "password": "hunter2",
+        "access_token": "abc",
+        "uptime_pie_resp": {"json": {"big": "x" * 1000}, "uptime": 1.0},
+        "items": list(range(20)),
+    }
+    text = str(PayloadSummary(payload, 10000))
+    assert "hunter2" not in text and "abc" not in text
+    assert text.count(REDACTED) == 2
+    assert "<dict, " in text
+    assert "... 15 more" in text
+
+    capped = str(PayloadSummary(payload, 50))
+    assert capped.startswith(text[:50])
+    assert capped.endswith(f"({len(text)} chars)")
+
+
+def test_sampling_follows_debug_level_and_interval():
+    logger = logging.getLogger("flowerhub_test_sampling")
+    log = EntryLog(logger, sample_every=3)
+
+    logger.setLevel(logging.INFO)
+    log.start_cycle()
+    assert log.sampled is False
+
+    logger.setLevel(logging.DEBUG)
+    sampled = []
+    for _ in range(6):
+        log.start_cycle()
+        sampled.append(log.sampled)
+    assert sampled == [False, False, True, False, False, True]
+
+
+def test_repeated_errors_are_rate_limited(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(debug_log, "monotonic", lambda: now[0])
+    log = EntryLog(logging.getLogger("flowerhub_test_errors"))
+
+    assert log.error_repeats(RuntimeError("boom")) == 0
+    assert log.error_repeats(RuntimeError("boom")) is None
+    assert log.error_repeats(RuntimeError("boom")) is None
+    # A different error is logged right away
+    assert log.error_repeats(ValueError("bad")) == 0
+    assert log.as_dict()["suppressed_errors"] == 2
+
+    now[0] = ERROR_LOG_INTERVAL
+    assert log.error_repeats(RuntimeError("boom")) == 2
+
+
+@pytest.mark.asyncio
+async def test_set_debug_logging_service(hass: HomeAssistant):
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"username": "testuser", "password": "testpass"}
+    )
+    await async_setup_entry(hass, entry)
+    async_setup_services(hass)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    package_logger = logging.getLogger("flowerhub")
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_DEBUG_LOGGING,
+        {"enabled": True, "sample_every": 1, "max_payload_length": 200},
+        blocking=True,
+    )
+    assert package_logger.level == logging.DEBUG
+    assert coordinator.log.as_dict()["sample_every"] == 1
+    assert coordinator.log.max_payload_length == 200
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_DEBUG_LOGGING, {"enabled": False}, blocking=True
+    )
+    assert package_logger.level == logging.NOTSET
+    assert coordinator.log.sample_every == 1
+
+    assert await async_unload_entry(hass, entry)
+
+
+def test_owner_personal_data_is_redacted(caplog, owner_profile):
+    logger = logging.getLogger("flowerhub_test_redaction")
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        logger.debug("Owner: %s", PayloadSummary({"owner": owner_profile}, 10000))
+
+    personal = (
+        owner_profile["firstName"],
+        owner_profile["lastName"],
+        owner_profile["mainEmail"],
+        owner_profile["contactEmail"],
+        owner_profile["phone"],
+        owner_profile["address"]["street"],
+        owner_profile["serialNumber"],
+    )
+    assert not [value for value in personal if value in caplog.text]
+    # Company and equipment names stay readable
+    assert "Solar AB" in caplog.text
+    assert "active" in caplog.text
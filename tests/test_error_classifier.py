@@ -0,0 +1,167 @@
+"""Tests for the error classifier and per-class failure policies."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from aiohttp import ClientConnectionError
+from flowerhub.const import DOMAIN
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.errors import (
+    ERROR_POLICIES,
+    AssetFetchError,
+    ErrorClass,
+    ErrorClassifier,
+    PayloadMismatchError,
+)
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+class StatusError(Exception):
+    def __init__(self, status=None, message="error"):
+        super().__init__(message)
+        self.status = status
+
+
+class TokenExpiredError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "err, expected",
+    [
+        (StatusError(401), ErrorClass.AUTH),
+        (StatusError(403), ErrorClass.AUTH),
+        (StatusError(429), ErrorClass.RATE_LIMITED),
+        (StatusError(503), ErrorClass.SERVER),
+        (AssetFetchError("Asset fetch failed (HTTP 502)", 502), ErrorClass.SERVER),
+        (asyncio.TimeoutError(), ErrorClass.TIMEOUT),
+        (ClientConnectionError("reset"), ErrorClass.NETWORK),
+        (PayloadMismatchError("missing keys"), ErrorClass.PAYLOAD),
+        (TokenExpiredError("x"), ErrorClass.AUTH),
+        (Exception("Unauthorized"), ErrorClass.AUTH),
+        (Exception("boom"), ErrorClass.UNKNOWN),
+    ],
+)
+def test_classify(err, expected):
+    assert ErrorClassifier().classify(err) is expected
+
+
+def test_verdict_cached_per_type_and_status():
+    classifier = ErrorClassifier()
+    classifier.classify(StatusError(500))
+    classifier.classify(StatusError(429))
+    # Text-based verdicts depend on the instance and are not cached
+    classifier.classify(Exception("unauthorized"))
+
+    assert classifier._cache == {
+        (StatusError, 500): ErrorClass.SERVER,
+        (StatusError, 429): ErrorClass.RATE_LIMITED,
+    }
+
+
+def test_backoff_grows_and_is_capped():
+    policy = ERROR_POLICIES[ErrorClass.SERVER]
+    assert policy.next_delay(0, 60) is None
+    assert policy.next_delay(1, 60) == 60
+    assert policy.next_delay(3, 60) == 240
+    assert policy.next_delay(10, 60) == policy.backoff_max
+    assert ERROR_POLICIES[ErrorClass.PAYLOAD].next_delay(5, 60) is None
+    # Rejected logins are retried at most every five minutes
+    assert ERROR_POLICIES[ErrorClass.AUTH].next_delay(10, 60) == 300
+
+
+class TimeoutThenOkClient:
+    def __init__(self):
+        self.calls = 0
+        self.asset_info = {"inverter": {}, "battery": {}}
+        self.asset_id = None
+        self.flowerhub_status = type(
+            "S", (), {"status": "ok", "message": "ok", "updated_at": None}
+        )()
+
+    async def async_fetch_asset(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise asyncio.TimeoutError()
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+
+class RateLimitedClient(TimeoutThenOkClient):
+    async def async_fetch_asset(self):
+        self.calls += 1
+        raise StatusError(429, "too many requests")
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_retried_within_cycle(hass):
+    client = TimeoutThenOkClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60)
+    )
+    coord._first_update = False
+
+    data = await coord._async_update()
+
+    assert data["status"] == "ok"
+    assert client.calls == 2
+    assert coord.error_counts["timeout"] == 1
+    assert coord._retry_delay is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_backs_off_without_repairs(hass):
+    client = RateLimitedClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60)
+    )
+    coord._first_update = False
+    coord._repair_threshold = 1
+
+    with pytest.raises(UpdateFailed):
+        await coord._async_update()
+    first_delay = coord._retry_delay
+    with pytest.raises(UpdateFailed):
+        await coord._async_update()
+
+    assert client.calls == 2
+    assert first_delay == 120
+    assert coord._retry_delay == 240
+    assert coord.error_counts["rate_limited"] == 2
+    # Rate limiting does not count towards the server failures repairs issue
+    assert coord._consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_backoff_timer_respects_polling_guards(hass):
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, RateLimitedClient(), update_interval=timedelta(seconds=60)
+    )
+    coord._first_update = False
+    with pytest.raises(UpdateFailed):
+        await coord._async_update()
+    assert coord._retry_delay == 120
+
+    # No timer without listeners
+    coord._schedule_refresh()
+    assert coord._unsub_refresh is None
+
+    unsub = coord.async_add_listener(lambda: None)
+    coord._async_unsub_refresh()
+
+    # Nor when the user disabled polling for the entry
+    coord.config_entry = MockConfigEntry(domain=DOMAIN, pref_disable_polling=True)
+    coord._schedule_refresh()
+    assert coord._unsub_refresh is None
+
+    coord.config_entry = None
+    coord._schedule_refresh()
+    assert coord._unsub_refresh is not None
+    unsub()
+    await coord.async_shutdown()
@@ -0,0 +1,122 @@
+"""Tests for the first refresh at setup."""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+import flowerhub
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import DOMAIN, STARTUP_CONCURRENCY
+from flowerhub.fleet import async_get_fleet_aggregator
+from flowerhub.rate_limiter import async_get_rate_limiter
+from flowerhub.sensor import FlowerhubInverterManufacturerSensor, FlowerhubStatusSensor
+from flowerhub.startup import STORAGE_KEY, async_get_startup_manager
+from homeassistant.exceptions import ConfigEntryNotReady
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+def _failing(fake_client_class):
+    class FailingClient(fake_client_class):
+        async def async_readout_sequence(self):
+            raise RuntimeError("portal down")
+
+    return FailingClient
+
+
+def _slow(fake_client_class):
+    class SlowClient(fake_client_class):
+        async def async_readout_sequence(self):
+            await asyncio.sleep(10)
+
+    return SlowClient
+
+
+def _entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="entry",
+        data={"username": "testuser", "password": "testpass"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_first_refresh_without_cache_is_not_ready(
+    hass, monkeypatch, fake_client_class
+):
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", _failing(fake_client_class))
+    async_get_rate_limiter(hass).set_rate(1e6)
+
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_entry(hass, _entry())
+    assert "entry" not in hass.data.get(DOMAIN, {})
+    assert async_get_fleet_aggregator(hass).entry_count == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_first_refresh_without_cache_is_not_ready(
+    hass, monkeypatch, fake_client_class
+):
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", _slow(fake_client_class))
+    monkeypatch.setattr(flowerhub, "FIRST_REFRESH_TIMEOUT", 0.05)
+
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_entry(hass, _entry())
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_timeout_excludes_wait_for_priming_slot(hass, monkeypatch):
+    monkeypatch.setattr(flowerhub, "FIRST_REFRESH_TIMEOUT", 0.05)
+    async_get_rate_limiter(hass).set_rate(1e6)
+    manager = await async_get_startup_manager(hass)
+    entry = _entry()
+
+    async def hold_slots():
+        # Other entries priming take longer than the timeout
+        async with AsyncExitStack() as stack:
+            for _ in range(STARTUP_CONCURRENCY):
+                await stack.enter_async_context(manager.slot())
+            await asyncio.sleep(0.2)
+
+    holder = asyncio.create_task(hold_slots())
+    await asyncio.sleep(0)
+    assert await async_setup_entry(hass, entry)
+    await holder
+    assert hass.data[DOMAIN][entry.entry_id]["coordinator"].last_update_success
+
+    assert await async_unload_entry(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_failed_first_refresh_with_cache_keeps_cached_state(
+    hass, hass_storage, monkeypatch, fake_client_class
+):
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"entries": {"entry": {"status": "Connected", "message": "ok"}}},
+    }
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", _failing(fake_client_class))
+    async_get_rate_limiter(hass).set_rate(1e6)
+    entry = _entry()
+
+    # Setup does not wait for the portal
+    assert await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.last_update_success is False
+    assert coordinator.data["status"] == "Connected"
+    assert coordinator.data.stale is True
+
+    assert await async_unload_entry(hass, entry)
+
+
+class Coordinator:
+    data = None
+    last_update_success = False
+
+
+def test_sensors_tolerate_missing_data():
+    entry = _entry()
+    assert FlowerhubStatusSensor(Coordinator(), entry).state is None
+    assert FlowerhubInverterManufacturerSensor(Coordinator(), entry).state is None
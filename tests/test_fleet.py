@@ -0,0 +1,171 @@
+"""Tests for fleet aggregates across entries."""
+
+from datetime import timedelta
+
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry, config_flow, sensor
+from flowerhub.const import CONF_FLEET_SENSORS, DOMAIN
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.fleet import FleetAggregator, async_get_fleet_aggregator
+from flowerhub.rate_limiter import async_get_rate_limiter
+from flowerhub.sensor import (
+    FlowerhubFleetEntriesSensor,
+    FlowerhubFleetStaleSensor,
+    FlowerhubFleetUptimeRatioSensor,
+)
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    MockModule,
+    mock_integration,
+    mock_platform,
+)
+
+
+def test_aggregates_follow_deltas():
+    fleet = FleetAggregator()
+    fleet.report("a", "Connected", 90.0, False)
+    fleet.report("b", "Connected", 100.0, False)
+    fleet.report("c", "Disconnected", None, True)
+
+    assert fleet.entry_count == 3
+    assert fleet.status_counts == {"Connected": 2, "Disconnected": 1}
+    assert fleet.average_uptime_ratio == 95.0
+    assert fleet.stale_count == 1
+
+    # An entry's new report replaces its previous contribution
+    fleet.report("b", "Disconnected", 80.0, True)
+    assert fleet.status_counts == {"Connected": 1, "Disconnected": 2}
+    assert fleet.average_uptime_ratio == 85.0
+    assert fleet.stale_count == 2
+
+    fleet.remove("a")
+    fleet.remove("b")
+    assert fleet.entry_count == 1
+    assert fleet.average_uptime_ratio is None
+    assert fleet.status_counts == {"Disconnected": 1}
+
+
+def test_listeners_notified_only_on_change():
+    fleet = FleetAggregator()
+    calls = []
+    unsub = fleet.async_add_listener(lambda: calls.append(1))
+
+    fleet.report("a", "Connected", 90.0, False)
+    fleet.report("a", "Connected", 90.0, False)
+    assert len(calls) == 1
+
+    unsub()
+    fleet.report("a", "Disconnected", 90.0, False)
+    assert len(calls) == 1
+
+
+def test_fleet_sensors_read_aggregates():
+    fleet = FleetAggregator()
+    fleet.report("a", "Connected", 99.0, False)
+    fleet.report("b", None, None, True)
+
+    entries = FlowerhubFleetEntriesSensor(fleet)
+    assert entries.native_value == 2
+    assert entries.extra_state_attributes == {
+        "status_counts": {"Connected": 1, "None": 1}
+    }
+    assert FlowerhubFleetUptimeRatioSensor(fleet).native_value == 99.0
+    assert FlowerhubFleetStaleSensor(fleet).native_value == 1
+    assert entries.unique_id == "flowerhub_fleet_entries"
+
+
+class Status:
+    status = "Connected"
+    message = "ok"
+    updated_at = None
+
+
+class FleetClient:
+    def __init__(self):
+        self.fail = False
+        self.asset_info = {"inverter": {}, "battery": {}}
+        self.flowerhub_status = Status()
+
+    async def async_fetch_asset(self):
+        if self.fail:
+            raise RuntimeError("boom")
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_reports_to_fleet(hass):
+    client = FleetClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60), entry_id="entry"
+    )
+    coord._first_update = False
+    fleet = async_get_fleet_aggregator(hass)
+
+    await coord.async_refresh()
+    assert fleet.status_counts == {"Connected": 1}
+    assert fleet.stale_count == 0
+
+    client.fail = True
+    await coord.async_refresh()
+    assert fleet.entry_count == 1
+    assert fleet.stale_count == 1
+
+    # Recovery with unchanged portal data clears the stale mark right away
+    snapshot = coord.data
+    client.fail = False
+    await coord.async_refresh()
+    assert coord.data is snapshot
+    assert fleet.stale_count == 0
+    assert len(coord.history.samples()) == 2
+
+
+@pytest.mark.asyncio
+async def test_fleet_sensors_created_once_and_rehomed(hass, caplog):
+    async_get_rate_limiter(hass).set_rate(1e6)
+    mock_integration(
+        hass,
+        MockModule(
+            DOMAIN,
+            async_setup_entry=async_setup_entry,
+            async_unload_entry=async_unload_entry,
+        ),
+    )
+    mock_platform(hass, f"{DOMAIN}.config_flow", config_flow)
+    mock_platform(hass, f"{DOMAIN}.sensor", sensor)
+    first, second = (
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={"username": f"user{n}", "password": "pass"},
+            options={CONF_FLEET_SENSORS: True},
+        )
+        for n in (1, 2)
+    )
+    for entry in (first, second):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id(
+        "sensor", DOMAIN, "flowerhub_fleet_entries"
+    )
+    assert registry.async_get(entity_id).config_entry_id == first.entry_id
+    assert hass.states.get(entity_id).state == "2"
+    # The second entry does not add a duplicate set
+    assert "does not generate unique IDs" not in caplog.text
+
+    # Unloading the host moves the sensors to the other entry
+    assert await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+    assert registry.async_get(entity_id).config_entry_id == second.entry_id
+    assert hass.states.get(entity_id).state == "1"
+
+    assert await hass.config_entries.async_unload(second.entry_id)
+    await hass.async_block_till_done()
+    assert async_get_fleet_aggregator(hass).sensor_host is None
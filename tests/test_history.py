@@ -0,0 +1,76 @@
+"""Tests for the in-memory sample history and the get_history service."""
+
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import DOMAIN
+from flowerhub.history import MAX_STATUS_NAMES, SampleHistory
+from flowerhub.services import SERVICE_GET_HISTORY, async_setup_services
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+def test_ring_buffer_keeps_last_samples_oldest_first():
+    history = SampleHistory(3)
+    for i in range(5):
+        history.append(
+            1_700_000_000.0 + i,
+            {"status": f"state_{i}", "uptime_ratio_actual": float(i)},
+        )
+
+    samples = history.samples()
+    assert len(history) == 3
+    assert [s["status"] for s in samples] == ["state_2", "state_3", "state_4"]
+    assert samples[-1]["uptime_ratio_actual"] == 4.0
+    assert samples[-1]["uptime_ratio_total"] is None
+    assert samples[-1]["stale"] is False
+    assert [s["status"] for s in history.samples(limit=1)] == ["state_4"]
+    assert [s["status"] for s in history.samples(since=1_700_000_004.0)] == ["state_4"]
+
+
+def test_status_names_are_bounded():
+    history = SampleHistory(2)
+    for i in range(MAX_STATUS_NAMES + 1):
+        history.append(float(i), {"status": f"s{i}", "stale": True})
+
+    last = history.samples()[-1]
+    assert last["status"] is None
+    assert last["stale"] is True
+
+
+@pytest.mark.asyncio
+async def test_get_history_service_returns_samples(hass: HomeAssistant):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "testuser", "password": "testpass"},
+        options={"scan_interval": 30},
+    )
+    await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+    async_setup_services(hass)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    await coordinator.async_refresh()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        {"config_entry_id": entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    samples = response["entries"][entry.entry_id]
+    assert len(samples) == 2
+    assert samples[-1]["status"] == coordinator.data["status"]
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_HISTORY,
+            {"config_entry_id": "missing"},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert await async_unload_entry(hass, entry)
+    await hass.async_block_till_done()
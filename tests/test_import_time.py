@@ -0,0 +1,79 @@
+"""Import-time benchmark for the integration.
+
+Imports run in a fresh interpreter after the Home Assistant modules the
+integration depends on are loaded, so only the integration's own startup cost
+is measured. The import graph is checked on every run; the wall-clock budget
+depends on the machine and only runs with FLOWERHUB_IMPORT_TIME=1.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modules (outside the integration package) that may be newly imported
+MAX_NEW_MODULES = 8
+# Generous wall-clock budget for importing every integration module
+MAX_IMPORT_SECONDS = 0.5
+RUNS = 3
+
+_SCRIPT = """
+import importlib.util, json, sys, time
+if importlib.util.find_spec("flowerhub_portal_api_client") is None:
+    print(json.dumps({"missing_client": True}))
+    raise SystemExit
+import aiohttp, voluptuous
+import homeassistant.components.sensor
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.issue_registry
+import homeassistant.helpers.update_coordinator
+before = set(sys.modules)
+start = time.perf_counter()
+import flowerhub, flowerhub.config_flow, flowerhub.diagnostics, flowerhub.sensor
+elapsed = time.perf_counter() - start
+new = sorted(
+    m for m in set(sys.modules) - before
+    if m != "flowerhub" and not m.startswith("flowerhub.")
+)
+print(json.dumps({"elapsed": elapsed, "modules": new}))
+"""
+
+
+def _measure() -> dict:
+    root = Path(__file__).resolve().parents[1]
+    proc = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=root / "custom_components",
+        text=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_integration_import_graph():
+    result = _measure()
+    if result.get("missing_client"):
+        pytest.skip("flowerhub-portal-api-client is not installed")
+    modules = result["modules"]
+
+    # Everything outside the client library should already be loaded by HA
+    unexpected = [m for m in modules if not m.startswith("flowerhub_portal_api_client")]
+    assert not unexpected, f"Integration imports extra modules: {unexpected}"
+    assert len(modules) <= MAX_NEW_MODULES, modules
+
+
+@pytest.mark.skipif(
+    not os.environ.get("FLOWERHUB_IMPORT_TIME"),
+    reason="set FLOWERHUB_IMPORT_TIME=1 to run",
+)
+def test_integration_import_time():
+    results = [_measure() for _ in range(RUNS)]
+    if results[0].get("missing_client"):
+        pytest.skip("flowerhub-portal-api-client is not installed")
+    best = min(r["elapsed"] for r in results)
+    assert best <= MAX_IMPORT_SECONDS, f"Import took {best:.3f}s"
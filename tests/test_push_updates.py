@@ -0,0 +1,205 @@
+"""Tests for push mode driven by the client's periodic asset fetch."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import flowerhub
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import CONF_PUSH_UPDATES, DOMAIN
+from flowerhub.rate_limiter import async_get_rate_limiter
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+
+@pytest.mark.asyncio
+async def test_push_mode_uses_client_fetch_loop(hass: HomeAssistant):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "testuser", "password": "testpass"},
+        options={"scan_interval": 30, CONF_PUSH_UPDATES: True},
+    )
+    await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+
+    # The client's loop is started and the coordinator timer is not scheduled
+    assert client.periodic_interval == 30
+    assert callable(client.periodic_on_update)
+    coordinator.async_add_listener(lambda: None)
+    coordinator._schedule_refresh()
+    assert coordinator._unsub_refresh is None
+
+    # Simulate a tick from the client's loop delivering new data
+    await client.async_fetch_asset()
+    client.periodic_on_update(client.flowerhub_status)
+    await hass.async_block_till_done()
+    assert coordinator.data["status"] == client.flowerhub_status.status
+
+    assert await async_unload_entry(hass, entry)
+    await hass.async_block_till_done()
+    assert client.stopped is True
+    assert client.periodic_on_update is None
+
+
+@pytest.mark.asyncio
+async def test_polling_mode_does_not_start_client_loop(hass: HomeAssistant):
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"username": "testuser", "password": "testpass"}
+    )
+    await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    assert client.periodic_on_update is None
+
+    assert await async_unload_entry(hass, entry)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_push_stall_falls_back_to_polling(hass: HomeAssistant):
+    async_get_rate_limiter(hass).set_rate(1e6)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "testuser", "password": "testpass"},
+        options={"scan_interval": 30, CONF_PUSH_UPDATES: True},
+    )
+    await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    coordinator.async_add_listener(lambda: None)
+    fetch = client.async_fetch_asset
+    client.async_fetch_asset = AsyncMock(side_effect=fetch)
+
+    # Pushed updates within the deadline keep the client's loop running
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=45))
+    await hass.async_block_till_done()
+    client.periodic_on_update(client.flowerhub_status)
+    await hass.async_block_till_done()
+    assert client.stopped is False
+    assert client.async_fetch_asset.await_count == 0
+
+    # Silence for two intervals stops the loop and polls instead
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=150))
+    await hass.async_block_till_done()
+    assert client.stopped is True
+    assert client.async_fetch_asset.await_count == 1
+    assert coordinator.last_update_success
+
+    # The successful poll hands ticks back to the client's loop
+    assert callable(client.periodic_on_update)
+    assert coordinator._unsub_refresh is None
+
+    assert await async_unload_entry(hass, entry)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_client_auth_failures_trigger_reauth(
+    hass: HomeAssistant, monkeypatch, fake_client_class
+):
+    class AuthHookClient(fake_client_class):
+        def __init__(self, session=None):
+            super().__init__(session)
+            self.on_auth_failed = None
+            self.logins = 0
+
+        async def async_login(self, username, password):
+            self.logins += 1
+
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", AuthHookClient)
+    async_get_rate_limiter(hass).set_rate(1e6)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "testuser", "password": "testpass"},
+        options={"scan_interval": 30, CONF_PUSH_UPDATES: True},
+    )
+    await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    assert client.on_auth_failed == coordinator._on_auth_error
+
+    logins = client.logins
+    client.on_auth_failed()
+    await hass.async_block_till_done()
+    assert client.logins == logins + 1
+
+    assert await async_unload_entry(hass, entry)
+    await hass.async_block_till_done()
+    assert client.on_auth_failed is None
+
+
+@pytest.mark.asyncio
+async def test_auth_callback_during_poll_does_not_log_in_twice(
+    hass: HomeAssistant, monkeypatch, fake_client_class
+):
+    class HookFiringClient(fake_client_class):
+        """Calls on_auth_failed right before raising, like the real client."""
+
+        def __init__(self, session=None):
+            super().__init__(session)
+            self.on_auth_failed = None
+            self.expired = False
+            self.rejected = False
+            self.logins = 0
+            self.readouts = 0
+
+        def _fail(self, message):
+            if self.on_auth_failed:
+                self.on_auth_failed()
+            raise RuntimeError(message)
+
+        async def async_login(self, username, password):
+            self.logins += 1
+            if self.rejected:
+                self._fail("Login failed (401). Invalid credentials")
+            self.expired = False
+
+        async def async_readout_sequence(self):
+            self.readouts += 1
+            return await super().async_readout_sequence()
+
+        async def async_fetch_asset(self):
+            if self.expired:
+                self._fail("Authentication token expired and refresh failed")
+            return await super().async_fetch_asset()
+
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", HookFiringClient)
+    async_get_rate_limiter(hass).set_rate(1e6)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "testuser", "password": "testpass"},
+        options={"scan_interval": 30},
+    )
+    entry.add_to_hass(hass)
+    await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    assert client.on_auth_failed == coordinator._on_auth_error
+    logins, readouts = client.logins, client.readouts
+
+    # A token expiry is recovered by the poll's own re-login
+    client.expired = True
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.last_update_success
+    assert (client.logins, client.readouts) == (logins + 1, readouts + 1)
+
+    # A rejected login costs one attempt per failed poll
+    client.expired = client.rejected = True
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not coordinator.last_update_success
+    assert client.logins == logins + 2
+
+    assert await async_unload_entry(hass, entry)
@@ -0,0 +1,95 @@
+"""Tests for the integration-wide portal rate limiter."""
+
+import asyncio
+
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT, DOMAIN
+from flowerhub.rate_limiter import (
+    PortalRateLimiter,
+    Priority,
+    async_get_rate_limiter,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+@pytest.mark.asyncio
+async def test_burst_is_served_immediately():
+    limiter = PortalRateLimiter(rate_per_minute=60, burst=3)
+
+    for _ in range(3):
+        assert await limiter.acquire() == 0.0
+
+    stats = limiter.as_dict()["lanes"]["background"]
+    assert stats["acquired"] == 3
+    assert stats["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_callers_over_limit_are_queued_with_interactive_first():
+    # 600/min -> one token every 0.1s
+    limiter = PortalRateLimiter(rate_per_minute=600, burst=1)
+    await limiter.acquire()
+
+    order: list[str] = []
+
+    async def _call(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    background = asyncio.ensure_future(_call("poll", Priority.BACKGROUND))
+    await asyncio.sleep(0)
+    interactive = asyncio.ensure_future(_call("flow", Priority.INTERACTIVE))
+    await asyncio.gather(background, interactive)
+
+    # Neither caller was rejected and the interactive flow jumped the queue
+    assert order == ["flow", "poll"]
+    lanes = limiter.as_dict()["lanes"]
+    assert lanes["interactive"]["queued"] == 1
+    assert lanes["background"]["queued"] == 1
+    assert lanes["background"]["max_wait"] >= lanes["interactive"]["max_wait"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped():
+    limiter = PortalRateLimiter(rate_per_minute=600, burst=1)
+    await limiter.acquire()
+
+    cancelled = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await asyncio.wait_for(limiter.acquire(), 1) > 0
+    assert limiter.as_dict()["lanes"]["background"]["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_shared_per_hass(hass):
+    limiter = async_get_rate_limiter(hass)
+    limiter.set_rate(30)
+
+    assert async_get_rate_limiter(hass) is limiter
+    assert limiter.rate_per_minute == 30
+
+
+@pytest.mark.asyncio
+async def test_strictest_entry_rate_applies(hass):
+    limiter = async_get_rate_limiter(hass)
+    slow, fast = (
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={"username": f"user{rate}", "password": "pass"},
+            options={CONF_RATE_LIMIT: rate},
+        )
+        for rate in (30, 120)
+    )
+    for entry in (slow, fast):
+        entry.add_to_hass(hass)
+        assert await async_setup_entry(hass, entry)
+    # The entry set up last does not override a stricter rate
+    assert limiter.rate_per_minute == 30
+
+    assert await async_unload_entry(hass, slow)
+    assert limiter.rate_per_minute == 120
+    assert await async_unload_entry(hass, fast)
+    assert limiter.rate_per_minute == DEFAULT_RATE_LIMIT
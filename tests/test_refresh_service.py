@@ -0,0 +1,97 @@
+"""Tests for the refresh service."""
+
+from datetime import timedelta
+
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import DOMAIN, REFRESH_MIN_SPACING
+from flowerhub.rate_limiter import async_get_rate_limiter
+from flowerhub.services import SERVICE_REFRESH, async_setup_services
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+
+async def _setup(hass):
+    async_get_rate_limiter(hass).set_rate(1e6)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="entry",
+        data={"username": "testuser", "password": "testpass"},
+    )
+    entry.add_to_hass(hass)
+    await async_setup_entry(hass, entry)
+    async_setup_services(hass)
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    calls = []
+    for name in ("async_fetch_asset", "async_fetch_uptime_pie"):
+        method = getattr(client, name)
+
+        async def counted(*args, _name=name, _method=method, **kwargs):
+            calls.append(_name)
+            return await _method(*args, **kwargs)
+
+        setattr(client, name, counted)
+    return entry, calls
+
+
+@pytest.mark.asyncio
+async def test_refresh_requests_are_merged_and_spaced(hass):
+    entry, calls = await _setup(hass)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REFRESH,
+        {"config_entry_id": entry.entry_id, "categories": ["status"]},
+        blocking=True,
+    )
+    assert calls == ["async_fetch_asset"]
+    status = coordinator.data.status
+
+    # Requests within the minimum spacing wait and share one refresh
+    for categories in (["status"], ["asset", "uptime"]):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, {"categories": categories}, blocking=True
+        )
+    assert calls == ["async_fetch_asset"]
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=REFRESH_MIN_SPACING + 1)
+    )
+    await hass.async_block_till_done()
+    assert calls == ["async_fetch_asset", "async_fetch_asset", "async_fetch_uptime_pie"]
+    assert coordinator.data.status != status
+
+    assert await async_unload_entry(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_refresh_uptime_for_device(hass):
+    entry, calls = await _setup(hass)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, entry.entry_id)}
+    )
+    fetched_at = coordinator.data["uptime_last_updated"]
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REFRESH,
+        {"device_id": device.id, "categories": "uptime"},
+        blocking=True,
+    )
+    # Only the uptime pie is fetched, and published without a status poll
+    assert calls == ["async_fetch_uptime_pie"]
+    assert coordinator.data["uptime_last_updated"] > fetched_at
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, {"device_id": "unknown"}, blocking=True
+        )
+
+    assert await async_unload_entry(hass, entry)
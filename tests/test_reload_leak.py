@@ -0,0 +1,163 @@
+"""Reloading an entry many times must not leak tasks, timers or memory."""
+
+import asyncio
+import gc
+import tracemalloc
+from pathlib import Path
+
+import flowerhub
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry, config_flow, sensor
+from flowerhub.const import DOMAIN
+from flowerhub.rate_limiter import async_get_rate_limiter
+from homeassistant.exceptions import ConfigEntryNotReady
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    MockModule,
+    mock_integration,
+    mock_platform,
+)
+
+RELOADS = 200
+RETRIES = 50
+TRACED_RELOADS = 50
+WARMUP = 20
+# Allocations from the integration's own modules that may survive reloads
+MAX_MEMORY_GROWTH = 16 * 1024
+PACKAGE_FILES = str(Path(flowerhub.__file__).parent / "*")
+
+
+def _client_with_auth_hook(fake_client_class):
+    class HookedClient(fake_client_class):
+        def __init__(self, session=None):
+            super().__init__(session)
+            self.auth_error_callback = None
+
+        def set_auth_error_callback(self, callback):
+            self.auth_error_callback = callback
+
+    return HookedClient
+
+
+def _resources(hass):
+    """Return live tasks, pending timers and bus listeners."""
+    return {
+        "tasks": len([task for task in asyncio.all_tasks() if not task.done()]),
+        "timers": len([h for h in hass.loop._scheduled if not h.cancelled()]),
+        "listeners": sum(hass.bus.async_listeners().values()),
+    }
+
+
+def _package_memory():
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(True, PACKAGE_FILES)]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+@pytest.mark.asyncio
+async def test_reloads_release_all_resources(hass, monkeypatch, fake_client_class):
+    client_class = _client_with_auth_hook(fake_client_class)
+    # Clients stay referenced, like a client whose own fetch loop outlives
+    # the entry, so a coordinator still hooked into one is caught as a leak
+    clients = []
+
+    def _client(session=None):
+        clients.append(client_class(session))
+        return clients[-1]
+
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", _client)
+    async_get_rate_limiter(hass).set_rate(1e6)
+    # Run setup and unload through the config entry lifecycle, as the options
+    # flow does, so unload callbacks and entry background tasks are handled
+    mock_integration(
+        hass,
+        MockModule(
+            DOMAIN,
+            async_setup_entry=async_setup_entry,
+            async_unload_entry=async_unload_entry,
+        ),
+    )
+    mock_platform(hass, f"{DOMAIN}.config_flow", config_flow)
+    mock_platform(hass, f"{DOMAIN}.sensor", sensor)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"username": "testuser", "password": "testpass"}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    for _ in range(WARMUP):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    baseline = _resources(hass)
+    for _ in range(RELOADS):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+    after = _resources(hass)
+    # Registry saves and similar may come and go, but nothing accumulates
+    assert all(after[key] <= baseline[key] for key in baseline), (baseline, after)
+
+    # Tracing slows reloads down a lot, so memory is checked over fewer of them
+    tracemalloc.start()
+    try:
+        # The live entry's own state is traced from the first reload on
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+        memory = _package_memory()
+        for _ in range(TRACED_RELOADS):
+            assert await hass.config_entries.async_reload(entry.entry_id)
+            await hass.async_block_till_done()
+        growth = _package_memory() - memory
+    finally:
+        tracemalloc.stop()
+    assert growth < MAX_MEMORY_GROWTH, f"{growth} bytes retained"
+
+    # Unloaded entries leave nothing behind and are unhooked from their clients
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.entry_id not in hass.data.get(DOMAIN, {})
+    assert entry.update_listeners == []
+    assert all(client.auth_error_callback is None for client in clients)
+    assert all(client.stopped for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_not_ready_retries_release_coordinators(
+    hass, monkeypatch, fake_client_class
+):
+    class FailingClient(_client_with_auth_hook(fake_client_class)):
+        async def async_readout_sequence(self):
+            raise RuntimeError("portal down")
+
+    clients = []
+
+    def _client(session=None):
+        clients.append(FailingClient(session))
+        return clients[-1]
+
+    monkeypatch.setattr(flowerhub, "AsyncFlowerhubClient", _client)
+    async_get_rate_limiter(hass).set_rate(1e6)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"username": "testuser", "password": "testpass"}
+    )
+
+    # Setup releases its coordinator itself rather than relying on the entry's
+    # unload callbacks, which only run when the entry lifecycle drives setup
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+    baseline = _resources(hass)
+    for _ in range(RETRIES):
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(hass, entry)
+        await hass.async_block_till_done()
+    after = _resources(hass)
+    assert all(after[key] <= baseline[key] for key in baseline), (baseline, after)
+
+    # Every failed setup shut its coordinator down and unhooked it
+    assert len(clients) == RETRIES + 1
+    assert all(client.auth_error_callback is None for client in clients)
+    assert all(client.stopped for client in clients)
@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
+from flowerhub.const import DOMAIN
 from flowerhub.sensor import (
+    FlowerhubBatteryMaxModulesSensor,
     FlowerhubBatteryNameSensor,
     FlowerhubEnergyCapacitySensor,
     FlowerhubFuseSizeSensor,
@@ -15,7 +17,10 @@ from flowerhub.sensor import (
     FlowerhubPowerCapacitySensor,
     FlowerhubStatusMessageSensor,
     FlowerhubStatusSensor,
+    async_setup_entry,
 )
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
 class FakeCoordinator:
@@ -24,7 +29,7 @@ class FakeCoordinator:
         self.data = {
             "status": "state_1",
             "message": "ok",
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": datetime.now(timezone.utc),
             "inverter_name": "SUN2000 M1",
             "battery_name": "LUNA2000 S0",
             "power_capacity": 10,
@@ -114,3 +119,70 @@ def test_status_message_camelcase_spacing():
     sensor = FlowerhubStatusMessageSensor(coord, entry)
 
     assert sensor.state == "Inverter Dongle Found And Components Are Running"
+
+
+class ListeningCoordinator(FakeCoordinator):
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
+        self.listeners = []
+
+    def async_add_listener(self, update_callback):
+        self.listeners.append(update_callback)
+        return lambda: self.listeners.remove(update_callback)
+
+    def publish(self, data):
+        self.data = data
+        for update_callback in list(self.listeners):
+            update_callback()
+
+
+@pytest.mark.asyncio
+async def test_setup_creates_sensors_with_data_and_adds_others_later(hass):
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="entry")
+    entry.add_to_hass(hass)
+    # A sensor from an earlier setup is kept even without data
+    er.async_get(hass).async_get_or_create(
+        "sensor", DOMAIN, "entry_battery_max_modules", config_entry=entry
+    )
+    data = {"status": "Connected", "message": "ok", "inverter_name": "SUN2000"}
+    coord = ListeningCoordinator(data)
+    hass.data[DOMAIN] = {entry.entry_id: {"coordinator": coord}}
+    added = []
+
+    await async_setup_entry(hass, entry, added.extend)
+
+    created = {type(entity) for entity in added}
+    assert FlowerhubStatusSensor in created
+    assert FlowerhubInverterNameSensor in created
+    assert FlowerhubBatteryMaxModulesSensor in created
+    assert FlowerhubBatteryNameSensor not in created
+    assert FlowerhubMonthlyUptimeSensor not in created
+
+    count = len(added)
+    coord.publish({**data, "uptime": 100.0})
+    assert [type(entity) for entity in added[count:]] == [FlowerhubMonthlyUptimeSensor]
+    # Sensors are added once
+    coord.publish({**data, "uptime": 200.0})
+    assert len(added) == count + 1
+
+
+@pytest.mark.asyncio
+async def test_pending_sensors_keep_their_data_fetched(hass):
+    from flowerhub.demand import DataCategory, DataDemand
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="entry")
+    entry.add_to_hass(hass)
+    coord = ListeningCoordinator({"status": "Connected"})
+    coord.demand = DataDemand()
+    hass.data[DOMAIN] = {entry.entry_id: {"coordinator": coord}}
+    added = []
+
+    await async_setup_entry(hass, entry, added.extend)
+
+    # Uptime sensors do not exist yet, but uptime is still wanted to create them
+    assert coord.demand.tracking
+    assert coord.demand.as_dict()["consumers"]["uptime"] == 4
+    coord.publish({"status": "Connected", "uptime": 1.0, "downtime": 0.0})
+    assert coord.demand.as_dict()["consumers"]["uptime"] == 2
+    assert coord.demand.wants(DataCategory.UPTIME)
@@ -0,0 +1,81 @@
+"""Tests for the immutable coordinator snapshot."""
+
+import dataclasses
+from datetime import datetime, timezone
+
+import pytest
+from flowerhub.snapshot import FlowerhubSnapshot
+
+
+class Status:
+    def __init__(self, status="Connected", message="ok"):
+        self.status = status
+        self.message = message
+        self.updated_at = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+
+
+ASSET_INFO = {
+    "inverter": {"name": "SUN2000 M1", "manufacturerName": "Huawei"},
+    "battery": {"name": "LUNA2000 S0", "energyCapacity": 15},
+    "fuseSize": 16,
+    "isInstalled": True,
+}
+
+
+def test_snapshot_dict_access_and_native_types():
+    snap = FlowerhubSnapshot.from_client(Status(), ASSET_INFO, {"uptime": 10.0})
+
+    assert snap["status"] == "Connected"
+    assert isinstance(snap["last_updated"], datetime)
+    assert snap["inverter_name"] == "SUN2000 M1"
+    assert snap.get("energy_capacity") == 15
+    assert snap.get("power_capacity") is None
+    assert snap["uptime"] == 10.0
+    assert snap["downtime"] is None
+    assert snap["stale"] is False
+    assert snap.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        snap["missing"]
+    assert set(snap) == set(snap.as_dict())
+    assert {**snap}["fuse_size"] == 16
+
+
+def test_snapshot_is_immutable_and_slotted():
+    snap = FlowerhubSnapshot.from_client(Status(), ASSET_INFO, None)
+
+    assert not hasattr(snap, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.status = "other"
+    with pytest.raises(TypeError):
+        snap["inverter"]["name"] = "other"
+
+
+def test_snapshot_shares_unchanged_objects():
+    uptime = {"uptime": 10.0}
+    first = FlowerhubSnapshot.from_client(Status(), ASSET_INFO, uptime)
+    changed = {**ASSET_INFO, "battery": {"name": "LUNA2000 S1"}}
+    second = FlowerhubSnapshot.from_client(Status("Other"), changed, uptime, first)
+
+    assert second.inverter is first.inverter
+    assert second.uptime_data is first.uptime_data
+    assert second.battery is not first.battery
+    assert second["battery_name"] == "LUNA2000 S1"
+
+
+def test_with_stale_keeps_objects():
+    snap = FlowerhubSnapshot.from_client(Status(), ASSET_INFO, None)
+    stale = snap.with_stale()
+
+    assert stale["stale"] is True
+    assert snap["stale"] is False
+    assert stale.inverter is snap.inverter
+
+
+def test_storage_round_trip_is_stale():
+    snap = FlowerhubSnapshot.from_client(Status(), ASSET_INFO, None)
+    restored = FlowerhubSnapshot.from_storage(snap.to_storage(), {"uptime": 10.0})
+
+    assert restored.stale is True
+    assert restored["last_updated"] == snap["last_updated"]
+    assert restored["inverter_name"] == "SUN2000 M1"
+    assert restored["uptime"] == 10.0
@@ -0,0 +1,121 @@
+"""Tests for staged, bounded-concurrency startup."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from flowerhub import async_setup_entry, async_unload_entry
+from flowerhub.const import DOMAIN
+from flowerhub.startup import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    StartupManager,
+    async_get_startup_manager,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+CACHED = {
+    "status": "Connected",
+    "message": "cached",
+    "last_updated": "2026-01-10T00:00:00+00:00",
+    "inverter": {"name": "SUN2000 M1"},
+    "battery": None,
+    "fuse_size": 16,
+    "is_installed": True,
+}
+
+
+def _entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="entry",
+        data={"username": "testuser", "password": "testpass"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_priming_concurrency_is_bounded(hass):
+    manager = StartupManager(hass, concurrency=2)
+    release = asyncio.Event()
+    active = []
+
+    async def prime():
+        async with manager.slot():
+            active.append(manager.as_dict()["priming"])
+            await release.wait()
+
+    tasks = [hass.async_create_task(prime()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert manager.as_dict()["priming"] == 2
+    assert manager.as_dict()["queued"] == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert max(active) == 2
+    assert manager.as_dict()["queued"] == 0
+    assert manager.as_dict()["priming"] == 0
+
+
+@pytest.mark.asyncio
+async def test_staged_setup_registers_cached_state_then_primes(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"entries": {"entry": CACHED}},
+    }
+    hass.set_state(CoreState.starting)
+    entry = _entry()
+
+    assert await async_setup_entry(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    manager = await async_get_startup_manager(hass)
+
+    # Entities have the cached state and the portal has not been contacted
+    assert coordinator.data["status"] == "Connected"
+    assert coordinator.data["inverter_name"] == "SUN2000 M1"
+    assert coordinator.data.stale is True
+    assert client._counter == 0
+    progress = manager.as_dict()
+    assert progress["by_entry"]["entry"]["staged"] is True
+    assert progress["first_state_after"] is not None
+    assert progress["all_fresh_after"] is None
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert coordinator.data["status"] == "state_1"
+    assert coordinator.data.stale is False
+    progress = manager.as_dict()
+    assert progress["fresh"] == 1
+    assert progress["all_fresh_after"] is not None
+
+    assert await async_unload_entry(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_setup_after_start_primes_and_caches_state(hass, hass_storage):
+    entry = _entry()
+
+    assert await async_setup_entry(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    manager = await async_get_startup_manager(hass)
+
+    assert coordinator.data["status"] == "state_1"
+    assert manager.as_dict()["by_entry"]["entry"]["staged"] is False
+    assert manager.as_dict()["fresh"] == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    cached = hass_storage[STORAGE_KEY]["data"]["entries"]["entry"]
+    assert cached["status"] == "state_1"
+    assert cached["inverter"] == {"name": "SUN2000 M1", "powerCapacity": 10}
+
+    assert await async_unload_entry(hass, entry)
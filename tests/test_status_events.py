@@ -0,0 +1,83 @@
+"""Tests for status transition events."""
+
+from datetime import timedelta
+
+import pytest
+from flowerhub.const import EVENT_STATUS_CHANGED, TRANSITION_LOG_SIZE
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.rate_limiter import async_get_rate_limiter
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+
+class Status:
+    def __init__(self, status, message="ok"):
+        self.status = status
+        self.message = message
+        self.updated_at = None
+
+
+class StatusClient:
+    def __init__(self):
+        self.asset_id = 75
+        self.asset_info = {"inverter": {}, "battery": {}}
+        self.flowerhub_status = Status("Connected")
+
+    async def async_fetch_asset(self):
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+
+@pytest.mark.asyncio
+async def test_event_fired_only_on_real_transitions(hass):
+    client = StatusClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60), entry_id="entry"
+    )
+    coord._first_update = False
+    events = async_capture_events(hass, EVENT_STATUS_CHANGED)
+
+    await coord.async_refresh()
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert events == []
+
+    client.flowerhub_status = Status("Connected", "Inverter offline")
+    await coord.async_refresh()
+    client.flowerhub_status = Status("Disconnected", "Inverter offline")
+    await coord.async_refresh()
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [e.data["new_status"] for e in events] == ["Connected", "Disconnected"]
+    assert events[1].data == {
+        "entry_id": "entry",
+        "asset_id": 75,
+        "old_status": "Connected",
+        "new_status": "Disconnected",
+        "old_message": "Inverter offline",
+        "new_message": "Inverter offline",
+    }
+    assert len(coord.transitions) == 2
+    assert coord.transitions[-1]["new_status"] == "Disconnected"
+
+
+@pytest.mark.asyncio
+async def test_transition_log_is_bounded(hass):
+    client = StatusClient()
+    coord = FlowerhubDataUpdateCoordinator(
+        hass, client, update_interval=timedelta(seconds=60)
+    )
+    coord._first_update = False
+    # Keep the shared portal rate limiter out of this many-refresh test
+    async_get_rate_limiter(hass).set_rate(1e6)
+
+    for i in range(TRANSITION_LOG_SIZE + 5):
+        client.flowerhub_status = Status(f"state_{i}")
+        await coord.async_refresh()
+
+    assert len(coord.transitions) == TRANSITION_LOG_SIZE
+    assert coord.transitions[-1]["new_status"] == f"state_{TRANSITION_LOG_SIZE + 4}"
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.uptime import local_day, local_period
 
 
 @pytest.fixture
@@ -118,8 +119,8 @@ async def test_uptime_data_cached_from_initial_readout(hass, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_uptime_data_fetched_on_every_update(hass, mock_client):
-    """Test that uptime data is fetched on every coordinator update."""
+async def test_uptime_pie_not_refetched_before_reconcile(hass, mock_client):
+    """Test that uptime is accounted locally between portal pie fetches."""
     from datetime import timedelta
 
     coordinator = FlowerhubDataUpdateCoordinator(
@@ -130,6 +131,7 @@ async def test_uptime_data_fetched_on_every_update(hass, mock_client):
         username="test_user",
         password="test_pass",
     )
+    mock_client.flowerhub_status.status = "Online"
 
     # Run first update
     await coordinator.async_refresh()
@@ -137,11 +139,15 @@ async def test_uptime_data_fetched_on_every_update(hass, mock_client):
     # Reset mock to track new calls
     mock_client.async_fetch_uptime_pie.reset_mock()
 
-    # Run second update (should fetch uptime again)
+    # Simulate a poll interval passing since the last sample
+    coordinator._uptime._last_time -= 60.0
     await coordinator.async_refresh()
 
-    # async_fetch_uptime_pie should have been called on every update
-    mock_client.async_fetch_uptime_pie.assert_called_once()
+    # No portal fetch; the minute online is accounted locally
+    mock_client.async_fetch_uptime_pie.assert_not_called()
+    assert coordinator.data["uptime"] == 2592000.0 + 60
+    assert coordinator.data["downtime"] == 3600.0
+    assert coordinator.data["uptime_ratio_actual"] > 99.86
 
 
 @pytest.mark.asyncio
@@ -285,7 +291,7 @@ async def test_uptime_fetch_skipped_without_asset_id(hass, mock_client):
 
 @pytest.mark.asyncio
 async def test_uptime_fetch_called_with_correct_parameters(hass, mock_client):
-    """Test that uptime fetch is called with correct parameters on each update."""
+    """Test that uptime fetch is called with correct parameters."""
     from datetime import timedelta
 
     coordinator = FlowerhubDataUpdateCoordinator(
@@ -303,13 +309,153 @@ async def test_uptime_fetch_called_with_correct_parameters(hass, mock_client):
     # Reset mock to track new calls
     mock_client.async_fetch_uptime_pie.reset_mock()
 
-    # Run second update
+    # Run second update once a reconcile is due
+    coordinator._last_uptime_fetch_monotonic = monotonic() - 3601.0
     await coordinator.async_refresh()
 
     # Verify async_fetch_uptime_pie was called with correct parameters
-    # (period is omitted, client library uses local datetime.now() by default)
+    # (the month in Home Assistant's time zone, not the client's host default)
     mock_client.async_fetch_uptime_pie.assert_called_once_with(
         75,  # asset_id
+        period=local_period(),
         raise_on_error=False,
         timeout_total=30.0,
     )
+
+
+@pytest.mark.asyncio
+async def test_uptime_fetch_follows_enabled_uptime_entities(hass, mock_client):
+    """Test that the portal pie is only fetched while uptime entities are enabled."""
+    from datetime import timedelta
+
+    from flowerhub.demand import DataCategory
+
+    coordinator = FlowerhubDataUpdateCoordinator(
+        hass,
+        mock_client,
+        update_interval=timedelta(seconds=60),
+        entry_id="test_entry",
+        username="test_user",
+        password="test_pass",
+    )
+    await coordinator.async_refresh()
+    coordinator.demand.start_tracking()
+    remove_status = coordinator.demand.add(DataCategory.STATUS)
+
+    # Reconcile due, but only status entities are enabled
+    coordinator._last_uptime_fetch_monotonic = None
+    await coordinator.async_refresh()
+    mock_client.async_fetch_uptime_pie.assert_not_called()
+    assert coordinator.demand.as_dict()["consumers"] == {
+        "status": 1,
+        "hardware": 0,
+        "uptime": 0,
+    }
+
+    # Enabling an uptime entity resumes the fetch that stayed due
+    remove_uptime = coordinator.demand.add(DataCategory.UPTIME)
+    await coordinator.async_refresh()
+    mock_client.async_fetch_uptime_pie.assert_called_once()
+
+    remove_uptime()
+    remove_uptime()
+    remove_status()
+    assert not coordinator.demand.wants(DataCategory.UPTIME)
+    assert coordinator.demand.as_dict()["consumers"]["status"] == 0
+
+
+@pytest.mark.asyncio
+async def test_daily_uptime_series_published_when_enabled(hass, mock_client):
+    """Test that the optional daily series is part of the uptime data."""
+    from datetime import timedelta
+
+    coordinator = FlowerhubDataUpdateCoordinator(
+        hass,
+        mock_client,
+        update_interval=timedelta(seconds=60),
+        entry_id="test_entry",
+        username="test_user",
+        password="test_pass",
+        daily_uptime=True,
+    )
+    await coordinator.async_refresh()
+
+    daily = coordinator.data["uptime_daily_ratio"]
+    assert len(daily) == local_day()
+    assert coordinator._uptime_data["daily_uptime_ratio"] is daily
+
+
+@pytest.mark.asyncio
+async def test_month_rollover_closes_month_with_final_portal_values(
+    hass, mock_client, monkeypatch
+):
+    """Test that the rollover timer captures the ended month and starts anew."""
+    from datetime import timedelta
+
+    import flowerhub.coordinator as coordinator_mod
+
+    coordinator = FlowerhubDataUpdateCoordinator(
+        hass,
+        mock_client,
+        update_interval=timedelta(seconds=60),
+        entry_id="test_entry",
+        username="test_user",
+        password="test_pass",
+    )
+    monkeypatch.setattr(coordinator_mod, "local_period", lambda: "2026-03")
+    await coordinator.async_refresh()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    monkeypatch.setattr(coordinator_mod, "local_period", lambda: "2026-04")
+    await coordinator._async_month_rollover(None)
+
+    kwargs = mock_client.async_fetch_uptime_pie.call_args.kwargs
+    assert kwargs["period"] == "2026-03"
+    previous = coordinator.data["uptime_previous_month"]
+    assert previous["period"] == "2026-03"
+    assert previous["uptime"] == 2595600.0
+    # The new month is published right away, starting from zero
+    assert coordinator.data["uptime_period"] == "2026-04"
+    assert coordinator.data["uptime"] == 0
+    listener.assert_called()
+    assert coordinator._unsub_rollover is not None
+    await coordinator.async_shutdown()
+    assert coordinator._unsub_rollover is None
+
+
+@pytest.mark.asyncio
+async def test_month_rollover_stops_when_unloaded_during_close(
+    hass, mock_client, monkeypatch
+):
+    """Test that an unload during the final pie fetch ends the rollover."""
+    from datetime import timedelta
+
+    import flowerhub.coordinator as coordinator_mod
+
+    coordinator = FlowerhubDataUpdateCoordinator(
+        hass,
+        mock_client,
+        update_interval=timedelta(seconds=60),
+        entry_id="test_entry",
+        username="test_user",
+        password="test_pass",
+    )
+    monkeypatch.setattr(coordinator_mod, "local_period", lambda: "2026-03")
+    await coordinator.async_refresh()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+    pie = mock_client.async_fetch_uptime_pie.return_value
+
+    async def fetch_during_unload(*args, **kwargs):
+        await coordinator.async_shutdown()
+        return pie
+
+    mock_client.async_fetch_uptime_pie.side_effect = fetch_during_unload
+    monkeypatch.setattr(coordinator_mod, "local_period", lambda: "2026-04")
+    await coordinator._async_month_rollover(None)
+
+    # Nothing is published and no timer is left behind
+    listener.assert_not_called()
+    assert coordinator._unsub_rollover is None
+    assert coordinator.data["uptime_period"] == "2026-03"
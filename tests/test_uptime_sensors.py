@@ -97,15 +97,15 @@ def test_uptime_ratio_availability_by_staleness():
     entry = FakeEntry()
     sensor = FlowerhubMonthlyUptimeRatioSensor(coord, entry)
 
-    # Before any uptime fetch timestamp is set, fall back to coordinator success
+    # Before any uptime update timestamp is set, fall back to coordinator success
     assert sensor.available is True
 
-    # Simulate recent uptime fetch (< 3 * 60 seconds = 3 minutes)
-    setattr(coord, "_last_uptime_fetch_monotonic", monotonic() - 120)
+    # Simulate recent uptime update (< 3 * 60 seconds = 3 minutes)
+    setattr(coord, "_last_uptime_update_monotonic", monotonic() - 120)
     assert sensor.available is True
 
-    # Simulate stale uptime fetch (> 3 * 60 seconds = 3 minutes)
-    setattr(coord, "_last_uptime_fetch_monotonic", monotonic() - (3 * 60 + 10))
+    # Simulate stale uptime update (> 3 * 60 seconds = 3 minutes)
+    setattr(coord, "_last_uptime_update_monotonic", monotonic() - (3 * 60 + 10))
     assert sensor.available is False
 
 
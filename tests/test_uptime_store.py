@@ -0,0 +1,132 @@
+"""Tests for persisted month-to-date uptime counters."""
+
+from datetime import timedelta
+
+import pytest
+from flowerhub import async_remove_entry
+from flowerhub.const import DOMAIN
+from flowerhub.coordinator import FlowerhubDataUpdateCoordinator
+from flowerhub.uptime import local_period
+from flowerhub.uptime_store import SAVE_DELAY, STORAGE_KEY, async_get_uptime_store
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+
+class Status:
+    status = "Connected"
+    message = "ok"
+    updated_at = None
+
+
+class UptimeClient:
+    def __init__(self):
+        self.asset_id = 75
+        self.asset_info = {"inverter": {}, "battery": {}}
+        self.flowerhub_status = Status()
+
+    async def async_fetch_asset(self):
+        return {
+            "status_code": 200,
+            "asset_info": self.asset_info,
+            "flowerhub_status": self.flowerhub_status,
+            "error": None,
+        }
+
+    async def async_fetch_uptime_pie(self, asset_id, **kwargs):
+        raise RuntimeError("portal unavailable")
+
+
+def _stored(period):
+    return {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "entries": {"entry": "75"},
+            "assets": {
+                "75": {
+                    "fetched_at": "2026-01-10T00:00:00+00:00",
+                    "tracker": {
+                        "period": period,
+                        "portal": {
+                            "uptime": 1000.0,
+                            "downtime": 0.0,
+                            "no_data": 0.0,
+                            "uptime_ratio_actual": 100.0,
+                            "uptime_ratio_total": 100.0,
+                        },
+                        "local": {"uptime": 60.0, "downtime": 0.0, "no_data": 0.0},
+                    },
+                }
+            },
+        },
+    }
+
+
+def _coordinator(hass, store):
+    coord = FlowerhubDataUpdateCoordinator(
+        hass,
+        UptimeClient(),
+        update_interval=timedelta(seconds=60),
+        entry_id="entry",
+        uptime_store=store,
+    )
+    coord._first_update = False
+    return coord
+
+
+@pytest.mark.asyncio
+async def test_counters_restored_at_setup_without_portal(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = _stored(local_period())
+    store = await async_get_uptime_store(hass)
+    coord = _coordinator(hass, store)
+
+    # Values are available before the first update, and survive a failed fetch
+    assert coord.uptime_data["uptime"] == 1060.0
+    await coord.async_refresh()
+    assert coord.data["uptime"] == 1060.0
+
+
+@pytest.mark.asyncio
+async def test_previous_month_counters_are_not_restored(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = _stored("2000-01")
+    store = await async_get_uptime_store(hass)
+    coord = _coordinator(hass, store)
+
+    assert coord.uptime_data is None
+
+
+@pytest.mark.asyncio
+async def test_counters_roll_over_and_are_saved(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = _stored(local_period())
+    store = await async_get_uptime_store(hass)
+    coord = _coordinator(hass, store)
+    # Pretend the restored counters belong to last month
+    coord._uptime.period = "2000-01"
+
+    await coord.async_refresh()
+    assert coord._uptime.period == local_period()
+    assert coord.data["uptime"] == 0.0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    saved = hass_storage[STORAGE_KEY]["data"]["assets"]["75"]["tracker"]
+    assert saved["period"] == local_period()
+    assert saved["portal"]["uptime"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_removed_entry_counters_are_dropped(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = _stored(local_period())
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="entry")
+    store = await async_get_uptime_store(hass)
+    assert store.get("entry") is not None
+
+    await async_remove_entry(hass, entry)
+    assert store.get("entry") is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"] == {"entries": {}, "assets": {}}
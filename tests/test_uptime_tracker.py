@@ -0,0 +1,131 @@
+"""Tests for local uptime accounting."""
+
+from datetime import datetime
+
+import pytest
+from flowerhub.uptime import (
+    DailyUptime,
+    UptimeCategory,
+    UptimeTracker,
+    classify_status,
+    local_day,
+    local_period,
+    next_month_start,
+)
+from homeassistant.util import dt as dt_util
+
+PIE = {
+    "uptime": 1000.0,
+    "downtime": 100.0,
+    "noData": 0.0,
+    "uptime_ratio_actual": 90.9,
+    "uptime_ratio_total": 90.9,
+}
+
+
+def test_classify_status():
+    assert classify_status("Connected") is UptimeCategory.UPTIME
+    assert classify_status("offline") is UptimeCategory.DOWNTIME
+    assert classify_status("Something new") is UptimeCategory.NO_DATA
+    assert classify_status(None) is UptimeCategory.NO_DATA
+
+
+def test_no_values_before_portal_baseline():
+    tracker = UptimeTracker(max_gap=180)
+    tracker.record(0.0, "Connected")
+    tracker.record(60.0, "Connected")
+    assert tracker.values() is None
+
+
+def test_samples_accrue_on_top_of_portal_values():
+    tracker = UptimeTracker(max_gap=180)
+    tracker.reconcile(0.0, PIE, "2026-01")
+    tracker.record(0.0, "Connected")
+    assert tracker.values()["uptime_ratio_actual"] == 90.9  # verbatim
+
+    tracker.record(60.0, "Disconnected")
+    tracker.record(100.0, "Connected")
+    values = tracker.values()
+    assert values["uptime"] == 1060.0
+    assert values["downtime"] == 140.0
+    assert values["no_data"] == 0.0
+    assert values["uptime_ratio_actual"] == pytest.approx(1060 / 1200 * 100)
+
+
+def test_long_gap_counts_as_no_data_and_reconcile_resets():
+    tracker = UptimeTracker(max_gap=180)
+    tracker.reconcile(0.0, PIE, "2026-01")
+    tracker.record(0.0, "Connected")
+    # A 10 minute gap without samples (failed polls)
+    tracker.record(600.0, "Connected")
+    values = tracker.values()
+    assert values["uptime"] == 1180.0
+    assert values["no_data"] == 420.0
+
+    tracker.reconcile(600.0, {**PIE, "uptime": 1500.0}, "2026-01")
+    assert tracker.values()["uptime"] == 1500.0
+
+
+def _totals(uptime, downtime=0.0, no_data=0.0):
+    return {"uptime": uptime, "downtime": downtime, "no_data": no_data}
+
+
+def test_daily_uptime_finalizes_days_from_month_to_date_totals():
+    daily = DailyUptime()
+    daily.update("2026-03", 1, _totals(3600.0))
+    daily.update("2026-03", 1, _totals(7200.0, 800.0))
+    # Day 1 closes at the last totals seen before midnight
+    daily.update("2026-03", 2, _totals(7300.0, 800.0))
+    assert daily.ratios() == [90.0, 100.0]
+
+    # A portal reconcile lowering the totals does not make today negative
+    daily.update("2026-03", 2, _totals(7000.0, 900.0))
+    assert daily.ratios() == [90.0, 0.0]
+
+    # Days missed while not running are unknown, and today starts from now
+    daily.update("2026-03", 5, _totals(9000.0, 900.0))
+    daily.update("2026-03", 5, _totals(9500.0, 900.0))
+    assert daily.ratios() == [90.0, 0.0, None, None, 100.0]
+
+    # Finalized days survive a restart; a new month starts over
+    restored = DailyUptime()
+    restored.restore(daily.to_storage())
+    assert restored.ratios() == daily.ratios()
+    restored.update("2026-04", 1, _totals(60.0))
+    assert restored.ratios() == [100.0]
+
+
+def test_daily_uptime_started_mid_month_knows_only_today():
+    daily = DailyUptime()
+    daily.update("2026-03", 10, _totals(86400.0 * 9))
+    daily.update("2026-03", 10, _totals(86400.0 * 9 + 600, 600.0))
+    assert daily.ratios() == [None] * 9 + [50.0]
+
+
+@pytest.mark.parametrize(
+    ("now", "expected"),
+    [
+        (datetime(2026, 3, 31, 23, 59, 59), datetime(2026, 4, 1)),
+        (datetime(2026, 12, 15, 12, 0), datetime(2027, 1, 1)),
+        (datetime(2026, 2, 1, 0, 0), datetime(2026, 3, 1)),
+    ],
+)
+def test_next_month_start_is_local_midnight_on_the_first(now, expected):
+    start = next_month_start(now)
+    assert start.tzinfo is not None
+    assert start.replace(tzinfo=None) == expected
+
+
+@pytest.mark.asyncio
+async def test_month_boundary_follows_home_assistant_time_zone(hass, freezer):
+    # Already April in Auckland while it is still March in UTC and on the host
+    hass.config.set_time_zone("Pacific/Auckland")
+    freezer.move_to("2026-03-31 12:00:00+00:00")
+
+    assert local_period() == "2026-04"
+    assert local_day() == 1
+    start = next_month_start()
+    assert start == datetime(
+        2026, 5, 1, tzinfo=dt_util.get_time_zone("Pacific/Auckland")
+    )
+    assert start.utcoffset().total_seconds() == 12 * 3600